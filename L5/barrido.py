@@ -0,0 +1,334 @@
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from simulador import Simulador
+from cache_resultados import CacheResultados
+
+# Parámetros que se pueden barrer y su tipo
+PARAMETROS = {
+    'quantum': int,
+    'ciclos': int,
+    'cantidad_procesos': int,
+    'probabilidad_admision': float,
+    'probabilidad_suspension': float,
+}
+
+METRICAS = [
+    'tiempo_espera_promedio',
+    'tiempo_respuesta_promedio',
+    'throughput',
+    'procesos_terminados',
+    'procesos_pendientes',
+]
+
+COLUMNAS = ['corrida', 'replica', 'semilla', 'motor'] + list(PARAMETROS) + METRICAS
+
+# Valores por defecto de los parámetros que no se barren (los de main.py)
+VALORES_POR_DEFECTO = {
+    'quantum': 2,
+    'ciclos': 100,
+    'cantidad_procesos': 15,
+    'probabilidad_admision': 0.3,
+    'probabilidad_suspension': 0.4,
+}
+
+def expandir_rejilla(valores: Dict[str, Sequence]) -> List[Dict]:
+    """
+    Genera todas las combinaciones de una rejilla de parámetros.
+
+    Args:
+        valores (Dict[str, Sequence]): Valores a probar para cada parámetro
+
+    Returns:
+        List[Dict]: Una configuración completa por combinación, en orden determinista
+    """
+    nombres = list(valores)
+    return [
+        {**VALORES_POR_DEFECTO, **dict(zip(nombres, combinacion))}
+        for combinacion in itertools.product(*(valores[nombre] for nombre in nombres))
+    ]
+
+def muestrear_aleatorio(rangos: Dict[str, Sequence], cantidad: int, semilla: int = 0) -> List[Dict]:
+    """
+    Genera configuraciones al azar para una búsqueda aleatoria.
+
+    Un parámetro con dos valores se interpreta como rango [mínimo, máximo] (entero o
+    continuo según su tipo); con un solo valor queda fijo.
+
+    Args:
+        rangos (Dict[str, Sequence]): Rango o valor fijo de cada parámetro
+        cantidad (int): Número de configuraciones a generar
+        semilla (int): Semilla del muestreo (la misma semilla da las mismas configuraciones)
+
+    Returns:
+        List[Dict]: Configuraciones completas
+    """
+    rng = random.Random(semilla)
+    configuraciones = []
+    for _ in range(cantidad):
+        configuracion = dict(VALORES_POR_DEFECTO)
+        for nombre, valores in rangos.items():
+            if len(valores) == 1:
+                configuracion[nombre] = valores[0]
+            elif len(valores) == 2:
+                minimo, maximo = valores
+                if PARAMETROS[nombre] is int:
+                    configuracion[nombre] = rng.randint(minimo, maximo)
+                else:
+                    configuracion[nombre] = rng.uniform(minimo, maximo)
+            else:
+                raise ValueError(f"{nombre}: la búsqueda aleatoria espera un valor o un rango [mínimo, máximo]")
+        configuraciones.append(configuracion)
+    return configuraciones
+
+def semilla_corrida(configuracion: Dict, replica: int, semilla_base: int) -> int:
+    """Deriva una semilla determinista de la configuración, la réplica y la semilla base"""
+    clave = json.dumps([configuracion, replica, semilla_base], sort_keys=True)
+    return int.from_bytes(hashlib.sha256(clave.encode()).digest()[:8], "big")
+
+def _clave_corrida(corrida: Dict) -> Tuple:
+    """Identifica una corrida (o una fila de resultados) por todo lo que determina sus métricas"""
+    return (corrida['replica'], corrida['semilla'], corrida['motor'],
+            *(corrida[nombre] for nombre in PARAMETROS))
+
+def _simular_corrida(corrida: Dict) -> Dict:
+    """Ejecuta la simulación de una corrida y retorna sus métricas"""
+    simulador = Simulador(quantum=corrida['quantum'], ciclos=corrida['ciclos'],
+                          semilla=corrida['semilla'], motor=corrida['motor'], mostrar_swapping=False,
+                          conservar_terminados=False, historial=False)
+    simulador.probabilidad_admision = corrida['probabilidad_admision']
+    simulador.probabilidad_suspension = corrida['probabilidad_suspension']
+    try:
+        resultados = simulador.simular(corrida['cantidad_procesos'])
+    finally:
+        simulador.cerrar()
+
+    metricas = {metrica: 0 for metrica in METRICAS}
+    metricas.update(resultados.get('estadisticas_finales', {}))
+    metricas['procesos_terminados'] = resultados.get('procesos_terminados', 0)
+    metricas['procesos_pendientes'] = resultados.get('procesos_pendientes', 0)
+    return metricas
+
+def ejecutar_corrida(corrida: Dict, cache: Optional[CacheResultados] = None) -> Dict:
+    """
+    Ejecuta una simulación y retorna su fila de resultados.
+
+    Con `cache` una corrida con la misma configuración y semilla (sin importar su número ni
+    su réplica) se lee del disco en lugar de simularse de nuevo.
+    """
+    if cache is None:
+        return dict(corrida, **_simular_corrida(corrida))
+    configuracion = {nombre: valor for nombre, valor in corrida.items() if nombre not in ('corrida', 'replica')}
+    return dict(corrida, **cache.obtener_o_calcular(configuracion, lambda: _simular_corrida(corrida)))
+
+def _ejecutar_lote(corridas: List[Dict], opciones_cache: Optional[Dict] = None) -> Tuple[List[Dict], Dict]:
+    """Ejecuta un lote de corridas en un proceso trabajador; retorna sus filas y los contadores de la caché"""
+    cache = CacheResultados(**opciones_cache) if opciones_cache is not None else None
+    filas = [ejecutar_corrida(corrida, cache) for corrida in corridas]
+    return filas, cache.contadores() if cache is not None else {}
+
+class BarridoParametros:
+    """
+    Ejecuta un barrido de parámetros de Simulador repartido entre varios procesos.
+
+    Cada configuración se ejecuta `replicas` veces con semillas deterministas, así que el
+    mismo barrido da siempre los mismos resultados sin importar el número de trabajadores
+    ni el orden en que terminan. Las corridas se agrupan en lotes para que las
+    simulaciones cortas no queden dominadas por la comunicación entre procesos.
+
+    Atributos:
+        configuraciones (List[Dict]): Configuraciones a evaluar
+        replicas (int): Corridas por configuración
+        semilla (int): Semilla base de la que se derivan las semillas de cada corrida
+        motor (str): Motor de simulación ("ticks" o "eventos")
+        trabajadores (int): Número de procesos trabajadores
+        tamano_lote (Optional[int]): Corridas por lote (automático si es None)
+        opciones_cache (Optional[Dict]): Argumentos de CacheResultados en cada trabajador
+            (sin caché si es None)
+        contadores_cache (Dict[str, int]): Aciertos, fallos, etc. de la caché sumados entre
+            todos los trabajadores
+    """
+
+    def __init__(self, configuraciones: List[Dict], replicas: int = 1, semilla: int = 0,
+                 motor: str = "eventos", trabajadores: Optional[int] = None,
+                 tamano_lote: Optional[int] = None, cache: Optional[str] = None,
+                 tamano_cache: int = 256 * 2**20, omitir_cache: bool = False):
+        """
+        Inicializa el barrido.
+
+        Args:
+            configuraciones (List[Dict]): Configuraciones a evaluar
+            replicas (int): Corridas por configuración
+            semilla (int): Semilla base
+            motor (str): Motor de simulación ("ticks" o "eventos")
+            trabajadores (Optional[int]): Procesos trabajadores (todos los núcleos si es None)
+            tamano_lote (Optional[int]): Corridas por lote (automático si es None)
+            cache (Optional[str]): Directorio de la caché de resultados (sin caché si es None)
+            tamano_cache (int): Bytes máximos de la caché
+            omitir_cache (bool): Simular todas las corridas sin leer ni escribir la caché
+        """
+        if motor not in Simulador.MOTORES:
+            raise ValueError(f"Motor desconocido: {motor}. Opciones: {', '.join(Simulador.MOTORES)}")
+        self.configuraciones = configuraciones
+        self.replicas = replicas
+        self.semilla = semilla
+        self.motor = motor
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.tamano_lote = tamano_lote
+        self.opciones_cache = None
+        if cache is not None:
+            CacheResultados(cache, tamano_cache, omitir_cache)  # Valida y crea el directorio
+            self.opciones_cache = {'directorio': cache, 'tamano_maximo': tamano_cache, 'omitir': omitir_cache}
+        self.contadores_cache: Dict[str, int] = {}
+
+    def corridas(self) -> List[Dict]:
+        """Retorna todas las corridas del barrido, numeradas en orden determinista"""
+        corridas = []
+        for configuracion in self.configuraciones:
+            for replica in range(self.replicas):
+                corridas.append({
+                    'corrida': len(corridas),
+                    'replica': replica,
+                    'semilla': semilla_corrida(configuracion, replica, self.semilla),
+                    'motor': self.motor,
+                    **configuracion,
+                })
+        return corridas
+
+    def _lotes(self, corridas: List[Dict]) -> List[List[Dict]]:
+        """Agrupa las corridas en lotes (unos cuatro lotes por trabajador si no se indica tamaño)"""
+        tamano = self.tamano_lote or max(1, math.ceil(len(corridas) / (self.trabajadores * 4)))
+        return [corridas[i:i + tamano] for i in range(0, len(corridas), tamano)]
+
+    def ejecutar(self, salida: Optional[str] = None, reanudar: bool = False) -> Iterator[Dict]:
+        """
+        Ejecuta el barrido y entrega cada fila a medida que termina.
+
+        Args:
+            salida (Optional[str]): Archivo CSV donde se agrega cada fila al terminar
+            reanudar (bool): Si es True se omiten las corridas que ya están en `salida`
+
+        Yields:
+            Dict: Fila de resultados de cada corrida, en orden de finalización
+        """
+        corridas = self.corridas()
+        archivo = escritor = None
+        if salida is not None:
+            completadas = leer_resultados(salida) if reanudar and os.path.exists(salida) else []
+            # Una fila vale si coincide en parámetros, réplica, semilla y motor con una corrida
+            # de este barrido (el índice solo no basta si la rejilla cambió): las demás se descartan
+            por_clave: Dict[Tuple, List[Dict]] = {}
+            for corrida in corridas:
+                por_clave.setdefault(_clave_corrida(corrida), []).append(corrida)
+            vigentes, hechas = [], set()
+            for fila in completadas:
+                iguales = por_clave.get(_clave_corrida(fila))
+                if iguales:
+                    corrida = iguales.pop(0)
+                    hechas.add(corrida['corrida'])
+                    vigentes.append({**fila, 'corrida': corrida['corrida']})
+            completadas = vigentes
+            corridas = [corrida for corrida in corridas if corrida['corrida'] not in hechas]
+
+            # Se reescriben sólo las filas completas: una interrupción puede dejar una línea a medias
+            archivo = open(salida, "w", newline="", encoding="utf-8")
+            escritor = csv.DictWriter(archivo, fieldnames=COLUMNAS, extrasaction="ignore")
+            escritor.writeheader()
+            escritor.writerows(completadas)
+            archivo.flush()
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.trabajadores) as ejecutor:
+                futuros = [ejecutor.submit(_ejecutar_lote, lote, self.opciones_cache)
+                           for lote in self._lotes(corridas)]
+                for futuro in as_completed(futuros):
+                    filas, contadores = futuro.result()
+                    for nombre, valor in contadores.items():
+                        self.contadores_cache[nombre] = self.contadores_cache.get(nombre, 0) + valor
+                    for fila in filas:
+                        if escritor is not None:
+                            escritor.writerow(fila)
+                        yield fila
+                    if archivo is not None:
+                        archivo.flush()
+        finally:
+            if archivo is not None:
+                archivo.close()
+
+def leer_resultados(ruta: str) -> List[Dict]:
+    """Lee las filas completas de un CSV de resultados de barrido"""
+    tipos = {'corrida': int, 'replica': int, 'semilla': int, 'motor': str,
+             'procesos_terminados': int, 'procesos_pendientes': int, **PARAMETROS}
+    filas = []
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        for fila in csv.DictReader(archivo):
+            try:
+                filas.append({columna: tipos.get(columna, float)(fila[columna]) for columna in COLUMNAS})
+            except (KeyError, TypeError, ValueError):
+                continue  # Fila incompleta
+    return filas
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Crea el parser de argumentos de la línea de comandos del barrido"""
+    parser = argparse.ArgumentParser(
+        description="Barrido de parámetros del simulador de procesos en varios núcleos",
+    )
+    for nombre, tipo in PARAMETROS.items():
+        parser.add_argument(f"--{nombre.replace('_', '-')}", type=tipo, nargs="+", metavar="VALOR",
+                            help=f"Valores de {nombre} (rango [mínimo, máximo] con --aleatorio)")
+    parser.add_argument("--aleatorio", type=int, metavar="N",
+                        help="Búsqueda aleatoria de N configuraciones en lugar de rejilla")
+    parser.add_argument("--replicas", type=int, default=1, help="Corridas por configuración")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla base del barrido")
+    parser.add_argument("--motor", choices=Simulador.MOTORES, default="eventos")
+    parser.add_argument("--trabajadores", type=int, help="Procesos trabajadores (por defecto, todos los núcleos)")
+    parser.add_argument("--tamano-lote", type=int, help="Corridas por lote enviado a cada trabajador")
+    parser.add_argument("--salida", default="barrido.csv", help="Archivo CSV de resultados")
+    parser.add_argument("--reanudar", action="store_true", help="Omitir las corridas que ya están en --salida")
+    parser.add_argument("--cache", metavar="DIRECTORIO", help="Caché de resultados en disco (ver cache_resultados.py)")
+    parser.add_argument("--tamano-cache", type=int, default=256, metavar="MB", help="Tamaño máximo de la caché")
+    parser.add_argument("--sin-cache", action="store_true", help="Simular todo sin usar la caché (para medir tiempos)")
+    return parser
+
+def configuraciones_desde_argumentos(argumentos: argparse.Namespace) -> List[Dict]:
+    """Construye las configuraciones del barrido a partir de los argumentos"""
+    valores = {nombre: getattr(argumentos, nombre) for nombre in PARAMETROS
+               if getattr(argumentos, nombre) is not None}
+    if argumentos.aleatorio:
+        return muestrear_aleatorio(valores, argumentos.aleatorio, argumentos.semilla)
+    return expandir_rejilla(valores)
+
+def main(argv: Optional[Sequence[str]] = None):
+    argumentos = crear_parser().parse_args(argv)
+    barrido = BarridoParametros(
+        configuraciones_desde_argumentos(argumentos),
+        replicas=argumentos.replicas,
+        semilla=argumentos.semilla,
+        motor=argumentos.motor,
+        trabajadores=argumentos.trabajadores,
+        tamano_lote=argumentos.tamano_lote,
+        cache=argumentos.cache,
+        tamano_cache=argumentos.tamano_cache * 2**20,
+        omitir_cache=argumentos.sin_cache,
+    )
+    total = len(barrido.configuraciones) * barrido.replicas
+    for completadas, fila in enumerate(barrido.ejecutar(argumentos.salida, argumentos.reanudar), start=1):
+        print(f"[{completadas}] corrida {fila['corrida']}/{total}: "
+              f"espera={fila['tiempo_espera_promedio']:.2f} "
+              f"respuesta={fila['tiempo_respuesta_promedio']:.2f} "
+              f"throughput={fila['throughput']:.4f}")
+    if barrido.contadores_cache:
+        contadores = barrido.contadores_cache
+        print(f"Caché: {contadores['aciertos']} aciertos, {contadores['fallos']} fallos, "
+              f"{contadores['omitidas']} omitidas")
+    print(f"Resultados en {argumentos.salida}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Benchmarks del simulador. Se ejecutan desde L5 con ``python -m benchmarks.<modulo>``."""
@@ -0,0 +1,114 @@
+"""
+Casos de la suite de rendimiento.
+
+Cada caso recibe el tamaño (procesos, ciclos, motor), prepara todo lo necesario fuera de
+la medición y retorna una función sin argumentos que ejecuta el trabajo medido y retorna
+cuántas operaciones hizo (para reportar el tiempo por operación).
+"""
+import io
+from typing import Callable, Dict
+from distribuciones import FuenteAleatoria
+from planificador import PlanificadorProcesos
+from planificador_eventos import PlanificadorEventos
+from proceso import Proceso
+from simulador import Simulador
+
+SEMILLA = 12345
+
+# Operaciones que se miden en los casos de consulta (obtener_estado_actual, crear_tabla_estado)
+CONSULTAS = 100
+
+def _planificador_cargado(procesos: int, motor: str) -> PlanificadorProcesos:
+    """Crea un planificador con `procesos` procesos admitidos y ya en LISTO"""
+    aleatorio = FuenteAleatoria(SEMILLA)
+    clase = PlanificadorEventos if motor == "eventos" else PlanificadorProcesos
+    planificador = clase(aleatorio=aleatorio)
+    for i in range(procesos):
+        planificador.admitir_proceso(Proceso(
+            id=i + 1,
+            nombre=f"Proceso_{i + 1}",
+            tiempo_ejecucion=aleatorio.tiempo_ejecucion(),
+            prioridad=aleatorio.prioridad(),
+            tiempo_restante=0
+        ))
+    # Pasado el retardo de admisión todos los procesos quedan en LISTO
+    for _ in range(planificador.retardo_admision):
+        planificador.ejecutar_ciclo()
+    return planificador
+
+def _simulador_terminado(procesos: int, ciclos: int, motor: str) -> Simulador:
+    """Ejecuta una simulación completa para medir consultas sobre su estado final"""
+    simulador = Simulador(ciclos=ciclos, semilla=SEMILLA, motor=motor, mostrar_swapping=False)
+    simulador.probabilidad_admision = 1.0
+    simulador.simular(procesos)
+    return simulador
+
+def ejecutar_ciclo(procesos: int, ciclos: int, motor: str) -> Callable[[], int]:
+    """PlanificadorProcesos.ejecutar_ciclo con la cola de listos llena"""
+    planificador = _planificador_cargado(procesos, motor)
+
+    def medir() -> int:
+        for _ in range(ciclos):
+            planificador.ejecutar_ciclo()
+        return ciclos
+
+    return medir
+
+def simular(procesos: int, ciclos: int, motor: str) -> Callable[[], int]:
+    """Simulador.simular completo, incluida la generación de procesos"""
+    simulador = Simulador(ciclos=ciclos, semilla=SEMILLA, motor=motor, mostrar_swapping=False)
+    simulador.probabilidad_admision = 1.0
+
+    def medir() -> int:
+        simulador.simular(procesos)
+        return ciclos
+
+    return medir
+
+def obtener_estado_actual(procesos: int, ciclos: int, motor: str) -> Callable[[], int]:
+    """Simulador.obtener_estado_actual (vistas, sin copiar) más `len()` de cada cola"""
+    simulador = _simulador_terminado(procesos, ciclos, motor)
+
+    def medir() -> int:
+        for _ in range(CONSULTAS):
+            for cola in simulador.obtener_estado_actual()['estado_sistema'].values():
+                len(cola)
+        return CONSULTAS
+
+    return medir
+
+def obtener_instantanea(procesos: int, ciclos: int, motor: str) -> Callable[[], int]:
+    """Simulador.obtener_estado_actual(instantanea=True), que copia las colas"""
+    simulador = _simulador_terminado(procesos, ciclos, motor)
+
+    def medir() -> int:
+        for _ in range(CONSULTAS):
+            simulador.obtener_estado_actual(instantanea=True)
+        return CONSULTAS
+
+    return medir
+
+def crear_tabla_estado(procesos: int, ciclos: int, motor: str) -> Callable[[], int]:
+    """Interfaz.crear_tabla_estado y su dibujado en una consola en memoria"""
+    from rich.console import Console
+    from interfaz import Interfaz
+
+    simulador = _simulador_terminado(procesos, ciclos, motor)
+    interfaz = Interfaz()
+    interfaz.console = Console(file=io.StringIO(), width=120)
+
+    def medir() -> int:
+        for _ in range(CONSULTAS):
+            interfaz.console.print(interfaz.crear_tabla_estado(simulador.obtener_estado_actual()))
+        interfaz.console.file = io.StringIO()
+        return CONSULTAS
+
+    return medir
+
+CASOS: Dict[str, Callable[[int, int, str], Callable[[], int]]] = {
+    'ejecutar_ciclo': ejecutar_ciclo,
+    'simular': simular,
+    'obtener_estado_actual': obtener_estado_actual,
+    'obtener_instantanea': obtener_instantanea,
+    'crear_tabla_estado': crear_tabla_estado,
+}
@@ -0,0 +1,65 @@
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from typing import Dict
+from proceso import Proceso
+from tabla_procesos import TablaProcesos
+from simulador import Simulador
+
+def medir_memoria(representacion: str, cantidad: int, con_vistas: bool = True) -> Dict:
+    """
+    Mide la memoria que ocupan `cantidad` procesos en una representación.
+
+    Args:
+        representacion (str): "objetos" o "tabla"
+        cantidad (int): Número de procesos
+        con_vistas (bool): En la tabla, si se crea también una vista ProcesoTabla por fila
+
+    Returns:
+        Dict: Bytes totales y bytes por proceso
+    """
+    random.seed(0)
+    gc.collect()
+    tracemalloc.start()
+    if representacion == "tabla":
+        tabla = TablaProcesos()
+        procesos = [tabla.agregar(i + 1, f"Proceso_{i + 1}", random.randint(5, 20), random.randint(1, 5))
+                    for i in range(cantidad)]
+        if not con_vistas:
+            procesos = None
+    else:
+        procesos = [Proceso(id=i + 1, nombre=f"Proceso_{i + 1}", tiempo_ejecucion=random.randint(5, 20),
+                            prioridad=random.randint(1, 5), tiempo_restante=0)
+                    for i in range(cantidad)]
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del procesos
+    return {'bytes': actual, 'bytes_por_proceso': actual / cantidad}
+
+def medir_simulacion(representacion: str, cantidad: int, ciclos: int) -> float:
+    """Retorna los segundos que tarda una simulación completa con la representación dada"""
+    simulador = Simulador(ciclos=ciclos, semilla=0, motor="eventos", mostrar_swapping=False,
+                          representacion=representacion)
+    simulador.probabilidad_admision = 1.0
+    inicio = time.perf_counter()
+    simulador.simular(cantidad)
+    return time.perf_counter() - inicio
+
+def main():
+    parser = argparse.ArgumentParser(description="Memoria por proceso de cada representación")
+    parser.add_argument("--procesos", type=int, nargs="+", default=[1000, 100000])
+    parser.add_argument("--ciclos", type=int, default=2000)
+    argumentos = parser.parse_args()
+
+    print(f"{'representación':<16}{'procesos':>10}{'bytes/proceso':>16}{'simulación (s)':>16}")
+    for cantidad in argumentos.procesos:
+        for representacion, con_vistas in (("objetos", True), ("tabla", True), ("tabla", False)):
+            memoria = medir_memoria(representacion, cantidad, con_vistas)
+            nombre = representacion if con_vistas else "tabla (filas)"
+            tiempo = f"{medir_simulacion(representacion, cantidad, argumentos.ciclos):.3f}" if con_vistas else "-"
+            print(f"{nombre:<16}{cantidad:>10}{memoria['bytes_por_proceso']:>16.1f}{tiempo:>16}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Suite de rendimiento de las rutas críticas del planificador y el simulador.
+
+Uso (desde L5):
+
+    python -m benchmarks.suite ejecutar --salida base.json
+    python -m benchmarks.suite ejecutar --salida actual.json
+    python -m benchmarks.suite comparar base.json actual.json --umbral 0.10
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from benchmarks.casos import CASOS
+
+def metadatos_maquina() -> Dict:
+    """Retorna los datos de la máquina y del código con que se tomaron las mediciones"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'fecha': datetime.datetime.now().isoformat(timespec="seconds"),
+        'python': platform.python_version(),
+        'implementacion': platform.python_implementation(),
+        'sistema': platform.platform(),
+        'procesador': platform.processor() or platform.machine(),
+        'nucleos': os.cpu_count(),
+        'commit': commit,
+    }
+
+def medir_caso(caso: str, procesos: int, ciclos: int, motor: str, repeticiones: int,
+               tiempo_minimo: float = 0.5) -> Dict:
+    """
+    Mide un caso con un tamaño dado.
+
+    La preparación se repite en cada repetición y no se mide; el recolector de basura
+    se desactiva durante la medición para reducir el ruido. Los casos muy rápidos se
+    repiten más veces hasta sumar `tiempo_minimo` segundos medidos.
+
+    Returns:
+        Dict: Segundos de cada repetición, mediana, mínimo y segundos por operación
+    """
+    segundos = []
+    operaciones = 0
+    while len(segundos) < repeticiones or sum(segundos) < tiempo_minimo:
+        medir = CASOS[caso](procesos, ciclos, motor)
+        gc.collect()
+        gc.disable()
+        try:
+            inicio = time.perf_counter()
+            operaciones = medir()
+            segundos.append(time.perf_counter() - inicio)
+        finally:
+            gc.enable()
+    mediana = statistics.median(segundos)
+    return {
+        'caso': caso,
+        'procesos': procesos,
+        'ciclos': ciclos,
+        'motor': motor,
+        'repeticiones': len(segundos),
+        'segundos': segundos,
+        'mediana': mediana,
+        'minimo': min(segundos),
+        'por_operacion': mediana / operaciones if operaciones else None,
+    }
+
+def ejecutar_suite(casos: Sequence[str], procesos: Sequence[int], ciclos: Sequence[int],
+                   motores: Sequence[str], repeticiones: int = 5, mostrar: bool = True) -> Dict:
+    """
+    Ejecuta todas las combinaciones de casos y tamaños.
+
+    Returns:
+        Dict: {'metadatos': ..., 'resultados': [una medición por combinación]}
+    """
+    resultados = []
+    for caso in casos:
+        for motor in motores:
+            for cantidad in procesos:
+                for numero_ciclos in ciclos:
+                    resultado = medir_caso(caso, cantidad, numero_ciclos, motor, repeticiones)
+                    resultados.append(resultado)
+                    if mostrar:
+                        print(f"{caso:<24}{motor:<9}{cantidad:>10}{numero_ciclos:>9}"
+                              f"{resultado['mediana']:>12.4f} s{resultado['por_operacion'] * 1e6:>14.2f} µs/op",
+                              flush=True)
+    return {'metadatos': metadatos_maquina(), 'resultados': resultados}
+
+def _clave(resultado: Dict) -> Tuple:
+    return resultado['caso'], resultado['motor'], resultado['procesos'], resultado['ciclos']
+
+def comparar(base: Dict, actual: Dict, umbral: float = 0.10) -> List[Dict]:
+    """
+    Compara dos ejecuciones de la suite por el mínimo de cada medición, que es menos
+    sensible que la mediana a la carga de la máquina.
+
+    Args:
+        base (Dict): Resultados de referencia
+        actual (Dict): Resultados nuevos
+        umbral (float): Aumento relativo a partir del cual se considera una regresión
+
+    Returns:
+        List[Dict]: Una fila por medición presente en ambas, con la razón actual/base y
+            si es una regresión o una mejora
+    """
+    referencia = {_clave(resultado): resultado for resultado in base['resultados']}
+    filas = []
+    for resultado in actual['resultados']:
+        anterior = referencia.get(_clave(resultado))
+        if anterior is None:
+            continue
+        razon = resultado['minimo'] / anterior['minimo'] if anterior['minimo'] else float("inf")
+        filas.append({
+            'caso': resultado['caso'],
+            'motor': resultado['motor'],
+            'procesos': resultado['procesos'],
+            'ciclos': resultado['ciclos'],
+            'base': anterior['minimo'],
+            'actual': resultado['minimo'],
+            'razon': razon,
+            'regresion': razon > 1 + umbral,
+            'mejora': razon < 1 / (1 + umbral),
+        })
+    return filas
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Suite de rendimiento del simulador")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    ejecutar = subparsers.add_parser("ejecutar", help="Ejecutar la suite y guardar los resultados")
+    ejecutar.add_argument("--casos", nargs="+", choices=list(CASOS), default=list(CASOS))
+    ejecutar.add_argument("--procesos", type=int, nargs="+", default=[10, 1000, 100000],
+                          help="Cantidades de procesos (hasta 1000000)")
+    ejecutar.add_argument("--ciclos", type=int, nargs="+", default=[100, 1000])
+    ejecutar.add_argument("--motores", nargs="+", choices=["ticks", "eventos"], default=["ticks", "eventos"])
+    ejecutar.add_argument("--repeticiones", type=int, default=5)
+    ejecutar.add_argument("--salida", default="benchmarks.json", help="Archivo JSON de resultados")
+
+    comparar_parser = subparsers.add_parser("comparar", help="Comparar resultados con una referencia")
+    comparar_parser.add_argument("base", help="JSON de referencia")
+    comparar_parser.add_argument("actual", help="JSON a comparar")
+    comparar_parser.add_argument("--umbral", type=float, default=0.10,
+                                 help="Aumento relativo del tiempo mínimo que cuenta como regresión")
+    return parser
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    argumentos = crear_parser().parse_args(argv)
+
+    if argumentos.comando == "ejecutar":
+        resultados = ejecutar_suite(argumentos.casos, argumentos.procesos, argumentos.ciclos,
+                                    argumentos.motores, argumentos.repeticiones)
+        with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, indent=2)
+        print(f"Resultados en {argumentos.salida}")
+        return 0
+
+    with open(argumentos.base, encoding="utf-8") as archivo:
+        base = json.load(archivo)
+    with open(argumentos.actual, encoding="utf-8") as archivo:
+        actual = json.load(archivo)
+    filas = comparar(base, actual, argumentos.umbral)
+    for fila in filas:
+        marca = "REGRESIÓN" if fila['regresion'] else "mejora" if fila['mejora'] else ""
+        print(f"{fila['caso']:<24}{fila['motor']:<9}{fila['procesos']:>10}{fila['ciclos']:>9}"
+              f"{fila['base']:>12.4f}{fila['actual']:>12.4f}{fila['razon']:>8.2f}x  {marca}")
+    regresiones = sum(fila['regresion'] for fila in filas)
+    print(f"{len(filas)} mediciones comparadas, {regresiones} regresiones")
+    return 1 if regresiones else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
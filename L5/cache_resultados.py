@@ -0,0 +1,255 @@
+"""
+Caché en disco de resultados de simulación, direccionada por contenido.
+
+La clave de una corrida es el SHA-256 de su configuración completa (quantum, ciclos,
+probabilidades, carga, semilla, motor, ...) junto con la versión del motor: una huella
+del código de los módulos que simulan, así que cualquier cambio en ellos invalida lo
+guardado sin tener que acordarse de subir un número de versión. Como la simulación es
+determinista con una semilla fija, la misma clave da siempre los mismos resultados.
+
+Cada resultado es un archivo JSON `<directorio>/<2 primeros>/<clave>.json`. Se escribe en
+un temporal del mismo directorio y se publica con `os.replace`, que es atómico: varios
+procesos pueden leer y escribir a la vez sin locks y nunca ven un archivo a medias (si dos
+calculan la misma corrida, los dos escriben lo mismo). Leer un resultado actualiza su
+fecha de modificación, y cuando el directorio supera `tamano_maximo` se borran los menos
+usados (LRU) hasta bajar al 90 %.
+
+Uso:
+
+    cache = CacheResultados("~/.cache/simulador", tamano_maximo=512 * 2**20)
+    resultados = cache.obtener_o_calcular(configuracion, lambda: ejecutar(configuracion))
+    cache.estadisticas()  # {'aciertos': ..., 'fallos': ..., ...}
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Módulos cuyo código determina los resultados de una simulación
+MODULOS_MOTOR = (
+    'simulador', 'planificador', 'planificador_eventos', 'planificador_multinucleo', 'proceso',
+    'cola_procesos', 'tabla_procesos', 'politicas', 'distribuciones', 'dispositivos_io', 'memoria',
+    'carga', 'metricas', 'historial',
+)
+
+# Fracción de `tamano_maximo` que queda ocupada después de desalojar
+FRACCION_DESALOJO = 0.9
+
+# Antigüedad en segundos a partir de la cual un temporal se considera abandonado
+ANTIGUEDAD_TEMPORAL = 3600
+
+_version_motor: Optional[str] = None
+
+def version_motor() -> str:
+    """Huella del código de MODULOS_MOTOR (se calcula una vez por proceso)"""
+    global _version_motor
+    if _version_motor is None:
+        directorio = os.path.dirname(os.path.abspath(__file__))
+        huella = hashlib.sha256()
+        for modulo in MODULOS_MOTOR:
+            with open(os.path.join(directorio, modulo + ".py"), "rb") as archivo:
+                huella.update(modulo.encode() + b"\0" + archivo.read() + b"\0")
+        _version_motor = huella.hexdigest()[:16]
+    return _version_motor
+
+def huella_archivo(ruta: str) -> Dict:
+    """
+    Describe un archivo de carga por su contenido (no por su ruta) para usarlo en una configuración.
+
+    Returns:
+        Dict: Extensión y SHA-256 del contenido
+    """
+    huella = hashlib.sha256()
+    with open(ruta, "rb") as archivo:
+        for bloque in iter(lambda: archivo.read(1 << 20), b""):
+            huella.update(bloque)
+    return {'formato': os.path.splitext(ruta)[1].lower(), 'sha256': huella.hexdigest()}
+
+def clave_configuracion(configuracion: Dict) -> str:
+    """
+    Clave de una configuración: SHA-256 de su JSON canónico junto con la versión del motor.
+
+    Args:
+        configuracion (Dict): Configuración completa de la corrida (valores JSON)
+
+    Returns:
+        str: Clave hexadecimal
+    """
+    documento = json.dumps({'version_motor': version_motor(), 'configuracion': configuracion},
+                           sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(documento.encode()).hexdigest()
+
+class CacheResultados:
+    """
+    Caché de resultados en disco, segura para varios procesos y acotada en tamaño.
+
+    Los contadores son de esta instancia (cada proceso trabajador tiene los suyos).
+
+    Atributos:
+        directorio (str): Directorio de la caché
+        tamano_maximo (int): Bytes máximos ocupados por los resultados
+        omitir (bool): Si es True no se lee ni se escribe nada y toda corrida se calcula
+            (para medir tiempos sin la caché)
+        aciertos (int): Consultas respondidas desde el disco
+        fallos (int): Consultas que no estaban guardadas
+        omitidas (int): Consultas que no miraron la caché por `omitir`
+        escrituras (int): Resultados guardados
+        desalojos (int): Resultados borrados para respetar `tamano_maximo`
+        _escrito (int): Bytes escritos por esta instancia desde la última medición del directorio
+    """
+
+    def __init__(self, directorio: str, tamano_maximo: int = 256 * 2**20, omitir: bool = False):
+        """
+        Inicializa la caché (el directorio se crea si no existe).
+
+        Args:
+            directorio (str): Directorio de la caché
+            tamano_maximo (int): Bytes máximos ocupados por los resultados
+            omitir (bool): No usar la caché (cada corrida se calcula)
+        """
+        if tamano_maximo <= 0:
+            raise ValueError(f"El tamaño máximo de la caché debe ser positivo: {tamano_maximo}")
+        self.directorio = os.path.expanduser(directorio)
+        self.tamano_maximo = tamano_maximo
+        self.omitir = omitir
+        self.aciertos = 0
+        self.fallos = 0
+        self.omitidas = 0
+        self.escrituras = 0
+        self.desalojos = 0
+        self._escrito = self.tamano_maximo  # Fuerza una medición en la primera escritura
+        os.makedirs(self.directorio, exist_ok=True)
+
+    def _ruta(self, clave: str) -> str:
+        return os.path.join(self.directorio, clave[:2], clave + ".json")
+
+    def obtener(self, configuracion: Dict) -> Optional[Dict]:
+        """
+        Busca los resultados de una configuración.
+
+        Returns:
+            Optional[Dict]: Los resultados guardados, o None si no están (o si se omite la caché)
+        """
+        if self.omitir:
+            self.omitidas += 1
+            return None
+        ruta = self._ruta(clave_configuracion(configuracion))
+        try:
+            with open(ruta, encoding="utf-8") as archivo:
+                entrada = json.load(archivo)
+            os.utime(ruta)  # Recién usado para el LRU
+        except (OSError, ValueError):
+            # No está, otro proceso lo desalojó o quedó ilegible: se recalcula
+            self.fallos += 1
+            return None
+        if entrada.get('configuracion') != json.loads(json.dumps(configuracion)):
+            self.fallos += 1
+            return None
+        self.aciertos += 1
+        return entrada['resultados']
+
+    def guardar(self, configuracion: Dict, resultados: Dict):
+        """Guarda los resultados de una configuración (nada si se omite la caché)"""
+        if self.omitir:
+            return
+        ruta = self._ruta(clave_configuracion(configuracion))
+        datos = json.dumps({'configuracion': configuracion, 'resultados': resultados},
+                           ensure_ascii=False).encode()
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        descriptor, temporal = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=os.path.dirname(ruta))
+        try:
+            with os.fdopen(descriptor, "wb") as archivo:
+                archivo.write(datos)
+            os.replace(temporal, ruta)
+        except BaseException:
+            try:
+                os.unlink(temporal)
+            except OSError:
+                pass
+            raise
+        self.escrituras += 1
+        self._escrito += len(datos)
+        # Los demás procesos también escriben: el tamaño se vuelve a medir cada vez que
+        # éste escribe un 10 % del máximo, así que ninguno se pasa por mucho
+        if self._escrito > self.tamano_maximo * (1 - FRACCION_DESALOJO):
+            self._escrito = 0
+            if sum(tamano for _, tamano, _ in self._entradas()) > self.tamano_maximo:
+                self._desalojar()
+
+    def obtener_o_calcular(self, configuracion: Dict, calcular: Callable[[], Dict]) -> Dict:
+        """
+        Retorna los resultados guardados de una configuración o los calcula y los guarda.
+
+        Args:
+            configuracion (Dict): Configuración completa de la corrida
+            calcular (Callable[[], Dict]): Ejecuta la corrida (resultados serializables en JSON)
+
+        Returns:
+            Dict: Resultados (tal como quedan después de pasar por JSON)
+        """
+        resultados = self.obtener(configuracion)
+        if resultados is None:
+            # Se devuelve lo mismo que daría un acierto: JSON convierte tuplas y claves no str
+            resultados = json.loads(json.dumps(calcular(), ensure_ascii=False))
+            self.guardar(configuracion, resultados)
+        return resultados
+
+    def _entradas(self) -> List[Tuple[float, int, str]]:
+        """(fecha de uso, bytes, ruta) de cada resultado; borra los temporales abandonados"""
+        entradas = []
+        limite_temporales = time.time() - ANTIGUEDAD_TEMPORAL
+        for subdirectorio in os.scandir(self.directorio):
+            if not subdirectorio.is_dir():
+                continue
+            for archivo in os.scandir(subdirectorio.path):
+                try:
+                    informacion = archivo.stat()
+                    if archivo.name.startswith("."):
+                        if informacion.st_mtime < limite_temporales:
+                            os.unlink(archivo.path)
+                        continue
+                except OSError:
+                    continue  # Otro proceso lo borró o lo reemplazó
+                entradas.append((informacion.st_mtime, informacion.st_size, archivo.path))
+        return entradas
+
+    def _desalojar(self):
+        """Borra los resultados menos usados hasta bajar al 90 % de `tamano_maximo`"""
+        entradas = sorted(self._entradas())
+        tamano = sum(tamano for _, tamano, _ in entradas)
+        objetivo = self.tamano_maximo * FRACCION_DESALOJO
+        for _, bytes_entrada, ruta in entradas:
+            if tamano <= objetivo:
+                break
+            try:
+                os.unlink(ruta)
+                self.desalojos += 1
+            except OSError:
+                pass  # Ya lo desalojó otro proceso
+            tamano -= bytes_entrada
+
+    def limpiar(self):
+        """Borra todos los resultados guardados"""
+        for _, _, ruta in self._entradas():
+            try:
+                os.unlink(ruta)
+            except OSError:
+                pass
+
+    def contadores(self) -> Dict[str, int]:
+        """Contadores de esta instancia (sin recorrer el disco)"""
+        return {'aciertos': self.aciertos, 'fallos': self.fallos, 'omitidas': self.omitidas,
+                'escrituras': self.escrituras, 'desalojos': self.desalojos}
+
+    def estadisticas(self) -> Dict:
+        """Contadores de esta instancia, tasa de aciertos y entradas y bytes en disco"""
+        entradas = self._entradas()
+        consultas = self.aciertos + self.fallos
+        return {
+            **self.contadores(),
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+            'entradas': len(entradas),
+            'bytes': sum(tamano for _, tamano, _ in entradas),
+        }
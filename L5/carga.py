@@ -0,0 +1,273 @@
+"""
+Fuentes de carga de trabajo: los procesos que llegan a la simulación y cuándo.
+
+Cada fuente es un iterador perezoso de `Llegada`, en orden de ciclo de llegada, y el
+simulador sólo pide la siguiente cuando llega la anterior; así una carga de millones
+de procesos no ocupa memoria mientras no hayan llegado. Las fuentes se consumen una
+vez y se pueden guardar en un punto de control (ver punto_control.py).
+
+Uso:
+
+    carga = CargaSintetica(LlegadasRafagas(0.05, 2.0, 400, 20), rafagas=Pareto(1.5, 3, 5000),
+                           prioridades=Empirica([1, 2, 3, 4, 5], [5, 3, 1, 1, 1]), semilla=7)
+    simulador = Simulador(ciclos=100000, carga=carga)
+    simulador.simular()
+"""
+import csv
+import math
+import random
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Optional
+from distribuciones import Distribucion, Uniforme, geometrica
+
+@dataclass
+class Llegada:
+    """
+    Proceso que llega a la simulación.
+
+    Atributos:
+        ciclo (int): Ciclo de llegada, contado desde que se inicia la simulación
+        tiempo_ejecucion (int): Tiempo de CPU que necesita
+        prioridad (int): Prioridad del proceso
+        nombre (Optional[str]): Nombre (por defecto "Proceso_<id>")
+    """
+    ciclo: int
+    tiempo_ejecucion: int
+    prioridad: int
+    nombre: Optional[str] = None
+
+class LlegadasBernoulli:
+    """
+    A lo sumo una llegada por ciclo, con probabilidad fija (como la admisión de Simulador).
+
+    Atributos:
+        probabilidad (float): Probabilidad de que llegue un proceso en cada ciclo
+    """
+
+    def __init__(self, probabilidad: float):
+        if not 0 < probabilidad <= 1:
+            raise ValueError(f"La probabilidad debe estar en (0, 1]: {probabilidad}")
+        self.probabilidad = probabilidad
+        self._tiempo = 0
+
+    def siguiente(self, generador: random.Random) -> float:
+        """Retorna el instante de la próxima llegada"""
+        self._tiempo += geometrica(self.probabilidad, generador)
+        return self._tiempo
+
+class LlegadasPoisson:
+    """
+    Llegadas de Poisson: tiempos entre llegadas exponenciales; pueden llegar varios
+    procesos en el mismo ciclo.
+
+    Atributos:
+        tasa (float): Llegadas por ciclo en promedio
+    """
+
+    def __init__(self, tasa: float):
+        if tasa <= 0:
+            raise ValueError(f"La tasa debe ser positiva: {tasa}")
+        self.tasa = tasa
+        self._tiempo = 0.0
+
+    def siguiente(self, generador: random.Random) -> float:
+        """Retorna el instante de la próxima llegada"""
+        self._tiempo += generador.expovariate(self.tasa)
+        return self._tiempo
+
+class LlegadasRafagas:
+    """
+    Llegadas en ráfagas: un proceso de Poisson modulado por dos estados (calma y ráfaga)
+    que se alternan con duraciones exponenciales.
+
+    Atributos:
+        tasa_calma (float): Llegadas por ciclo durante la calma (puede ser 0)
+        tasa_rafaga (float): Llegadas por ciclo durante una ráfaga
+        duracion_calma (float): Duración media de la calma en ciclos
+        duracion_rafaga (float): Duración media de una ráfaga en ciclos
+    """
+
+    def __init__(self, tasa_calma: float, tasa_rafaga: float, duracion_calma: float, duracion_rafaga: float):
+        if tasa_calma < 0 or tasa_rafaga <= 0:
+            raise ValueError(f"Tasas inválidas: calma {tasa_calma}, ráfaga {tasa_rafaga}")
+        if duracion_calma <= 0 or duracion_rafaga <= 0:
+            raise ValueError(f"Las duraciones deben ser positivas: {duracion_calma}, {duracion_rafaga}")
+        self.tasa_calma = tasa_calma
+        self.tasa_rafaga = tasa_rafaga
+        self.duracion_calma = duracion_calma
+        self.duracion_rafaga = duracion_rafaga
+        self._tiempo = 0.0
+        self._en_rafaga = False
+        self._fin_estado: Optional[float] = None
+
+    def siguiente(self, generador: random.Random) -> float:
+        """Retorna el instante de la próxima llegada"""
+        if self._fin_estado is None:
+            self._fin_estado = generador.expovariate(1.0 / self.duracion_calma)
+        while True:
+            tasa = self.tasa_rafaga if self._en_rafaga else self.tasa_calma
+            intervalo = generador.expovariate(tasa) if tasa > 0 else math.inf
+            if self._tiempo + intervalo < self._fin_estado:
+                self._tiempo += intervalo
+                return self._tiempo
+            # El estado termina antes de la llegada: por la falta de memoria de la
+            # exponencial se vuelve a muestrear desde el cambio de estado
+            self._tiempo = self._fin_estado
+            self._en_rafaga = not self._en_rafaga
+            duracion = self.duracion_rafaga if self._en_rafaga else self.duracion_calma
+            self._fin_estado = self._tiempo + generador.expovariate(1.0 / duracion)
+
+class CargaSintetica:
+    """
+    Carga generada al vuelo con un proceso de llegadas y distribuciones de ráfaga de CPU
+    y de prioridad.
+
+    Tiene su propio generador, así que la misma semilla da la misma carga sin importar
+    cómo se configure el planificador.
+
+    Atributos:
+        llegadas: Proceso de llegadas (LlegadasBernoulli, LlegadasPoisson o LlegadasRafagas)
+        rafagas (Distribucion): Tiempo de CPU de cada proceso
+        prioridades (Distribucion): Prioridad de cada proceso (p. ej. Empirica para una mezcla)
+        cantidad (Optional[int]): Procesos a generar (sin límite si es None)
+        generadas (int): Llegadas generadas hasta ahora
+    """
+
+    def __init__(self, llegadas, rafagas: Optional[Distribucion] = None,
+                 prioridades: Optional[Distribucion] = None, cantidad: Optional[int] = None,
+                 semilla: Optional[int] = None):
+        self.llegadas = llegadas
+        self.rafagas = rafagas if rafagas is not None else Uniforme(5, 20)
+        self.prioridades = prioridades if prioridades is not None else Uniforme(1, 5)
+        self.cantidad = cantidad
+        self.generadas = 0
+        self.generador = random.Random(semilla)
+
+    def __iter__(self) -> Iterator[Llegada]:
+        return self
+
+    def __next__(self) -> Llegada:
+        if self.cantidad is not None and self.generadas >= self.cantidad:
+            raise StopIteration
+        self.generadas += 1
+        generador = self.generador
+        return Llegada(
+            ciclo=math.ceil(self.llegadas.siguiente(generador)),
+            tiempo_ejecucion=int(self.rafagas.muestrear(generador)),
+            prioridad=int(self.prioridades.muestrear(generador)),
+        )
+
+class _CargaArchivo:
+    """
+    Carga leída de un archivo de a una fila por vez.
+
+    Al guardarla en un punto de control sólo se guardan la ruta y las filas leídas; al
+    restaurarla se vuelve a abrir el archivo y se saltan esas filas.
+    """
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        self.leidas = 0
+        self._abrir()
+
+    def _abrir(self):
+        self._archivo = open(self.ruta, newline="", encoding="utf-8")
+        self._filas = self._leer(self._archivo)
+
+    def _leer(self, archivo) -> Iterator[Llegada]:
+        raise NotImplementedError
+
+    def __iter__(self) -> Iterator[Llegada]:
+        return self
+
+    def __next__(self) -> Llegada:
+        try:
+            llegada = next(self._filas)
+        except StopIteration:
+            self._archivo.close()
+            raise
+        self.leidas += 1
+        return llegada
+
+    def __getstate__(self) -> Dict:
+        estado = self.__dict__.copy()
+        del estado['_archivo'], estado['_filas']
+        return estado
+
+    def __setstate__(self, estado: Dict):
+        self.__dict__.update(estado)
+        self._abrir()
+        for _ in islice(self._filas, self.leidas):
+            pass
+
+class CargaCSV(_CargaArchivo):
+    """
+    Carga leída de un CSV con columnas `llegada`, `tiempo_ejecucion`, `prioridad` y,
+    opcionalmente, `nombre` (ver `guardar_csv`). Las filas deben estar ordenadas por llegada.
+    """
+
+    def _leer(self, archivo) -> Iterator[Llegada]:
+        for numero, fila in enumerate(csv.DictReader(archivo), start=2):
+            try:
+                llegada = Llegada(int(fila['llegada']), int(fila['tiempo_ejecucion']), int(fila['prioridad']),
+                                  fila.get('nombre') or None)
+            except (KeyError, TypeError, ValueError) as error:
+                raise ValueError(f"{self.ruta}:{numero}: fila inválida ({error})") from None
+            if llegada.tiempo_ejecucion < 1:
+                raise ValueError(f"{self.ruta}:{numero}: el tiempo de ejecución debe ser positivo")
+            yield llegada
+
+class CargaSWF(_CargaArchivo):
+    """
+    Carga leída de una traza en Standard Workload Format (Parallel Workloads Archive).
+
+    De cada trabajo se usan el instante de envío (campo 2) y el tiempo de ejecución
+    (campo 4); los trabajos sin tiempo de ejecución se omiten. Las llegadas se cuentan
+    desde el primer trabajo.
+
+    Atributos:
+        segundos_por_ciclo (float): Segundos de la traza que representa un ciclo
+        prioridad (int): Prioridad de todos los procesos
+    """
+
+    def __init__(self, ruta: str, segundos_por_ciclo: float = 1.0, prioridad: int = 3):
+        if segundos_por_ciclo <= 0:
+            raise ValueError(f"segundos_por_ciclo debe ser positivo: {segundos_por_ciclo}")
+        self.segundos_por_ciclo = segundos_por_ciclo
+        self.prioridad = prioridad
+        super().__init__(ruta)
+
+    def _leer(self, archivo) -> Iterator[Llegada]:
+        origen = None
+        for linea in archivo:
+            campos = linea.split()
+            if not campos or campos[0].startswith(";"):
+                continue
+            envio, ejecucion = float(campos[1]), float(campos[3])
+            if ejecucion <= 0:
+                continue
+            if origen is None:
+                origen = envio
+            yield Llegada(
+                ciclo=math.ceil((envio - origen) / self.segundos_por_ciclo),
+                tiempo_ejecucion=max(1, math.ceil(ejecucion / self.segundos_por_ciclo)),
+                prioridad=self.prioridad,
+                nombre=f"Trabajo_{campos[0]}",
+            )
+
+def guardar_csv(carga: Iterable[Llegada], ruta: str, cantidad: Optional[int] = None) -> int:
+    """
+    Escribe una carga (o sus primeras `cantidad` llegadas) en un CSV legible por CargaCSV.
+
+    Returns:
+        int: Llegadas escritas
+    """
+    escritas = 0
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(['llegada', 'tiempo_ejecucion', 'prioridad', 'nombre'])
+        for llegada in islice(carga, cantidad):
+            escritor.writerow([llegada.ciclo, llegada.tiempo_ejecucion, llegada.prioridad, llegada.nombre or ""])
+            escritas += 1
+    return escritas
@@ -0,0 +1,569 @@
+"""
+Simulación de un cluster: muchas máquinas (nodos), cada una con su propio planificador,
+repartidas en fragmentos que corren en procesos distintos.
+
+Los fragmentos avanzan sincronizados por épocas: cada uno ejecuta los ciclos de la época
+en sus nodos (los nodos no se ven entre sí dentro de una época) y publica la carga de
+cada nodo en memoria compartida. El coordinador decide entonces qué procesos migrar con
+un balanceador global; cada fragmento escribe los procesos que salen de sus nodos en su
+buzón, también en memoria compartida, y toma de todos los buzones los que llegan a los
+suyos. Un proceso migrado tarda `costo_migracion` ciclos en llegar y ese tiempo cuenta
+como espera.
+
+Los resultados no dependen de cuántos trabajadores se usen: cada nodo tiene su propio
+generador y las migraciones se aplican en un orden fijo.
+
+Uso:
+
+    cluster = SimuladorCluster(nodos=64, ciclos=20000, probabilidad_admision=[0.02] * 48 + [0.2] * 16,
+                               costo_migracion=5, semilla=1)
+    resultados = cluster.simular()
+    resultados['cluster']['tiempo_respuesta']['p99'], resultados['nodos'][0]['emigrados']
+"""
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from multiprocessing import shared_memory
+from typing import Deque, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from distribuciones import FuenteAleatoria
+from planificador_eventos import PlanificadorEventos
+from politicas import crear_politica
+from proceso import Proceso, EstadoProceso, CODIGO_ESTADO
+
+# Columnas de la carga que cada fragmento publica por nodo al terminar una época
+# (los procesos en camino hacia el nodo ya cuentan en 'listos' y 'en_sistema')
+CAMPOS_CARGA = ('listos', 'en_sistema', 'terminados', 'tiempo_cpu')
+LISTOS, EN_SISTEMA, TERMINADOS, TIEMPO_CPU = range(len(CAMPOS_CARGA))
+
+# Columnas de un proceso en tránsito en un buzón (seguidas de sus ciclos en cada estado)
+CAMPOS_MIGRANTE = ('id', 'origen', 'destino', 'tiempo_ejecucion', 'prioridad', 'tiempo_restante', 'edad',
+                   'tiempo_espera', 'tiempo_respuesta', 'tiempo_swap', 'ciclo_estado')
+_COLUMNAS_MIGRANTE = len(CAMPOS_MIGRANTE) + len(CODIGO_ESTADO)
+
+SIN_VALOR = -1
+
+class BalanceadorCarga:
+    """
+    Balanceador global: mueve procesos en LISTO de los nodos más cargados a los menos cargados.
+
+    En cada época se calcula la media de procesos en LISTO; cada nodo que la supera en al
+    menos `umbral` cede su exceso y cada uno que queda por debajo en al menos `umbral`
+    recibe hasta completar la media, emparejando siempre el más cargado con el más libre.
+
+    Atributos:
+        umbral (float): Diferencia mínima con la media para migrar
+    """
+
+    def __init__(self, umbral: float = 2):
+        if umbral <= 0:
+            raise ValueError(f"El umbral debe ser positivo: {umbral}")
+        self.umbral = umbral
+
+    def planificar(self, listos: np.ndarray, maximo: int) -> List[Tuple[int, int, int]]:
+        """
+        Decide las migraciones de una época.
+
+        Args:
+            listos (np.ndarray): Procesos en LISTO de cada nodo
+            maximo (int): Máximo de procesos a migrar en total
+
+        Returns:
+            List[Tuple[int, int, int]]: Migraciones (origen, destino, cantidad)
+        """
+        media = float(listos.mean()) if len(listos) else 0.0
+        diferencia = listos - media
+        donantes = [(int(exceso), int(nodo)) for nodo, exceso in enumerate(diferencia) if exceso >= self.umbral]
+        receptores = [(int(-faltante), int(nodo)) for nodo, faltante in enumerate(diferencia) if -faltante >= self.umbral]
+        donantes.sort(key=lambda par: (-par[0], par[1]))
+        receptores.sort(key=lambda par: (-par[0], par[1]))
+        plan = []
+        i = j = 0
+        while i < len(donantes) and j < len(receptores) and maximo > 0:
+            (exceso, origen), (faltante, destino) = donantes[i], receptores[j]
+            cantidad = min(exceso, faltante, maximo)
+            plan.append((origen, destino, cantidad))
+            maximo -= cantidad
+            donantes[i] = (exceso - cantidad, origen)
+            receptores[j] = (faltante - cantidad, destino)
+            if exceso == cantidad:
+                i += 1
+            if faltante == cantidad:
+                j += 1
+        return plan
+
+class Nodo:
+    """
+    Una máquina del cluster: un planificador de eventos con sus propias llegadas.
+
+    Los procesos llegan como en Simulador (a lo sumo uno por ciclo, con probabilidad
+    `probabilidad_admision`) y sus ids son únicos en todo el cluster.
+
+    Atributos:
+        indice (int): Número del nodo
+        planificador (PlanificadorEventos): Planificador del nodo
+        aleatorio (FuenteAleatoria): Decisiones aleatorias del nodo
+        probabilidad_admision (float): Probabilidad de que llegue un proceso en cada ciclo
+        creados (int): Procesos que llegaron al nodo desde fuera del cluster
+        emigrados (int): Procesos que el nodo cedió a otros
+        inmigrados (int): Procesos que el nodo recibió de otros
+        _transito (Deque): Procesos en camino hacia el nodo: (ciclo de llegada, proceso, edad)
+    """
+
+    def __init__(self, indice: int, nodos: int, quantum: int, probabilidad_admision: float,
+                 semilla: Optional[int], politica: str = "rr"):
+        if not 0 < probabilidad_admision <= 1:
+            raise ValueError(f"La probabilidad de admisión debe estar en (0, 1]: {probabilidad_admision}")
+        self.indice = indice
+        self._nodos = nodos
+        self.aleatorio = FuenteAleatoria(None if semilla is None else f"{semilla}:{indice}")
+        self.planificador = PlanificadorEventos(quantum, self.aleatorio, politica=crear_politica(politica))
+        self.probabilidad_admision = probabilidad_admision
+        self.creados = 0
+        self.emigrados = 0
+        self.inmigrados = 0
+        self._transito: Deque[Tuple[int, Proceso, int]] = deque()
+        self.proxima_admision = self.aleatorio.ciclos_hasta_admision(probabilidad_admision)
+
+    def avanzar_hasta(self, limite: int):
+        """Ejecuta los ciclos del nodo hasta `limite`, saltando los ociosos"""
+        planificador = self.planificador
+        while planificador.ciclo_actual < limite:
+            siguiente = min(planificador.proximo_ciclo_evento(), self.proxima_admision,
+                            self._transito[0][0] if self._transito else limite + 1)
+            inactivos = int(min(siguiente, limite + 1)) - planificador.ciclo_actual - 1
+            if inactivos > 0:
+                planificador.avanzar_inactivo(inactivos)
+            if planificador.ciclo_actual < limite:
+                self._ejecutar_ciclo()
+
+    def _ejecutar_ciclo(self):
+        """Recibe los procesos que llegan en el ciclo y ejecuta el ciclo del planificador"""
+        planificador = self.planificador
+        ciclo = planificador.ciclo_actual + 1
+        while self._transito and self._transito[0][0] <= ciclo:
+            _, proceso, edad = self._transito.popleft()
+            # La edad (que ya incluye el viaje) se traslada al reloj de este nodo
+            proceso.tiempo_creacion = planificador.tiempo_actual - edad
+            planificador.inmigrar(proceso)
+            self.inmigrados += 1
+        while self.proxima_admision <= ciclo:
+            self.creados += 1
+            pid = self.creados * self._nodos + self.indice
+            planificador.admitir_proceso(Proceso(
+                id=pid,
+                nombre=f"Proceso_{pid}",
+                tiempo_ejecucion=self.aleatorio.tiempo_ejecucion(),
+                prioridad=self.aleatorio.prioridad(),
+                tiempo_restante=0,  # Se inicializa en __post_init__
+            ))
+            self.proxima_admision += self.aleatorio.ciclos_hasta_admision(self.probabilidad_admision)
+        planificador.ejecutar_ciclo()
+
+    def emitir(self, cantidad: int) -> List[Tuple[Proceso, int]]:
+        """
+        Cede los `cantidad` procesos que llegaron último a LISTO (o los que haya).
+
+        Returns:
+            List[Tuple[Proceso, int]]: Cada proceso con su edad en el reloj de este nodo
+        """
+        planificador = self.planificador
+        emitidos = []
+        for proceso in planificador.cola_listos.ultimos(cantidad):
+            planificador.emigrar(proceso.id)
+            emitidos.append((proceso, planificador.tiempo_actual - proceso.tiempo_creacion))
+        self.emigrados += len(emitidos)
+        return emitidos
+
+    def recibir(self, proceso: Proceso, edad: int, llegada: int):
+        """Programa la llegada en el ciclo `llegada` de un proceso migrado con `edad` ciclos al llegar"""
+        self._transito.append((llegada, proceso, edad))
+
+    def carga(self) -> Tuple[int, ...]:
+        """
+        Retorna la fila de CAMPOS_CARGA del nodo.
+
+        Los procesos en camino ya cuentan como listos y en el sistema del nodo: si no, un
+        viaje más largo que una época haría que el balanceador le mandara más todavía.
+        """
+        planificador = self.planificador
+        terminados = len(planificador.cola_terminados)
+        en_transito = len(self._transito)
+        return (len(planificador.cola_listos) + en_transito,
+                self.creados + self.inmigrados + en_transito - self.emigrados - terminados,
+                terminados,
+                planificador.tiempo_actual - planificador.ciclo_actual)
+
+    def tiempos(self) -> Dict[str, np.ndarray]:
+        """Tiempos de espera, respuesta y retorno de los procesos terminados"""
+        terminados = self.planificador.cola_terminados
+        cantidad = len(terminados)
+        return {
+            'tiempo_espera': np.fromiter((proceso.tiempo_espera for proceso in terminados), np.int64, cantidad),
+            'tiempo_respuesta': np.fromiter((proceso.tiempo_respuesta for proceso in terminados), np.int64, cantidad),
+            'tiempo_retorno': np.fromiter((proceso.tiempo_finalizacion - proceso.tiempo_creacion
+                                           for proceso in terminados), np.int64, cantidad),
+        }
+
+def _resumen(valores: np.ndarray) -> Dict:
+    """Media y percentiles de una serie de tiempos"""
+    if not len(valores):
+        return {'media': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'maximo': 0}
+    p50, p95, p99 = np.percentile(valores, [50, 95, 99])
+    return {'media': float(valores.mean()), 'p50': float(p50), 'p95': float(p95), 'p99': float(p99),
+            'maximo': int(valores.max())}
+
+class _Tablero:
+    """
+    Arreglos NumPy sobre el bloque compartido entre el coordinador y los fragmentos.
+
+    Atributos:
+        cargas (np.ndarray): Fila de CAMPOS_CARGA de cada nodo
+        plan (np.ndarray): Migraciones (origen, destino, cantidad) de la época
+        cantidad_plan (np.ndarray): Filas vigentes de `plan`
+        buzones (np.ndarray): Procesos en tránsito escritos por cada fragmento
+        cantidad_buzon (np.ndarray): Filas vigentes del buzón de cada fragmento
+    """
+
+    def __init__(self, buffer, nodos: int, fragmentos: int, capacidad: int):
+        formas = self.formas(nodos, fragmentos, capacidad)
+        posicion = 0
+        for nombre, forma in formas.items():
+            setattr(self, nombre, np.ndarray(forma, dtype=np.int64, buffer=buffer, offset=posicion))
+            posicion += 8 * int(np.prod(forma))
+
+    @staticmethod
+    def formas(nodos: int, fragmentos: int, capacidad: int) -> Dict[str, Tuple[int, ...]]:
+        return {
+            'cargas': (nodos, len(CAMPOS_CARGA)),
+            'plan': (nodos, 3),
+            'cantidad_plan': (1,),
+            'buzones': (fragmentos, capacidad, _COLUMNAS_MIGRANTE),
+            'cantidad_buzon': (fragmentos,),
+        }
+
+    @classmethod
+    def tamano(cls, nodos: int, fragmentos: int, capacidad: int) -> int:
+        return 8 * sum(int(np.prod(forma)) for forma in cls.formas(nodos, fragmentos, capacidad).values())
+
+class _Fragmento:
+    """Los nodos que ejecuta un trabajador y los pasos de cada época sobre el tablero"""
+
+    def __init__(self, numero: int, indices: Sequence[int], configuracion: Dict):
+        self.numero = numero
+        self.costo_migracion = configuracion['costo_migracion']
+        self.nodos = {
+            indice: Nodo(indice, configuracion['nodos'], configuracion['quantum'],
+                         configuracion['probabilidades'][indice], configuracion['semilla'],
+                         configuracion['politica'])
+            for indice in indices
+        }
+
+    def avanzar(self, tablero: _Tablero, fin: int):
+        """Ejecuta la época en todos los nodos y publica su carga"""
+        for indice, nodo in self.nodos.items():
+            nodo.avanzar_hasta(fin)
+            tablero.cargas[indice] = nodo.carga()
+
+    def emitir(self, tablero: _Tablero):
+        """Escribe en el buzón del fragmento los procesos que el plan saca de sus nodos"""
+        buzon = tablero.buzones[self.numero]
+        cantidad = 0
+        for origen, destino, pedidos in tablero.plan[:int(tablero.cantidad_plan[0])].tolist():
+            nodo = self.nodos.get(origen)
+            if nodo is None:
+                continue
+            for proceso, edad in nodo.emitir(pedidos):
+                buzon[cantidad] = (
+                    proceso.id, origen, destino, proceso.tiempo_ejecucion, proceso.prioridad,
+                    proceso.tiempo_restante, edad, proceso.tiempo_espera,
+                    SIN_VALOR if proceso.tiempo_respuesta is None else proceso.tiempo_respuesta,
+                    proceso.tiempo_swap, proceso.ciclo_estado, *proceso.tiempos_estado,
+                )
+                cantidad += 1
+        tablero.cantidad_buzon[self.numero] = cantidad
+
+    def recibir(self, tablero: _Tablero, fin: int):
+        """Toma de todos los buzones los procesos que van a sus nodos"""
+        filas = np.concatenate([tablero.buzones[numero, :int(cantidad)]
+                                for numero, cantidad in enumerate(tablero.cantidad_buzon)])
+        propias = np.isin(filas[:, 2], list(self.nodos))
+        # Orden fijo (origen, id) para que el resultado no dependa del reparto en fragmentos
+        filas = filas[propias]
+        filas = filas[np.lexsort((filas[:, 0], filas[:, 1]))]
+        base = len(CAMPOS_MIGRANTE)
+        for fila in filas.tolist():
+            (pid, _, destino, tiempo_ejecucion, prioridad, tiempo_restante, edad, tiempo_espera,
+             tiempo_respuesta, tiempo_swap, ciclo_estado) = fila[:base]
+            proceso = Proceso(id=pid, nombre=f"Proceso_{pid}", tiempo_ejecucion=tiempo_ejecucion,
+                              prioridad=prioridad, tiempo_restante=0)
+            proceso.tiempo_restante = tiempo_restante
+            proceso.estado = EstadoProceso.LISTO
+            proceso.tiempo_espera = tiempo_espera
+            proceso.tiempo_respuesta = None if tiempo_respuesta == SIN_VALOR else tiempo_respuesta
+            proceso.tiempo_swap = tiempo_swap
+            proceso.ciclo_estado = ciclo_estado
+            proceso.tiempos_estado = fila[base:]
+            self.nodos[destino].recibir(proceso, edad + self.costo_migracion, fin + self.costo_migracion)
+
+    def resultados(self, ciclos: int) -> Tuple[List[Dict], Dict[str, np.ndarray]]:
+        """Resultados de cada nodo y los tiempos de todos sus procesos terminados"""
+        por_nodo = []
+        tiempos = {'tiempo_espera': [], 'tiempo_respuesta': [], 'tiempo_retorno': []}
+        for indice, nodo in self.nodos.items():
+            listos, en_sistema, terminados, tiempo_cpu = nodo.carga()
+            tiempos_nodo = nodo.tiempos()
+            por_nodo.append({
+                'nodo': indice,
+                'creados': nodo.creados,
+                'completados': terminados,
+                'en_sistema': en_sistema,
+                'emigrados': nodo.emigrados,
+                'inmigrados': nodo.inmigrados,
+                'tiempo_cpu': tiempo_cpu,
+                'throughput': terminados / ciclos if ciclos else 0.0,
+                **{nombre: _resumen(valores) for nombre, valores in tiempos_nodo.items()},
+            })
+            for nombre, valores in tiempos_nodo.items():
+                tiempos[nombre].append(valores)
+        return por_nodo, {nombre: np.concatenate(partes) if partes else np.empty(0, np.int64)
+                          for nombre, partes in tiempos.items()}
+
+def _ejecutar_trabajador(numero: int, indices: Sequence[int], configuracion: Dict, nombre_memoria: str,
+                         epocas: Sequence[int], barrera, conexion):
+    """Proceso trabajador: ejecuta un fragmento época por época, sincronizado con la barrera"""
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    tablero = None
+    try:
+        tablero = _Tablero(memoria.buf, configuracion['nodos'], configuracion['fragmentos'],
+                           configuracion['capacidad'])
+        fragmento = _Fragmento(numero, indices, configuracion)
+        for fin in epocas:
+            fragmento.avanzar(tablero, fin)
+            barrera.wait()  # Cargas publicadas
+            barrera.wait()  # Plan escrito por el coordinador
+            fragmento.emitir(tablero)
+            barrera.wait()  # Buzones escritos
+            fragmento.recibir(tablero, fin)
+        conexion.send((True, fragmento.resultados(configuracion['ciclos'])))
+    except BaseException as error:
+        barrera.abort()
+        conexion.send((False, error))
+    finally:
+        del tablero
+        memoria.close()
+        conexion.close()
+
+class SimuladorCluster:
+    """
+    Simula un cluster de nodos independientes con migración de procesos entre ellos.
+
+    Los nodos se reparten en `trabajadores` fragmentos, cada uno en su propio proceso,
+    que avanzan por épocas de `ciclos_por_epoca` ciclos y se comunican por memoria
+    compartida. Al final de cada época el balanceador decide las migraciones (a lo sumo
+    `maximo_migraciones`); un proceso migrado llega a su destino `costo_migracion` ciclos
+    después. Con un solo trabajador todo corre en el proceso actual, con el mismo resultado.
+
+    Atributos:
+        nodos (int): Cantidad de nodos
+        ciclos (int): Ciclos de simulación
+        quantum (int): Quantum de todos los nodos
+        probabilidades (List[float]): Probabilidad de admisión de cada nodo
+        ciclos_por_epoca (int): Ciclos entre dos rondas de balanceo
+        costo_migracion (int): Ciclos que tarda un proceso migrado en llegar
+        maximo_migraciones (int): Procesos migrados por época como máximo
+        balanceador (BalanceadorCarga): Decide las migraciones
+        trabajadores (int): Procesos que ejecutan los fragmentos
+        semilla (Optional[int]): Semilla de la que se deriva la de cada nodo
+        politica (str): Política de planificación de los nodos (ver politicas.py)
+    """
+
+    def __init__(self, nodos: int = 8, ciclos: int = 10000, quantum: int = 2,
+                 probabilidad_admision: Union[float, Sequence[float]] = 0.1, ciclos_por_epoca: int = 100,
+                 costo_migracion: int = 5, maximo_migraciones: Optional[int] = None,
+                 balanceador: Optional[BalanceadorCarga] = None, trabajadores: Optional[int] = None,
+                 semilla: Optional[int] = None, politica: str = "rr"):
+        """
+        Inicializa el cluster.
+
+        Args:
+            nodos (int): Cantidad de nodos
+            ciclos (int): Ciclos de simulación
+            quantum (int): Quantum de todos los nodos
+            probabilidad_admision (Union[float, Sequence[float]]): Probabilidad de admisión
+                de todos los nodos o de cada uno
+            ciclos_por_epoca (int): Ciclos entre dos rondas de balanceo
+            costo_migracion (int): Ciclos que tarda un proceso migrado en llegar
+            maximo_migraciones (Optional[int]): Procesos migrados por época como máximo
+                (16 por nodo si es None)
+            balanceador (Optional[BalanceadorCarga]): Balanceador (uno con umbral 2 si es None)
+            trabajadores (Optional[int]): Procesos trabajadores (uno por núcleo si es None)
+            semilla (Optional[int]): Semilla del cluster
+            politica (str): Política de planificación de los nodos
+        """
+        if nodos < 1:
+            raise ValueError(f"La cantidad de nodos debe ser positiva: {nodos}")
+        if ciclos_por_epoca < 1:
+            raise ValueError(f"ciclos_por_epoca debe ser positivo: {ciclos_por_epoca}")
+        if costo_migracion < 0:
+            raise ValueError(f"El costo de migración no puede ser negativo: {costo_migracion}")
+        if isinstance(probabilidad_admision, (int, float)):
+            probabilidades = [float(probabilidad_admision)] * nodos
+        else:
+            probabilidades = [float(probabilidad) for probabilidad in probabilidad_admision]
+            if len(probabilidades) != nodos:
+                raise ValueError(f"Se esperaban {nodos} probabilidades de admisión: {len(probabilidades)}")
+        crear_politica(politica)  # Valida el nombre antes de crear los trabajadores
+        self.nodos = nodos
+        self.ciclos = ciclos
+        self.quantum = quantum
+        self.probabilidades = probabilidades
+        self.ciclos_por_epoca = ciclos_por_epoca
+        self.costo_migracion = costo_migracion
+        self.maximo_migraciones = maximo_migraciones if maximo_migraciones is not None else 16 * nodos
+        self.balanceador = balanceador if balanceador is not None else BalanceadorCarga()
+        self.trabajadores = max(1, min(trabajadores or os.cpu_count() or 1, nodos))
+        self.semilla = semilla
+        self.politica = politica
+
+    def _epocas(self) -> List[int]:
+        """Último ciclo de cada época"""
+        return list(range(self.ciclos_por_epoca, self.ciclos, self.ciclos_por_epoca)) + [self.ciclos]
+
+    def _configuracion(self) -> Dict:
+        return {
+            'nodos': self.nodos,
+            'ciclos': self.ciclos,
+            'quantum': self.quantum,
+            'probabilidades': self.probabilidades,
+            'semilla': self.semilla,
+            'politica': self.politica,
+            'costo_migracion': self.costo_migracion,
+            'fragmentos': self.trabajadores,
+            'capacidad': max(1, self.maximo_migraciones),
+        }
+
+    def _reparto(self) -> List[List[int]]:
+        """Nodos de cada fragmento, en bloques contiguos"""
+        return [list(range(self.nodos * numero // self.trabajadores, self.nodos * (numero + 1) // self.trabajadores))
+                for numero in range(self.trabajadores)]
+
+    def _planificar(self, tablero: _Tablero) -> int:
+        """Escribe en el tablero el plan de migraciones de la época y retorna los procesos a migrar"""
+        plan = self.balanceador.planificar(tablero.cargas[:, LISTOS], self.maximo_migraciones)
+        for fila, migracion in enumerate(plan):
+            tablero.plan[fila] = migracion
+        tablero.cantidad_plan[0] = len(plan)
+        return sum(cantidad for _, _, cantidad in plan)
+
+    def simular(self) -> Dict:
+        """
+        Ejecuta la simulación completa.
+
+        Returns:
+            Dict: 'nodos' con los resultados de cada nodo y 'cluster' con los totales, los
+                tiempos de todos los procesos terminados, las migraciones pedidas y la duración
+        """
+        inicio = time.perf_counter()
+        configuracion = self._configuracion()
+        epocas = self._epocas()
+        if self.trabajadores == 1:
+            partes, migraciones = self._simular_local(configuracion, epocas)
+        else:
+            partes, migraciones = self._simular_repartido(configuracion, epocas)
+
+        por_nodo = sorted((nodo for nodos, _ in partes for nodo in nodos), key=lambda nodo: nodo['nodo'])
+        tiempos = {nombre: np.concatenate([tiempos_parte[nombre] for _, tiempos_parte in partes])
+                   for nombre in ('tiempo_espera', 'tiempo_respuesta', 'tiempo_retorno')}
+        completados = sum(nodo['completados'] for nodo in por_nodo)
+        return {
+            'nodos': por_nodo,
+            'cluster': {
+                'nodos': self.nodos,
+                'ciclos': self.ciclos,
+                'epocas': len(epocas),
+                'trabajadores': self.trabajadores,
+                'creados': sum(nodo['creados'] for nodo in por_nodo),
+                'completados': completados,
+                'en_sistema': sum(nodo['en_sistema'] for nodo in por_nodo),
+                'migraciones': sum(nodo['emigrados'] for nodo in por_nodo),
+                'migraciones_pedidas': migraciones,
+                'ciclos_migracion': sum(nodo['emigrados'] for nodo in por_nodo) * self.costo_migracion,
+                'throughput': completados / self.ciclos if self.ciclos else 0.0,
+                **{nombre: _resumen(valores) for nombre, valores in tiempos.items()},
+                'duracion_segundos': time.perf_counter() - inicio,
+            },
+        }
+
+    def _simular_local(self, configuracion: Dict, epocas: List[int]):
+        """Un solo fragmento en este proceso, con los mismos pasos que los trabajadores"""
+        tablero = _Tablero(bytearray(_Tablero.tamano(self.nodos, 1, configuracion['capacidad'])),
+                           self.nodos, 1, configuracion['capacidad'])
+        fragmento = _Fragmento(0, range(self.nodos), configuracion)
+        migraciones = 0
+        for numero, fin in enumerate(epocas):
+            fragmento.avanzar(tablero, fin)
+            if numero < len(epocas) - 1:
+                migraciones += self._planificar(tablero)
+                fragmento.emitir(tablero)
+                fragmento.recibir(tablero, fin)
+        return [fragmento.resultados(self.ciclos)], migraciones
+
+    def _simular_repartido(self, configuracion: Dict, epocas: List[int]):
+        """Un fragmento por trabajador; el coordinador sólo balancea entre épocas"""
+        contexto = multiprocessing.get_context()
+        memoria = shared_memory.SharedMemory(
+            create=True, size=_Tablero.tamano(self.nodos, self.trabajadores, configuracion['capacidad']))
+        tablero = _Tablero(memoria.buf, self.nodos, self.trabajadores, configuracion['capacidad'])
+        tablero.cantidad_plan[0] = 0
+        barrera = contexto.Barrier(self.trabajadores + 1)
+        trabajadores, conexiones = [], []
+        migraciones = 0
+        try:
+            for numero, indices in enumerate(self._reparto()):
+                lectura, escritura = contexto.Pipe(duplex=False)
+                trabajador = contexto.Process(
+                    target=_ejecutar_trabajador,
+                    args=(numero, indices, configuracion, memoria.name, epocas, barrera, escritura),
+                    daemon=True)
+                trabajador.start()
+                escritura.close()
+                trabajadores.append(trabajador)
+                conexiones.append(lectura)
+
+            try:
+                for numero in range(len(epocas)):
+                    barrera.wait()  # Cargas publicadas
+                    if numero < len(epocas) - 1:
+                        migraciones += self._planificar(tablero)
+                    else:
+                        tablero.cantidad_plan[0] = 0
+                    barrera.wait()  # Plan escrito
+                    barrera.wait()  # Buzones escritos
+            except threading.BrokenBarrierError:
+                pass  # Un trabajador falló: su error llega por su conexión
+
+            partes, errores = [], []
+            for conexion in conexiones:
+                try:
+                    exito, valor = conexion.recv()
+                except EOFError:
+                    exito, valor = False, RuntimeError("Un trabajador del cluster terminó sin resultado")
+                (partes if exito else errores).append(valor)
+            if errores:
+                # Los demás trabajadores sólo ven la barrera rota: se informa el error original
+                raise next((error for error in errores if not isinstance(error, threading.BrokenBarrierError)),
+                           errores[0])
+            return partes, migraciones
+        finally:
+            for trabajador in trabajadores:
+                trabajador.join(timeout=5)
+                if trabajador.is_alive():
+                    trabajador.terminate()
+            for conexion in conexiones:
+                conexion.close()
+            del tablero
+            memoria.close()
+            memoria.unlink()
@@ -0,0 +1,352 @@
+from array import array
+from collections import deque
+from itertools import count, islice
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+from proceso import Proceso
+
+class ColaProcesos:
+    """
+    Cola FIFO de procesos para el planificador (un solo hilo, sin locks).
+
+    Los procesos se guardan en un deque junto con un número de secuencia y un índice
+    por id apunta a la entrada vigente de cada proceso. Quitar un proceso cualquiera
+    sólo lo borra del índice (O(1)); su entrada en el deque queda como lápida y se
+    descarta al llegar a la cabeza o al compactar.
+
+    Atributos:
+        _orden (Deque): Entradas (secuencia, proceso) en orden de llegada, incluidas las lápidas
+        _miembros (Dict[int, Tuple[int, Proceso]]): Entrada vigente de cada proceso por id
+        _lapidas (int): Entradas del deque que ya no corresponden a un proceso en la cola
+    """
+
+    def __init__(self):
+        self._orden: Deque[Tuple[int, Proceso]] = deque()
+        self._miembros: Dict[int, Tuple[int, Proceso]] = {}
+        self._secuencia = count()
+        self._lapidas = 0
+
+    def agregar(self, proceso: Proceso) -> int:
+        """
+        Agrega un proceso al final de la cola.
+
+        Returns:
+            int: Número de secuencia asignado a esta estancia del proceso en la cola
+        """
+        if proceso.id in self._miembros:
+            raise ValueError(f"El proceso {proceso.id} ya está en la cola")
+        entrada = (next(self._secuencia), proceso)
+        self._miembros[proceso.id] = entrada
+        self._orden.append(entrada)
+        return entrada[0]
+
+    def extraer(self) -> Proceso:
+        """Extrae el proceso que lleva más tiempo en la cola"""
+        self._descartar_lapidas()
+        if not self._orden:
+            raise IndexError("extraer de una cola vacía")
+        _, proceso = self._orden.popleft()
+        del self._miembros[proceso.id]
+        return proceso
+
+    def primero(self) -> Proceso:
+        """Retorna, sin extraerlo, el proceso que lleva más tiempo en la cola"""
+        self._descartar_lapidas()
+        if not self._orden:
+            raise IndexError("cola vacía")
+        return self._orden[0][1]
+
+    def quitar(self, pid: int) -> Proceso:
+        """Quita de la cola el proceso con el id dado, esté donde esté"""
+        try:
+            _, proceso = self._miembros.pop(pid)
+        except KeyError:
+            raise ValueError(f"El proceso {pid} no está en la cola") from None
+        self._lapidas += 1
+        if self._lapidas > len(self._miembros) + 32:
+            self._compactar()
+        return proceso
+
+    def buscar(self, pid: int) -> Optional[Proceso]:
+        """Retorna el proceso con el id dado si está en la cola, o None"""
+        entrada = self._miembros.get(pid)
+        return entrada[1] if entrada is not None else None
+
+    def contiene_estancia(self, pid: int, secuencia: int) -> bool:
+        """Indica si el proceso sigue en la cola en la estancia con el número de secuencia dado"""
+        entrada = self._miembros.get(pid)
+        return entrada is not None and entrada[0] == secuencia
+
+    def copiar(self) -> List[Proceso]:
+        """Retorna una lista con los procesos de la cola en orden de llegada"""
+        if not self._lapidas:
+            return [entrada[1] for entrada in self._orden]
+        return [entrada[1] for entrada in self._orden if self._vigente(entrada)]
+
+    def primeros(self, cantidad: int) -> List[Proceso]:
+        """Retorna los primeros `cantidad` procesos en orden de llegada sin copiar toda la cola"""
+        primeros = []
+        for entrada in self._orden:
+            if len(primeros) >= cantidad:
+                break
+            if self._vigente(entrada):
+                primeros.append(entrada[1])
+        return primeros
+
+    def ultimos(self, cantidad: int) -> List[Proceso]:
+        """Retorna los últimos `cantidad` procesos, el más reciente primero, sin copiar toda la cola"""
+        ultimos = []
+        for entrada in reversed(self._orden):
+            if len(ultimos) >= cantidad:
+                break
+            if self._vigente(entrada):
+                ultimos.append(entrada[1])
+        return ultimos
+
+    def vista(self) -> "VistaProcesos":
+        """Retorna una vista de sólo lectura que no copia los procesos"""
+        return VistaProcesos(self)
+
+    def _vigente(self, entrada: Tuple[int, Proceso]) -> bool:
+        """Indica si una entrada del deque corresponde a un proceso que sigue en la cola"""
+        return self._miembros.get(entrada[1].id) is entrada
+
+    def _descartar_lapidas(self):
+        """Elimina las lápidas que hay en la cabeza del deque"""
+        while self._orden and not self._vigente(self._orden[0]):
+            self._orden.popleft()
+            self._lapidas -= 1
+
+    def _compactar(self):
+        """Reconstruye el deque sin lápidas"""
+        self._orden = deque(entrada for entrada in self._orden if self._vigente(entrada))
+        self._lapidas = 0
+
+    def __getstate__(self) -> Dict:
+        # Se guardan sólo las entradas vigentes (secuencias y procesos por separado, para
+        # no serializar una tupla por proceso) y el próximo número de secuencia
+        siguiente = next(self._secuencia)
+        self._secuencia = count(siguiente)
+        entradas = self._orden if not self._lapidas else [entrada for entrada in self._orden if self._vigente(entrada)]
+        return {
+            'secuencias': array('q', [secuencia for secuencia, _ in entradas]),
+            'procesos': [proceso for _, proceso in entradas],
+            'siguiente': siguiente,
+        }
+
+    def __setstate__(self, estado: Dict):
+        self._orden = deque(zip(estado['secuencias'], estado['procesos']))
+        self._miembros = {entrada[1].id: entrada for entrada in self._orden}
+        self._secuencia = count(estado['siguiente'])
+        self._lapidas = 0
+
+    def __len__(self) -> int:
+        return len(self._miembros)
+
+    def __iter__(self) -> Iterator[Proceso]:
+        # Se recorre una copia para que la cola pueda modificarse durante la iteración
+        return iter(self.copiar())
+
+    def __contains__(self, proceso: Proceso) -> bool:
+        return proceso.id in self._miembros
+
+    def __repr__(self) -> str:
+        return f"ColaProcesos({[proceso.id for proceso in self]})"
+
+class ColaPrioridad:
+    """
+    Cola de procesos ordenada por clave: un montículo binario indexado por id.
+
+    Extraer el de menor clave, agregar, quitar un proceso cualquiera y cambiar su clave
+    cuestan O(log n), porque un índice por id da la posición de cada proceso en el
+    montículo. A igual clave sale primero el que se agregó antes.
+
+    Atributos:
+        _entradas (List[Tuple]): Montículo de entradas ((clave, secuencia), proceso)
+        _posiciones (Dict[int, int]): Posición de cada proceso en el montículo, por id
+    """
+
+    def __init__(self):
+        self._entradas: List[Tuple[Tuple, Proceso]] = []
+        self._posiciones: Dict[int, int] = {}
+        self._secuencia = count()
+
+    def agregar(self, proceso: Proceso, clave):
+        """Agrega un proceso con la clave dada"""
+        if proceso.id in self._posiciones:
+            raise ValueError(f"El proceso {proceso.id} ya está en la cola")
+        self._entradas.append(((clave, next(self._secuencia)), proceso))
+        self._subir(len(self._entradas) - 1)
+
+    def extraer(self) -> Proceso:
+        """Extrae el proceso de menor clave"""
+        if not self._entradas:
+            raise IndexError("extraer de una cola vacía")
+        return self.quitar(self._entradas[0][1].id)
+
+    def primero(self) -> Proceso:
+        """Retorna, sin extraerlo, el proceso de menor clave"""
+        if not self._entradas:
+            raise IndexError("cola vacía")
+        return self._entradas[0][1]
+
+    def clave_primero(self):
+        """Retorna la menor clave de la cola"""
+        if not self._entradas:
+            raise IndexError("cola vacía")
+        return self._entradas[0][0][0]
+
+    def clave(self, pid: int):
+        """Retorna la clave de un proceso de la cola"""
+        return self._entradas[self._posicion(pid)][0][0]
+
+    def quitar(self, pid: int) -> Proceso:
+        """Quita de la cola el proceso con el id dado, esté donde esté"""
+        posicion = self._posicion(pid)
+        del self._posiciones[pid]
+        entradas = self._entradas
+        quitada = entradas[posicion]
+        ultima = entradas.pop()
+        if posicion < len(entradas):
+            entradas[posicion] = ultima
+            if ultima[0] < quitada[0]:
+                self._subir(posicion)
+            else:
+                self._bajar(posicion)
+        return quitada[1]
+
+    def actualizar(self, pid: int, clave):
+        """Cambia la clave de un proceso (conserva su orden de llegada entre iguales)"""
+        posicion = self._posicion(pid)
+        (anterior, secuencia), proceso = self._entradas[posicion]
+        self._entradas[posicion] = ((clave, secuencia), proceso)
+        if clave < anterior:
+            self._subir(posicion)
+        else:
+            self._bajar(posicion)
+
+    def reordenar(self, clave: Callable[[Proceso], object]):
+        """Recalcula la clave de todos los procesos y rehace el montículo en O(n)"""
+        self._entradas = [((clave(proceso), secuencia), proceso) for (_, secuencia), proceso in self._entradas]
+        self._posiciones = {proceso.id: posicion for posicion, (_, proceso) in enumerate(self._entradas)}
+        for posicion in reversed(range(len(self._entradas) // 2)):
+            self._bajar(posicion)
+
+    def copiar(self) -> List[Proceso]:
+        """Retorna una lista con los procesos de la cola en orden de clave"""
+        return [proceso for _, proceso in sorted(self._entradas, key=lambda entrada: entrada[0])]
+
+    def _posicion(self, pid: int) -> int:
+        try:
+            return self._posiciones[pid]
+        except KeyError:
+            raise ValueError(f"El proceso {pid} no está en la cola") from None
+
+    def _subir(self, posicion: int):
+        entradas, posiciones = self._entradas, self._posiciones
+        entrada = entradas[posicion]
+        while posicion > 0:
+            padre = (posicion - 1) >> 1
+            if not entrada[0] < entradas[padre][0]:
+                break
+            entradas[posicion] = entradas[padre]
+            posiciones[entradas[posicion][1].id] = posicion
+            posicion = padre
+        entradas[posicion] = entrada
+        posiciones[entrada[1].id] = posicion
+
+    def _bajar(self, posicion: int):
+        entradas, posiciones = self._entradas, self._posiciones
+        cantidad = len(entradas)
+        entrada = entradas[posicion]
+        while True:
+            hijo = 2 * posicion + 1
+            if hijo >= cantidad:
+                break
+            if hijo + 1 < cantidad and entradas[hijo + 1][0] < entradas[hijo][0]:
+                hijo += 1
+            if not entradas[hijo][0] < entrada[0]:
+                break
+            entradas[posicion] = entradas[hijo]
+            posiciones[entradas[posicion][1].id] = posicion
+            posicion = hijo
+        entradas[posicion] = entrada
+        posiciones[entrada[1].id] = posicion
+
+    def __getstate__(self) -> Dict:
+        siguiente = next(self._secuencia)
+        self._secuencia = count(siguiente)
+        return {'entradas': self._entradas, 'siguiente': siguiente}
+
+    def __setstate__(self, estado: Dict):
+        self._entradas = estado['entradas']
+        self._posiciones = {proceso.id: posicion for posicion, (_, proceso) in enumerate(self._entradas)}
+        self._secuencia = count(estado['siguiente'])
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def __iter__(self) -> Iterator[Proceso]:
+        return iter(self.copiar())
+
+    def __contains__(self, proceso: Proceso) -> bool:
+        return proceso.id in self._posiciones
+
+    def __repr__(self) -> str:
+        return f"ColaPrioridad({[proceso.id for proceso in self]})"
+
+class VistaProcesos:
+    """
+    Vista de sólo lectura sobre una colección de procesos.
+
+    Permite consultar `len()`, iterar y comprobar pertenencia sin copiar la colección;
+    refleja siempre su contenido actual.
+    """
+    __slots__ = ("_procesos",)
+
+    def __init__(self, procesos):
+        self._procesos = procesos
+
+    def __len__(self) -> int:
+        return len(self._procesos)
+
+    def __iter__(self) -> Iterator[Proceso]:
+        return iter(self._procesos)
+
+    def __contains__(self, proceso: Proceso) -> bool:
+        return proceso in self._procesos
+
+    def primeros(self, cantidad: int) -> List[Proceso]:
+        """Retorna los primeros `cantidad` procesos sin recorrer el resto"""
+        if isinstance(self._procesos, ColaProcesos):
+            return self._procesos.primeros(cantidad)
+        return list(islice(self._procesos, cantidad))
+
+    def __repr__(self) -> str:
+        return f"VistaProcesos({[proceso.id for proceso in self._procesos]})"
+
+class VistaPrefijo(VistaProcesos):
+    """
+    Vista de sólo lectura de los primeros `longitud` procesos de una lista que sólo crece.
+
+    Sirve de instantánea sin copiar: lo que se agregue después a la lista no se ve.
+    """
+    __slots__ = ("_longitud",)
+
+    def __init__(self, procesos: List[Proceso]):
+        super().__init__(procesos)
+        self._longitud = len(procesos)
+
+    def __len__(self) -> int:
+        return self._longitud
+
+    def __iter__(self) -> Iterator[Proceso]:
+        return islice(self._procesos, self._longitud)
+
+    def __contains__(self, proceso: Proceso) -> bool:
+        return any(elemento == proceso for elemento in self)
+
+    def primeros(self, cantidad: int) -> List[Proceso]:
+        return self._procesos[:min(cantidad, self._longitud)]
+
+    def __repr__(self) -> str:
+        return f"VistaPrefijo({[proceso.id for proceso in self]})"
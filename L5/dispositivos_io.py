@@ -0,0 +1,334 @@
+import heapq
+import itertools
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from distribuciones import Distribucion, FuenteAleatoria, Geometrica
+from metricas import EstadisticaIncremental
+from proceso import Proceso
+
+# Cada nivel de la rueda tiene 2**BITS_NIVEL ranuras
+BITS_NIVEL = 6
+RANURAS = 1 << BITS_NIVEL
+MASCARA = RANURAS - 1
+# Con 4 niveles la rueda cubre 2**24 ciclos; los vencimientos más lejanos esperan en el último
+NIVELES = 4
+
+class RuedaTemporizadores:
+    """
+    Rueda de temporizadores jerárquica indexada por ciclo.
+
+    El nivel 0 tiene una ranura por ciclo del bloque de 64 ciclos actual; cada nivel k
+    tiene una ranura por bloque de 64**k ciclos dentro del bloque de 64**(k+1) actual.
+    Al entrar en un bloque nuevo su ranura se reparte en el nivel de abajo, así que
+    programar es O(1) y extraer los vencimientos de un ciclo es O(1) amortizado por
+    elemento. Los elementos con el mismo vencimiento salen en el orden en que se
+    programaron.
+
+    Atributos:
+        actual (int): Último ciclo cuyos vencimientos ya se extrajeron
+    """
+
+    def __init__(self):
+        self.actual = 0
+        self._niveles: List[List[List[Tuple[int, object]]]] = [
+            [[] for _ in range(RANURAS)] for _ in range(NIVELES)
+        ]
+        self._cantidades = [0] * NIVELES
+
+    def programar(self, ciclo: float, elemento: object):
+        """
+        Programa un elemento para el ciclo indicado.
+
+        Un vencimiento infinito nunca llega y no se guarda; uno ya pasado vence en el
+        próximo ciclo que se extraiga.
+        """
+        if ciclo == math.inf:
+            return
+        self._insertar(max(int(ciclo), self.actual + 1), elemento)
+
+    def _insertar(self, ciclo: int, elemento: object):
+        nivel = 0
+        while nivel < NIVELES - 1 and ciclo >> (BITS_NIVEL * (nivel + 1)) != self.actual >> (BITS_NIVEL * (nivel + 1)):
+            nivel += 1
+        ranura = (ciclo >> (BITS_NIVEL * nivel)) & MASCARA
+        self._niveles[nivel][ranura].append((ciclo, elemento))
+        self._cantidades[nivel] += 1
+
+    def _vaciar_ranura(self, nivel: int, ranura: int) -> List[Tuple[int, object]]:
+        entradas = self._niveles[nivel][ranura]
+        self._niveles[nivel][ranura] = []
+        self._cantidades[nivel] -= len(entradas)
+        return entradas
+
+    def extraer_vencidos(self, ciclo: int) -> List[object]:
+        """Avanza la rueda hasta `ciclo` y retorna, en orden, los elementos vencidos"""
+        vencidos = []
+        cantidades = self._cantidades
+        ranuras_base = self._niveles[0]
+        while self.actual < ciclo:
+            if not cantidades[0]:
+                if not any(cantidades):
+                    self.actual = ciclo
+                    break
+                # Saltar de una vez los bloques de los niveles inferiores que están vacíos
+                nivel = 1
+                while nivel < NIVELES - 1 and not cantidades[nivel]:
+                    nivel += 1
+                fin_bloque = self.actual | ((1 << (BITS_NIVEL * nivel)) - 1)
+                if fin_bloque > self.actual:
+                    self.actual = min(ciclo, fin_bloque)
+                    continue
+
+            self.actual += 1
+            if not self.actual & MASCARA:
+                # Al entrar en un bloque nuevo se reparte su ranura, de arriba hacia abajo
+                for nivel in range(NIVELES - 1, 0, -1):
+                    if self.actual & ((1 << (BITS_NIVEL * nivel)) - 1) == 0:
+                        ranura = (self.actual >> (BITS_NIVEL * nivel)) & MASCARA
+                        for vencimiento, elemento in self._vaciar_ranura(nivel, ranura):
+                            self._insertar(vencimiento, elemento)
+            ranura = self.actual & MASCARA
+            if ranuras_base[ranura]:
+                vencidos.extend(elemento for _, elemento in self._vaciar_ranura(0, ranura))
+        return vencidos
+
+    def proximo_vencimiento(self, vigente: Callable[[object], bool] = lambda elemento: True) -> float:
+        """
+        Retorna el ciclo del próximo vencimiento, o infinito si no hay ninguno.
+
+        Las entradas para las que `vigente` retorna False se descartan por el camino.
+        """
+        for nivel in range(NIVELES):
+            if not self._cantidades[nivel]:
+                continue
+            posicion = (self.actual >> (BITS_NIVEL * nivel)) & MASCARA
+            # En el último nivel puede haber vencimientos de vueltas posteriores en cualquier ranura
+            ranuras = range(RANURAS) if nivel == NIVELES - 1 else range(posicion + 1, RANURAS)
+            minimo = math.inf
+            for ranura in ranuras:
+                entradas = self._niveles[nivel][ranura]
+                if not entradas:
+                    continue
+                vigentes = [entrada for entrada in entradas if vigente(entrada[1])]
+                self._cantidades[nivel] -= len(entradas) - len(vigentes)
+                self._niveles[nivel][ranura] = vigentes
+                if vigentes:
+                    minimo = min(minimo, min(vencimiento for vencimiento, _ in vigentes))
+                    if nivel < NIVELES - 1:
+                        # Las ranuras siguientes de este nivel cubren ciclos posteriores
+                        break
+            if minimo != math.inf:
+                return minimo
+        return math.inf
+
+    def __len__(self) -> int:
+        return sum(self._cantidades)
+
+class DispositivoIO:
+    """
+    Dispositivo de I/O con su propia cola y tasa de servicio.
+
+    Cada solicitud recibe una duración de servicio muestreada una sola vez de la
+    distribución del dispositivo y se atiende en el primer servidor libre, en orden de
+    llegada; con `servidores=None` todas se atienden al instante. Como el orden es FIFO,
+    el ciclo en que termina cada solicitud se conoce en cuanto llega. Una solicitud
+    abandonada (el proceso se suspende) conserva su turno en el dispositivo.
+
+    Atributos:
+        nombre (str): Nombre del dispositivo
+        distribucion (Distribucion): Distribución de la duración de servicio, en ciclos
+        servidores (Optional[int]): Solicitudes que atiende a la vez (None: sin límite)
+        peso (float): Proporción relativa de las operaciones de I/O que recibe
+        solicitudes (int): Solicitudes recibidas
+        espera (EstadisticaIncremental): Ciclos que cada solicitud esperó en cola
+        servicio (EstadisticaIncremental): Duración de servicio de cada solicitud
+    """
+
+    def __init__(self, nombre: str, distribucion: Optional[Distribucion] = None,
+                 servidores: Optional[int] = None, peso: float = 1.0):
+        """
+        Args:
+            nombre (str): Nombre del dispositivo
+            distribucion (Optional[Distribucion]): Duración de servicio (por defecto,
+                geométrica con 30% de probabilidad de terminar en cada ciclo)
+            servidores (Optional[int]): Solicitudes simultáneas (None: sin límite)
+            peso (float): Proporción relativa de las operaciones de I/O que recibe
+        """
+        if servidores is not None and servidores < 1:
+            raise ValueError(f"El número de servidores debe ser positivo: {servidores}")
+        if peso <= 0:
+            raise ValueError(f"El peso debe ser positivo: {peso}")
+        self.nombre = nombre
+        self.distribucion = distribucion if distribucion is not None else Geometrica(0.3)
+        self.servidores = servidores
+        self.peso = peso
+        self.solicitudes = 0
+        self.espera = EstadisticaIncremental()
+        self.servicio = EstadisticaIncremental()
+        # Ciclo en que queda libre cada servidor
+        self._libres: List[float] = [0] * servidores if servidores is not None else []
+        # Solicitudes que aún no empezaron (inicio, fin) y en servicio (fin, inicio)
+        self._por_iniciar: List[Tuple[float, float]] = []
+        self._en_servicio: List[Tuple[float, float]] = []
+        self._ocupado_terminado = 0.0
+        self._suma_inicios = 0.0
+
+    def atender(self, ciclo: int, duracion: float) -> float:
+        """
+        Encola una solicitud que llega en `ciclo` y dura `duracion` ciclos de servicio.
+
+        Returns:
+            float: Ciclo en que termina la solicitud
+        """
+        self._avanzar(ciclo)
+        if self.servidores is None:
+            inicio = ciclo
+        else:
+            inicio = max(ciclo, self._libres[0])
+            heapq.heapreplace(self._libres, inicio + duracion)
+        fin = inicio + duracion
+
+        self.solicitudes += 1
+        self.espera.agregar(inicio - ciclo)
+        if duracion != math.inf:
+            self.servicio.agregar(duracion)
+        if inicio > ciclo:
+            heapq.heappush(self._por_iniciar, (inicio, fin))
+        else:
+            heapq.heappush(self._en_servicio, (fin, inicio))
+            self._suma_inicios += inicio
+        return fin
+
+    def _avanzar(self, ciclo: int):
+        """Pasa a servicio las solicitudes que empezaron y cierra las que terminaron hasta `ciclo`"""
+        while self._por_iniciar and self._por_iniciar[0][0] <= ciclo:
+            inicio, fin = heapq.heappop(self._por_iniciar)
+            heapq.heappush(self._en_servicio, (fin, inicio))
+            self._suma_inicios += inicio
+        while self._en_servicio and self._en_servicio[0][0] <= ciclo:
+            fin, inicio = heapq.heappop(self._en_servicio)
+            self._ocupado_terminado += fin - inicio
+            self._suma_inicios -= inicio
+
+    def ciclos_ocupado(self, ciclo: int) -> float:
+        """Ciclos de servicio entregados hasta `ciclo`, sumando todos los servidores"""
+        self._avanzar(ciclo)
+        return self._ocupado_terminado + len(self._en_servicio) * ciclo - self._suma_inicios
+
+    def obtener_estadisticas(self, ciclo: int) -> Dict:
+        """
+        Retorna las métricas del dispositivo hasta `ciclo`.
+
+        La utilización es la fracción de la capacidad usada (None si no hay límite de
+        servidores); la ocupación media es el número medio de solicitudes en servicio.
+        """
+        ocupado = self.ciclos_ocupado(ciclo)
+        ciclos = ciclo or 1
+        return {
+            'nombre': self.nombre,
+            'servidores': self.servidores,
+            'solicitudes': self.solicitudes,
+            'en_cola': len(self._por_iniciar),
+            'en_servicio': len(self._en_servicio),
+            'utilizacion': ocupado / (ciclos * self.servidores) if self.servidores is not None else None,
+            'ocupacion_media': ocupado / ciclos,
+            'espera_media': self.espera.media,
+            'espera_maxima': self.espera.maximo if self.espera.cantidad else 0,
+            'servicio_medio': self.servicio.media,
+        }
+
+    def __repr__(self) -> str:
+        return f"DispositivoIO({self.nombre!r}, {self.distribucion!r}, servidores={self.servidores})"
+
+class SubsistemaIO:
+    """
+    Dispositivos de I/O de un planificador y los vencimientos de sus solicitudes.
+
+    Cuando un proceso pide I/O se elige un dispositivo según su peso, se calcula una
+    sola vez el ciclo en que termina la operación y se programa en una rueda de
+    temporizadores; en cada ciclo sólo se tocan las operaciones que terminan en él.
+
+    Atributos:
+        dispositivos (List[DispositivoIO]): Dispositivos, en orden
+        rueda (RuedaTemporizadores): Fines de I/O programados
+    """
+
+    def __init__(self, dispositivos: Optional[Sequence[DispositivoIO]] = None):
+        """
+        Args:
+            dispositivos (Optional[Sequence[DispositivoIO]]): Dispositivos de I/O (por
+                defecto, un disco sin límite de servidores con fin de I/O geométrico al 30%)
+        """
+        self.dispositivos = list(dispositivos) if dispositivos else [DispositivoIO("disco")]
+        nombres = [dispositivo.nombre for dispositivo in self.dispositivos]
+        if len(set(nombres)) != len(nombres):
+            raise ValueError(f"Hay dispositivos con el mismo nombre: {nombres}")
+        self._pesos = list(itertools.accumulate(dispositivo.peso for dispositivo in self.dispositivos))
+        self.rueda = RuedaTemporizadores()
+        # Solicitud vigente de cada proceso en ESPERANDO: (ficha, dispositivo)
+        self._pendientes: Dict[int, Tuple[int, DispositivoIO]] = {}
+        self._fichas = itertools.count()
+
+    def __getstate__(self) -> Dict:
+        estado = self.__dict__.copy()
+        siguiente = next(self._fichas)
+        self._fichas = itertools.count(siguiente)
+        estado['_fichas'] = siguiente
+        return estado
+
+    def __setstate__(self, estado: Dict):
+        self.__dict__.update(estado)
+        self._fichas = itertools.count(estado['_fichas'])
+
+    def dispositivo(self, nombre: str) -> DispositivoIO:
+        """Retorna el dispositivo con el nombre dado"""
+        for dispositivo in self.dispositivos:
+            if dispositivo.nombre == nombre:
+                return dispositivo
+        raise KeyError(nombre)
+
+    def solicitar(self, proceso: Proceso, ciclo: int, aleatorio: FuenteAleatoria) -> float:
+        """
+        Registra una operación de I/O de un proceso que llega en `ciclo`.
+
+        Returns:
+            float: Ciclo en que termina la operación (infinito si nunca termina)
+        """
+        indice = aleatorio.dispositivo_io(self._pesos) if len(self.dispositivos) > 1 else 0
+        dispositivo = self.dispositivos[indice]
+        fin = dispositivo.atender(ciclo, aleatorio.duracion_io(dispositivo.distribucion))
+        ficha = next(self._fichas)
+        self._pendientes[proceso.id] = (ficha, dispositivo)
+        self.rueda.programar(fin, (ficha, proceso))
+        return fin
+
+    def cancelar(self, proceso: Proceso):
+        """Descarta la operación pendiente de un proceso (por ejemplo, al suspenderlo)"""
+        self._pendientes.pop(proceso.id, None)
+
+    def dispositivo_de(self, proceso: Proceso) -> Optional[DispositivoIO]:
+        """Retorna el dispositivo que atiende la operación pendiente de un proceso"""
+        pendiente = self._pendientes.get(proceso.id)
+        return pendiente[1] if pendiente is not None else None
+
+    def _vigente(self, entrada: Tuple[int, Proceso]) -> bool:
+        ficha, proceso = entrada
+        pendiente = self._pendientes.get(proceso.id)
+        return pendiente is not None and pendiente[0] == ficha
+
+    def extraer_completados(self, ciclo: int) -> List[Proceso]:
+        """Retorna, en orden de llegada, los procesos cuya operación de I/O terminó hasta `ciclo`"""
+        completados = []
+        for entrada in self.rueda.extraer_vencidos(ciclo):
+            if self._vigente(entrada):
+                del self._pendientes[entrada[1].id]
+                completados.append(entrada[1])
+        return completados
+
+    def proximo_completado(self) -> float:
+        """Retorna el ciclo de la próxima operación de I/O vigente que termina, o infinito"""
+        return self.rueda.proximo_vencimiento(self._vigente)
+
+    def obtener_estadisticas(self, ciclo: int) -> List[Dict]:
+        """Retorna las métricas de cada dispositivo hasta `ciclo`"""
+        return [dispositivo.obtener_estadisticas(ciclo) for dispositivo in self.dispositivos]
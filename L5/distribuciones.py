@@ -0,0 +1,249 @@
+import bisect
+import itertools
+import math
+import random
+from typing import Optional, Sequence, Union
+
+
+def geometrica(probabilidad: float, generador: random.Random = random) -> float:
+    """
+    Muestrea el número de ciclos hasta el primer éxito de un ensayo de Bernoulli.
+
+    Equivale a repetir ``random.random() < probabilidad`` una vez por ciclo y contar
+    cuántos ciclos pasan hasta el primer acierto, pero consume un único número aleatorio.
+
+    Args:
+        probabilidad (float): Probabilidad de éxito en cada ciclo
+        generador (random.Random): Generador del que se toma el número aleatorio
+
+    Returns:
+        float: Ciclos hasta el evento (>= 1), o ``math.inf`` si nunca ocurre
+    """
+    if probabilidad <= 0:
+        return math.inf
+    if probabilidad >= 1:
+        return 1
+    return int(math.log(1.0 - generador.random()) / math.log(1.0 - probabilidad)) + 1
+
+class Geometrica:
+    """
+    Duración en ciclos de algo que termina con una probabilidad fija en cada ciclo.
+
+    Atributos:
+        probabilidad (float): Probabilidad de terminar en cada ciclo
+    """
+
+    def __init__(self, probabilidad: float):
+        if not 0 <= probabilidad <= 1:
+            raise ValueError(f"La probabilidad debe estar entre 0 y 1: {probabilidad}")
+        self.probabilidad = probabilidad
+
+    def muestrear(self, generador: random.Random) -> float:
+        return geometrica(self.probabilidad, generador)
+
+    def __repr__(self) -> str:
+        return f"Geometrica({self.probabilidad})"
+
+class Exponencial:
+    """
+    Duración exponencial con la media indicada, redondeada hacia arriba a ciclos enteros.
+
+    Atributos:
+        media (float): Duración media en ciclos (antes de redondear)
+    """
+
+    def __init__(self, media: float):
+        if media <= 0:
+            raise ValueError(f"La media debe ser positiva: {media}")
+        self.media = media
+
+    def muestrear(self, generador: random.Random) -> float:
+        return max(1, math.ceil(generador.expovariate(1.0 / self.media)))
+
+    def __repr__(self) -> str:
+        return f"Exponencial({self.media})"
+
+class Empirica:
+    """
+    Duración tomada de una lista de valores observados, con pesos opcionales.
+
+    Atributos:
+        valores (List[int]): Duraciones posibles en ciclos
+        acumulados (List[float]): Pesos acumulados de cada valor
+    """
+
+    def __init__(self, valores: Sequence[int], pesos: Optional[Sequence[float]] = None):
+        if not valores:
+            raise ValueError("Se necesita al menos un valor")
+        if pesos is not None and len(pesos) != len(valores):
+            raise ValueError("Debe haber un peso por valor")
+        if min(valores) < 1:
+            raise ValueError("Las duraciones deben ser de al menos un ciclo")
+        self.valores = list(valores)
+        self.acumulados = list(itertools.accumulate(pesos if pesos is not None else [1] * len(valores)))
+
+    def muestrear(self, generador: random.Random) -> float:
+        indice = bisect.bisect_right(self.acumulados, generador.random() * self.acumulados[-1])
+        return self.valores[min(indice, len(self.valores) - 1)]
+
+    def __repr__(self) -> str:
+        return f"Empirica({self.valores})"
+
+class Uniforme:
+    """
+    Entero uniforme entre dos valores, ambos incluidos.
+
+    Atributos:
+        minimo (int): Valor mínimo
+        maximo (int): Valor máximo
+    """
+
+    def __init__(self, minimo: int, maximo: int):
+        if not 1 <= minimo <= maximo:
+            raise ValueError(f"Se necesita 1 <= minimo <= maximo: {minimo}, {maximo}")
+        self.minimo = minimo
+        self.maximo = maximo
+
+    def muestrear(self, generador: random.Random) -> float:
+        return generador.randint(self.minimo, self.maximo)
+
+    def __repr__(self) -> str:
+        return f"Uniforme({self.minimo}, {self.maximo})"
+
+class Pareto:
+    """
+    Duración de Pareto (cola pesada): la mayoría cortas y unas pocas muy largas.
+
+    Atributos:
+        alfa (float): Índice de la cola (cuanto menor, más pesada; sin varianza si es <= 2)
+        minimo (float): Duración mínima en ciclos
+        maximo (Optional[int]): Tope de la duración (sin tope si es None)
+    """
+
+    def __init__(self, alfa: float, minimo: float = 1, maximo: Optional[int] = None):
+        if alfa <= 0 or minimo <= 0:
+            raise ValueError(f"alfa y minimo deben ser positivos: {alfa}, {minimo}")
+        self.alfa = alfa
+        self.minimo = minimo
+        self.maximo = maximo
+
+    def muestrear(self, generador: random.Random) -> float:
+        duracion = max(1, math.ceil(self.minimo * generador.paretovariate(self.alfa)))
+        return duracion if self.maximo is None else min(duracion, self.maximo)
+
+    def __repr__(self) -> str:
+        return f"Pareto({self.alfa}, {self.minimo})"
+
+class LogNormal:
+    """
+    Duración lognormal, redondeada hacia arriba a ciclos enteros.
+
+    Atributos:
+        mu (float): Media del logaritmo de la duración
+        sigma (float): Desviación estándar del logaritmo de la duración
+        maximo (Optional[int]): Tope de la duración (sin tope si es None)
+    """
+
+    def __init__(self, mu: float, sigma: float, maximo: Optional[int] = None):
+        if sigma < 0:
+            raise ValueError(f"sigma no puede ser negativa: {sigma}")
+        self.mu = mu
+        self.sigma = sigma
+        self.maximo = maximo
+
+    def muestrear(self, generador: random.Random) -> float:
+        duracion = max(1, math.ceil(generador.lognormvariate(self.mu, self.sigma)))
+        return duracion if self.maximo is None else min(duracion, self.maximo)
+
+    def __repr__(self) -> str:
+        return f"LogNormal({self.mu}, {self.sigma})"
+
+Distribucion = Union[Geometrica, Exponencial, Empirica, Uniforme, Pareto, LogNormal]
+
+# Tipos de decisión aleatoria de una simulación (también indexan las series de una traza)
+EJECUCION, PRIORIDAD, ADMISION, SWAPPING, DECISION_SWAPPING, IO, FIN_IO, DISPOSITIVO_IO, MEMORIA = range(9)
+NOMBRES_DECISIONES = ['ejecucion', 'prioridad', 'admision', 'swapping', 'decision_swapping',
+                      'io', 'fin_io', 'dispositivo_io', 'memoria']
+
+class FuenteAleatoria:
+    """
+    Fuente de todas las decisiones aleatorias de una simulación.
+
+    Cada simulación tiene su propio generador, así que dos simulaciones con la misma
+    semilla dan el mismo resultado aunque se ejecuten a la vez o intercaladas. Todas las
+    decisiones pasan por `_valor`, de modo que una subclase puede grabarlas o
+    reproducirlas desde una traza (ver traza.py).
+
+    Atributos:
+        generador (random.Random): Generador de números aleatorios de la simulación
+    """
+
+    def __init__(self, semilla: Optional[int] = None):
+        """
+        Args:
+            semilla (Optional[int]): Semilla del generador (aleatoria si es None)
+        """
+        self.generador = random.Random(semilla)
+
+    def _valor(self, tipo: int, parametro: float) -> float:
+        """Genera el valor de una decisión del tipo indicado"""
+        generador = self.generador
+        if tipo == EJECUCION:
+            return generador.randint(5, 20)
+        if tipo == PRIORIDAD:
+            return generador.randint(1, 5)
+        if tipo in (ADMISION, SWAPPING):
+            return geometrica(parametro, generador)
+        if tipo == FIN_IO:
+            return parametro.muestrear(generador)
+        if tipo == DISPOSITIVO_IO:
+            # parametro: pesos acumulados de los dispositivos
+            return min(bisect.bisect_right(parametro, generador.random() * parametro[-1]), len(parametro) - 1)
+        if tipo == MEMORIA:
+            # parametro: (mínimo, máximo) de marcos
+            return generador.randint(*parametro)
+        return 1.0 if generador.random() < parametro else 0.0
+
+    def tiempo_ejecucion(self) -> int:
+        """Tiempo de CPU que necesita un proceso nuevo"""
+        return int(self._valor(EJECUCION, 0))
+
+    def prioridad(self) -> int:
+        """Prioridad de un proceso nuevo"""
+        return int(self._valor(PRIORIDAD, 0))
+
+    def ciclos_hasta_admision(self, probabilidad: float) -> float:
+        """Ciclos hasta la próxima admisión"""
+        return self._valor(ADMISION, probabilidad)
+
+    def ciclos_hasta_swapping(self, probabilidad: float) -> float:
+        """Ciclos hasta la próxima operación de swapping"""
+        return self._valor(SWAPPING, probabilidad)
+
+    def decision_swapping(self, probabilidad: float) -> bool:
+        """Decide si se suspende o reanuda el proceso en la cabeza de una cola"""
+        return self._valor(DECISION_SWAPPING, probabilidad) != 0
+
+    def necesita_io(self, probabilidad: float) -> bool:
+        """Decide si un proceso que acaba de ejecutar pide una operación de I/O"""
+        return self._valor(IO, probabilidad) != 0
+
+    def duracion_io(self, distribucion: Union[Distribucion, float]) -> float:
+        """
+        Ciclos que dura una operación de I/O.
+
+        Args:
+            distribucion (Union[Distribucion, float]): Distribución de la duración, o la
+                probabilidad por ciclo de terminarla (duración geométrica)
+        """
+        if not hasattr(distribucion, "muestrear"):
+            distribucion = Geometrica(distribucion)
+        return self._valor(FIN_IO, distribucion)
+
+    def dispositivo_io(self, pesos_acumulados: Sequence[float]) -> int:
+        """Elige el índice del dispositivo que atiende una operación de I/O"""
+        return int(self._valor(DISPOSITIVO_IO, pesos_acumulados))
+
+    def marcos_proceso(self, minimo: int, maximo: int) -> int:
+        """Marcos de memoria que ocupa un proceso"""
+        return int(self._valor(MEMORIA, (minimo, maximo)))
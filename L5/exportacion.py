@@ -0,0 +1,387 @@
+"""
+Exportación de una simulación a tablas por columnas, para analizarla con NumPy, pandas,
+Polars, DuckDB, etc.
+
+Se escriben tres tablas en un directorio:
+
+    procesos       una fila por proceso: tiempos, estado final y ciclos en cada estado
+    ciclos         una fila por ciclo ejecutado con sus estadísticas
+    transiciones   una fila por transición de estado (ciclo, pid, desde, hacia)
+
+El formato es Parquet o Arrow IPC (con pyarrow, opcional) o un .npz de NumPy. Todo se
+escribe en lotes: las estadísticas se vuelcan a medida que avanza la simulación y las
+transiciones se leen del registro en disco, así que un historial de varios GB nunca se
+tiene entero en memoria. Al cargar, el .npz y el formato Arrow se mapean en memoria
+sin copiar las columnas.
+
+Uso:
+
+    simulador = Simulador(ciclos=100000, semilla=1)
+    with ExportadorSimulacion(simulador, "resultados", formato="npz"):
+        simulador.simular(50000)
+    tablas = cargar("resultados")
+    tablas['procesos']['tiempo_espera'].mean()
+"""
+import os
+import shutil
+import struct
+import tempfile
+import zipfile
+from typing import Dict, List, Optional
+import numpy as np
+from proceso import EstadoProceso, CODIGO_ESTADO
+from tabla_procesos import SIN_VALOR
+
+FORMATOS = ("parquet", "arrow", "npz")
+
+EXTENSIONES = {"parquet": ".parquet", "arrow": ".arrow", "npz": ".npz"}
+
+# Columna -> tipo NumPy de cada tabla. Los tiempos opcionales usan SIN_VALOR (-1) para None
+# y los estados se guardan con su código (CODIGO_ESTADO; -1 es "sin estado" en una admisión)
+ESQUEMA_PROCESOS = {
+    'id': 'i8',
+    'tiempo_ejecucion': 'i8',
+    'prioridad': 'i8',
+    'estado': 'i1',
+    'tiempo_restante': 'i8',
+    'tiempo_creacion': 'i8',
+    'tiempo_espera': 'i8',
+    'tiempo_respuesta': 'i8',
+    'tiempo_finalizacion': 'i8',
+    'tiempo_swap': 'i8',
+    **{f"tiempo_{estado.value.lower()}": 'i8' for estado in EstadoProceso},
+}
+
+ESTADISTICAS_CICLO = ('tiempo_espera_promedio', 'tiempo_respuesta_promedio', 'throughput')
+
+ESQUEMA_CICLOS = {'ciclo': 'i8', **{clave: 'f8' for clave in ESTADISTICAS_CICLO}}
+
+ESQUEMA_TRANSICIONES = {'ciclo': 'i8', 'pid': 'i8', 'desde': 'i1', 'hacia': 'i1'}
+
+# Cabecera local de un miembro ZIP: la longitud del nombre y del campo extra están al final
+_CABECERA_ZIP = struct.Struct("<4s22xHH")
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Los formatos parquet y arrow necesitan pyarrow (pip install pyarrow); "
+                          "use formato='npz'") from None
+    return pyarrow
+
+def formato_por_defecto() -> str:
+    """Retorna "parquet" si pyarrow está instalado y "npz" si no"""
+    try:
+        _pyarrow()
+    except ImportError:
+        return "npz"
+    return "parquet"
+
+def _validar_formato(formato: str):
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconocido: {formato}. Opciones: {', '.join(FORMATOS)}")
+
+class EscritorTabla:
+    """
+    Escribe una tabla por columnas de a lotes.
+
+    Con Parquet cada lote es un grupo de filas y con Arrow un lote del archivo IPC. El .npz
+    necesita saber cuántas filas tiene cada columna antes de escribirla, así que cada
+    columna se acumula en un archivo temporal y al cerrar se copia al .npz sin comprimir.
+
+    Atributos:
+        ruta (str): Archivo de salida
+        esquema (Dict[str, str]): Columna -> tipo NumPy
+        formato (str): "parquet", "arrow" o "npz"
+        filas (int): Filas escritas hasta ahora
+    """
+
+    def __init__(self, ruta: str, esquema: Dict[str, str], formato: str):
+        _validar_formato(formato)
+        self.ruta = ruta
+        self.esquema = {columna: np.dtype(tipo) for columna, tipo in esquema.items()}
+        self.formato = formato
+        self.filas = 0
+        if formato == "npz":
+            self._temporales = {columna: tempfile.TemporaryFile() for columna in self.esquema}
+            return
+        pa = _pyarrow()
+        self._esquema_arrow = pa.schema([(columna, pa.from_numpy_dtype(tipo)) for columna, tipo in self.esquema.items()])
+        if formato == "arrow":
+            self._escritor = pa.ipc.new_file(ruta, self._esquema_arrow)
+        else:
+            self._escritor = pa.parquet.ParquetWriter(ruta, self._esquema_arrow)
+
+    def escribir(self, lote: Dict):
+        """
+        Agrega filas a la tabla.
+
+        Args:
+            lote (Dict): Columna -> valores (arreglo o secuencia), todas del mismo largo
+        """
+        columnas = [np.asarray(lote[columna], dtype=tipo) for columna, tipo in self.esquema.items()]
+        filas = len(columnas[0])
+        if any(len(columna) != filas for columna in columnas):
+            raise ValueError("Todas las columnas de un lote deben tener el mismo largo")
+        if filas == 0:
+            return
+        if self.formato == "npz":
+            for temporal, columna in zip(self._temporales.values(), columnas):
+                temporal.write(np.ascontiguousarray(columna).data)
+        else:
+            pa = _pyarrow()
+            lote_arrow = pa.record_batch([pa.array(columna) for columna in columnas], schema=self._esquema_arrow)
+            if self.formato == "arrow":
+                self._escritor.write_batch(lote_arrow)
+            else:
+                self._escritor.write_table(pa.Table.from_batches([lote_arrow]))
+        self.filas += filas
+
+    def cerrar(self):
+        """Termina el archivo; después de cerrar no se pueden escribir más filas"""
+        if self.formato != "npz":
+            self._escritor.close()
+            return
+        with zipfile.ZipFile(self.ruta, "w", zipfile.ZIP_STORED, allowZip64=True) as archivo:
+            for columna, temporal in self._temporales.items():
+                temporal.seek(0)
+                with archivo.open(f"{columna}.npy", "w", force_zip64=True) as miembro:
+                    np.lib.format.write_array_header_1_0(miembro, {
+                        'descr': np.lib.format.dtype_to_descr(self.esquema[columna]),
+                        'fortran_order': False,
+                        'shape': (self.filas,),
+                    })
+                    shutil.copyfileobj(temporal, miembro, 1 << 20)
+                temporal.close()
+
+    def __enter__(self) -> "EscritorTabla":
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+def _leer_npz(ruta: str) -> Dict[str, np.ndarray]:
+    columnas = {}
+    with zipfile.ZipFile(ruta) as contenedor, open(ruta, "rb") as archivo:
+        for info in contenedor.infolist():
+            nombre = info.filename[:-len(".npy")] if info.filename.endswith(".npy") else info.filename
+            if info.compress_type != zipfile.ZIP_STORED:
+                # Un .npz comprimido (p. ej. de np.savez_compressed) no se puede mapear
+                with contenedor.open(info) as miembro:
+                    columnas[nombre] = np.lib.format.read_array(miembro)
+                continue
+            archivo.seek(info.header_offset)
+            _, largo_nombre, largo_extra = _CABECERA_ZIP.unpack(archivo.read(_CABECERA_ZIP.size))
+            archivo.seek(largo_nombre + largo_extra, os.SEEK_CUR)
+            version = np.lib.format.read_magic(archivo)
+            if version == (1, 0):
+                forma, fortran, tipo = np.lib.format.read_array_header_1_0(archivo)
+            else:
+                forma, fortran, tipo = np.lib.format.read_array_header_2_0(archivo)
+            if tipo.hasobject:
+                raise ValueError(f"{ruta}: la columna {nombre} tiene objetos de Python")
+            if 0 in forma:
+                columnas[nombre] = np.empty(forma, dtype=tipo)
+            else:
+                columnas[nombre] = np.memmap(ruta, dtype=tipo, mode="r", offset=archivo.tell(), shape=forma,
+                                             order="F" if fortran else "C")
+    return columnas
+
+def _columnas_arrow(tabla) -> Dict[str, np.ndarray]:
+    columnas = {}
+    for nombre, columna in zip(tabla.column_names, tabla.columns):
+        if columna.num_chunks == 1 and columna.null_count == 0:
+            columnas[nombre] = columna.chunk(0).to_numpy(zero_copy_only=True)
+        else:
+            columnas[nombre] = columna.to_numpy()
+    return columnas
+
+def leer_tabla(ruta: str) -> Dict[str, np.ndarray]:
+    """
+    Carga una tabla escrita con EscritorTabla (el formato se deduce de la extensión).
+
+    Con .npz sin comprimir y con Arrow las columnas son vistas de solo lectura sobre el
+    archivo mapeado en memoria: no se copian y sólo se leen del disco las partes que se
+    usan. Parquet está comprimido por columnas y siempre se decodifica.
+
+    Returns:
+        Dict[str, np.ndarray]: Columna -> arreglo
+    """
+    extension = os.path.splitext(ruta)[1]
+    if extension == EXTENSIONES["npz"]:
+        return _leer_npz(ruta)
+    pa = _pyarrow()
+    if extension == EXTENSIONES["arrow"]:
+        return _columnas_arrow(pa.ipc.open_file(pa.memory_map(ruta, "r")).read_all())
+    if extension == EXTENSIONES["parquet"]:
+        return _columnas_arrow(pa.parquet.read_table(ruta, memory_map=True))
+    raise ValueError(f"Extensión desconocida: {ruta}. Opciones: {', '.join(EXTENSIONES.values())}")
+
+def _lotes_procesos(simulador, tamano: int):
+    """Genera la tabla de procesos de a `tamano` filas"""
+    ciclo = simulador.planificador.ciclo_actual
+    tabla = simulador.tabla
+    if tabla is not None:
+        # Los procesos ya están en columnas: se calcula todo con NumPy
+        columnas = tabla.como_numpy()
+        estados = columnas['estados']
+        en_curso = np.maximum(0, ciclo + 1 - columnas['ciclos_estado'])
+        tiempos_estado = columnas['tiempos_estado'].copy()
+        tiempos_estado[np.arange(len(estados)), estados] += en_curso
+        derivadas = {
+            'id': columnas['ids'],
+            'tiempo_ejecucion': columnas['tiempos_ejecucion'],
+            'prioridad': columnas['prioridades'],
+            'estado': estados,
+            'tiempo_restante': columnas['tiempos_restantes'],
+            'tiempo_creacion': columnas['tiempos_creacion'],
+            'tiempo_espera': columnas['tiempos_espera'] + np.where(
+                estados == CODIGO_ESTADO[EstadoProceso.LISTO], en_curso, 0),
+            'tiempo_respuesta': columnas['tiempos_respuesta'],
+            'tiempo_finalizacion': columnas['tiempos_finalizacion'],
+            'tiempo_swap': columnas['tiempos_swap'],
+            **{f"tiempo_{estado.value.lower()}": tiempos_estado[:, codigo] for estado, codigo in CODIGO_ESTADO.items()},
+        }
+        del columnas, estados
+        if tabla.libres:
+            # Filas de procesos terminados que se descartaron (Simulador(conservar_terminados=False))
+            vigentes = np.ones(len(tabla), dtype=bool)
+            vigentes[tabla.libres] = False
+            derivadas = {columna: valores[vigentes] for columna, valores in derivadas.items()}
+        for inicio in range(0, len(derivadas['id']), tamano):
+            # Copias, para que la tabla pueda volver a crecer aunque alguien retenga un lote
+            yield {columna: np.array(valores[inicio:inicio + tamano], dtype=ESQUEMA_PROCESOS[columna])
+                   for columna, valores in derivadas.items()}
+        return
+    procesos = list(simulador.procesos.values())
+    for inicio in range(0, len(procesos), tamano):
+        lote = procesos[inicio:inicio + tamano]
+        yield {
+            'id': [proceso.id for proceso in lote],
+            'tiempo_ejecucion': [proceso.tiempo_ejecucion for proceso in lote],
+            'prioridad': [proceso.prioridad for proceso in lote],
+            'estado': [CODIGO_ESTADO[proceso.estado] for proceso in lote],
+            'tiempo_restante': [proceso.tiempo_restante for proceso in lote],
+            'tiempo_creacion': [proceso.tiempo_creacion for proceso in lote],
+            'tiempo_espera': [proceso.tiempo_espera_hasta(ciclo) for proceso in lote],
+            'tiempo_respuesta': [SIN_VALOR if proceso.tiempo_respuesta is None else proceso.tiempo_respuesta
+                                 for proceso in lote],
+            'tiempo_finalizacion': [SIN_VALOR if proceso.tiempo_finalizacion is None else proceso.tiempo_finalizacion
+                                    for proceso in lote],
+            'tiempo_swap': [proceso.tiempo_swap for proceso in lote],
+            **{f"tiempo_{estado.value.lower()}": [proceso.tiempo_en_estado(estado, ciclo) for proceso in lote]
+               for estado in EstadoProceso},
+        }
+
+class ExportadorSimulacion:
+    """
+    Exporta una simulación mientras se ejecuta.
+
+    Se suscribe a los ciclos del simulador y vuelca las estadísticas cada `tamano_lote`
+    ciclos; al cerrar escribe los procesos y copia las transiciones del registro en disco.
+    Con el motor de eventos sólo hay filas para los ciclos ejecutados (ver
+    `Simulador.estadisticas_del_ciclo`).
+
+    Atributos:
+        simulador (Simulador): Simulación exportada
+        directorio (str): Directorio de salida
+        formato (str): "parquet", "arrow" o "npz"
+        tamano_lote (int): Filas por lote
+        rutas (Dict[str, str]): Tabla -> archivo
+    """
+
+    def __init__(self, simulador, directorio: str, formato: Optional[str] = None, tamano_lote: int = 1 << 16):
+        if tamano_lote < 1:
+            raise ValueError(f"El tamaño de lote debe ser positivo: {tamano_lote}")
+        if simulador.registro is None:
+            raise ValueError("La exportación necesita el registro de transiciones: cree el Simulador con historial=True")
+        self.simulador = simulador
+        self.directorio = directorio
+        self.formato = formato or formato_por_defecto()
+        _validar_formato(self.formato)
+        self.tamano_lote = tamano_lote
+        os.makedirs(directorio, exist_ok=True)
+        self.rutas = {tabla: os.path.join(directorio, tabla + EXTENSIONES[self.formato])
+                      for tabla in ("procesos", "ciclos", "transiciones")}
+        self._ciclos = EscritorTabla(self.rutas['ciclos'], ESQUEMA_CICLOS, self.formato)
+        self._pendientes: Dict[str, List] = {columna: [] for columna in ESQUEMA_CICLOS}
+        self._cerrado = False
+        simulador.suscribir_ciclos(self.registrar_ciclo)
+
+    def registrar_ciclo(self, ciclo: int, estadisticas: Dict):
+        """Agrega la fila de un ciclo (lo llama el simulador al terminar cada ciclo)"""
+        pendientes = self._pendientes
+        pendientes['ciclo'].append(ciclo)
+        for clave in ESTADISTICAS_CICLO:
+            pendientes[clave].append(estadisticas[clave])
+        if len(pendientes['ciclo']) >= self.tamano_lote:
+            self._volcar_ciclos()
+
+    def _volcar_ciclos(self):
+        self._ciclos.escribir(self._pendientes)
+        self._pendientes = {columna: [] for columna in ESQUEMA_CICLOS}
+
+    def cerrar(self) -> Dict[str, str]:
+        """
+        Termina la exportación con el estado actual de la simulación.
+
+        Returns:
+            Dict[str, str]: Tabla -> archivo
+        """
+        if self._cerrado:
+            return self.rutas
+        self._cerrado = True
+        self.simulador.desuscribir_ciclos(self.registrar_ciclo)
+        self._volcar_ciclos()
+        self._ciclos.cerrar()
+        with EscritorTabla(self.rutas['procesos'], ESQUEMA_PROCESOS, self.formato) as procesos:
+            for lote in _lotes_procesos(self.simulador, self.tamano_lote):
+                procesos.escribir(lote)
+        lector = self.simulador.registro.lector()
+        try:
+            with EscritorTabla(self.rutas['transiciones'], ESQUEMA_TRANSICIONES, self.formato) as transiciones:
+                for lote in lector.lotes_transiciones(self.tamano_lote):
+                    transiciones.escribir({columna: lote[columna] for columna in ESQUEMA_TRANSICIONES})
+        finally:
+            lector.cerrar()
+        return self.rutas
+
+    def __enter__(self) -> "ExportadorSimulacion":
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+def exportar(simulador, directorio: str, formato: Optional[str] = None, tamano_lote: int = 1 << 16) -> Dict[str, str]:
+    """
+    Exporta una simulación ya ejecutada (las estadísticas salen de su historial).
+
+    Args:
+        simulador (Simulador): Simulación a exportar
+        directorio (str): Directorio de salida (se crea si no existe)
+        formato (Optional[str]): "parquet", "arrow" o "npz" (parquet si pyarrow está instalado)
+        tamano_lote (int): Filas por lote
+
+    Returns:
+        Dict[str, str]: Tabla -> archivo
+    """
+    exportador = ExportadorSimulacion(simulador, directorio, formato, tamano_lote)
+    for ciclo, estadisticas in zip(simulador._ciclos_estadisticas, simulador.historial_estadisticas):
+        exportador.registrar_ciclo(ciclo, estadisticas)
+    return exportador.cerrar()
+
+def cargar(directorio: str) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Carga las tablas exportadas en un directorio (ver `leer_tabla`).
+
+    Returns:
+        Dict[str, Dict[str, np.ndarray]]: Tabla -> columna -> arreglo
+    """
+    tablas = {}
+    for nombre in sorted(os.listdir(directorio)):
+        tabla, extension = os.path.splitext(nombre)
+        if extension in EXTENSIONES.values():
+            tablas[tabla] = leer_tabla(os.path.join(directorio, nombre))
+    return tablas
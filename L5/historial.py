@@ -0,0 +1,391 @@
+import bisect
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Sequence
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+from proceso import Proceso, EstadoProceso, CODIGO_ESTADO
+
+MAGICO = b"HISTPROC1\n"
+
+# Transición: b'T', ciclo, pid, estado anterior, estado nuevo
+TRANSICION = struct.Struct("<cqqbb")
+# Fotograma clave: b'K', ciclo, bytes del contenido; el contenido tiene, por cada estado,
+# la cantidad de procesos y sus ids en el orden de la cola
+CLAVE = struct.Struct("<cqI")
+CONTEO = struct.Struct("<I")
+
+# Estado anterior de un proceso recién admitido
+SIN_ESTADO = -1
+
+# Nombres de las colas en obtener_estado_actual, en el orden de CODIGO_ESTADO
+NOMBRES_COLAS = ['nuevos', 'listos', 'ejecutando', 'esperando', 'terminados',
+                 'listo_suspendido', 'esperando_suspendido']
+
+class EstadoColas:
+    """
+    Contenido de cada cola reconstruido a partir de las transiciones.
+
+    Todas las colas del planificador agregan por el final, así que aplicar las
+    transiciones en orden reproduce también el orden de cada cola.
+    """
+
+    def __init__(self):
+        self.colas: List[Dict[int, None]] = [{} for _ in NOMBRES_COLAS]
+
+    def aplicar(self, pid: int, desde: int, hacia: int):
+        """Mueve un proceso de la cola `desde` a la cola `hacia`"""
+        if desde != SIN_ESTADO:
+            del self.colas[desde][pid]
+        self.colas[hacia][pid] = None
+
+    def como_diccionario(self) -> Dict[str, List[int]]:
+        """Retorna los ids de cada cola con las claves de obtener_estado_actual"""
+        return {nombre: list(cola) for nombre, cola in zip(NOMBRES_COLAS, self.colas)}
+
+    def serializar(self) -> bytes:
+        partes = []
+        for cola in self.colas:
+            partes.append(CONTEO.pack(len(cola)))
+            partes.append(struct.pack(f"<{len(cola)}q", *cola))
+        return b"".join(partes)
+
+    @classmethod
+    def deserializar(cls, datos, posicion: int) -> "EstadoColas":
+        estado = cls()
+        for cola in estado.colas:
+            (cantidad,) = CONTEO.unpack_from(datos, posicion)
+            posicion += CONTEO.size
+            cola.update(dict.fromkeys(struct.unpack_from(f"<{cantidad}q", datos, posicion)))
+            posicion += 8 * cantidad
+        return estado
+
+class RegistroTransiciones:
+    """
+    Escribe en disco, a medida que ocurren, las transiciones de estado de una simulación.
+
+    Cada transición ocupa un registro binario de tamaño fijo (ciclo, pid, estado anterior,
+    estado nuevo). Cada `intervalo_claves` ciclos se escribe además un fotograma clave con
+    el contenido completo de las colas, para que reconstruir un ciclo cualquiera no tenga
+    que repetir el historial desde el principio. En memoria sólo se mantiene el estado
+    actual de las colas (ids) y el índice de fotogramas clave.
+
+    Se usa como oyente de PlanificadorProcesos.suscribir_transiciones.
+
+    Atributos:
+        archivo (BinaryIO): Archivo donde se escribe el registro
+        intervalo_claves (int): Ciclos entre fotogramas clave
+        claves (List[Tuple[int, int]]): (ciclo, posición en el archivo) de cada fotograma clave
+    """
+
+    def __init__(self, ruta: Optional[str] = None, intervalo_claves: int = 1000):
+        """
+        Inicializa el registro.
+
+        Args:
+            ruta (Optional[str]): Archivo de salida; si es None se usa un archivo temporal
+                que se borra al cerrarlo
+            intervalo_claves (int): Ciclos entre fotogramas clave
+        """
+        self.archivo: BinaryIO = open(ruta, "w+b") if ruta else tempfile.TemporaryFile()
+        self.intervalo_claves = intervalo_claves
+        self.claves: List[Tuple[int, int]] = []
+        self._estado = EstadoColas()
+        self._ultimo_ciclo = 0
+        self._proxima_clave = intervalo_claves
+        self._posicion = 0
+        self._escribir(MAGICO)
+
+    def _escribir(self, datos: bytes):
+        self.archivo.write(datos)
+        self._posicion += len(datos)
+
+    def registrar(self, ciclo: int, proceso: Proceso, anterior: Optional[EstadoProceso],
+                  nuevo: EstadoProceso):
+        """Agrega una transición al registro"""
+        if ciclo > self._ultimo_ciclo:
+            # Todas las transiciones hasta ciclo - 1 ya están escritas
+            if ciclo - 1 >= self._proxima_clave:
+                self._escribir_clave(ciclo - 1)
+            self._ultimo_ciclo = ciclo
+
+        desde = SIN_ESTADO if anterior is None else CODIGO_ESTADO[anterior]
+        hacia = CODIGO_ESTADO[nuevo]
+        self._estado.aplicar(proceso.id, desde, hacia)
+        self._escribir(TRANSICION.pack(b"T", ciclo, proceso.id, desde, hacia))
+
+    def _escribir_clave(self, ciclo: int):
+        """Escribe un fotograma clave con el estado al terminar `ciclo`"""
+        contenido = self._estado.serializar()
+        self.claves.append((ciclo, self._posicion))
+        self._escribir(CLAVE.pack(b"K", ciclo, len(contenido)))
+        self._escribir(contenido)
+        self._proxima_clave = ciclo + self.intervalo_claves
+
+    def vaciar(self):
+        """Escribe en disco lo que esté en el buffer"""
+        self.archivo.flush()
+
+    def __getstate__(self) -> Dict:
+        # El archivo no se puede serializar: se guarda su contenido, que al restaurar se
+        # copia a un archivo temporal nuevo (nunca se reescribe el original)
+        estado = self.__dict__.copy()
+        self.archivo.flush()
+        self.archivo.seek(0)
+        estado['archivo'] = self.archivo.read()
+        self.archivo.seek(0, os.SEEK_END)
+        return estado
+
+    def __setstate__(self, estado: Dict):
+        contenido = estado.pop('archivo')
+        self.__dict__.update(estado)
+        self.archivo = tempfile.TemporaryFile()
+        self.archivo.write(contenido)
+
+    def separar(self):
+        """
+        Continúa el registro en un archivo temporal nuevo, sin el historial anterior.
+
+        El archivo nuevo empieza con un fotograma clave del estado actual de las colas,
+        así que los ciclos anteriores se reconstruyen con ese estado. Lo usa una
+        bifurcación para no escribir en el archivo de la simulación original.
+        """
+        self.archivo = tempfile.TemporaryFile()
+        self._posicion = 0
+        self._escribir(MAGICO)
+        contenido = self._estado.serializar()
+        self.claves = [(0, self._posicion)]
+        self._escribir(CLAVE.pack(b"K", 0, len(contenido)))
+        self._escribir(contenido)
+
+    def reduccion_sin_historial(self) -> Tuple:
+        """Reducción para pickle que conserva sólo el estado actual de las colas (ver `separar`)"""
+        return _registro_sin_historial, (self.intervalo_claves, self._estado, self._ultimo_ciclo, self._proxima_clave)
+
+    def lector(self) -> "LectorHistorial":
+        """Retorna un lector sobre este registro (ve también lo que se escriba después)"""
+        return LectorHistorial(self.archivo, registro=self)
+
+    def cerrar(self):
+        self.archivo.close()
+
+def _registro_sin_historial(intervalo_claves: int, estado: EstadoColas, ultimo_ciclo: int,
+                            proxima_clave: int) -> RegistroTransiciones:
+    registro = RegistroTransiciones.__new__(RegistroTransiciones)
+    registro.intervalo_claves = intervalo_claves
+    registro._estado = estado
+    registro._ultimo_ciclo = ultimo_ciclo
+    registro._proxima_clave = proxima_clave
+    registro.separar()
+    return registro
+
+class LectorHistorial:
+    """
+    Reconstruye el estado de las colas en cualquier ciclo a partir de un registro.
+
+    El archivo se lee mediante mmap, sin copiarlo ni interpretarlo por adelantado: para
+    un ciclo dado se parte del fotograma clave anterior más cercano y se aplican sólo las
+    transiciones posteriores. Los procesos se identifican por su id.
+    """
+
+    def __init__(self, fuente: Union[str, BinaryIO], registro: Optional[RegistroTransiciones] = None):
+        """
+        Inicializa el lector.
+
+        Args:
+            fuente (Union[str, BinaryIO]): Ruta del registro o archivo abierto
+            registro (Optional[RegistroTransiciones]): Registro que todavía se está
+                escribiendo en `fuente`; se usa su índice de fotogramas clave
+        """
+        self._archivo = open(fuente, "rb") if isinstance(fuente, (str, os.PathLike)) else fuente
+        self._registro = registro
+        self._mapa: Optional[mmap.mmap] = None
+        self._claves: Optional[List[Tuple[int, int]]] = None
+
+    def __getstate__(self) -> Dict:
+        if self._registro is None:
+            raise TypeError("Sólo se puede serializar un lector asociado a un registro activo")
+        return {'_registro': self._registro}
+
+    def __setstate__(self, estado: Dict):
+        self.__init__(estado['_registro'].archivo, registro=estado['_registro'])
+
+    def _datos(self) -> mmap.mmap:
+        """Retorna un mmap que cubre todo lo escrito hasta ahora"""
+        if self._registro is not None:
+            self._registro.vaciar()
+        tamano = os.fstat(self._archivo.fileno()).st_size
+        if self._mapa is None or len(self._mapa) != tamano:
+            if self._mapa is not None:
+                self._mapa.close()
+            self._mapa = mmap.mmap(self._archivo.fileno(), tamano, access=mmap.ACCESS_READ)
+            if self._mapa[:len(MAGICO)] != MAGICO:
+                raise ValueError("El archivo no es un registro de transiciones")
+        return self._mapa
+
+    def _indice_claves(self, datos) -> List[Tuple[int, int]]:
+        """Retorna los fotogramas clave; si no hay un registro activo, recorre el archivo una vez"""
+        if self._registro is not None:
+            return self._registro.claves
+        if self._claves is None:
+            self._claves = [(ciclo, posicion) for tipo, ciclo, posicion, _ in self._registros(datos, len(MAGICO))
+                            if tipo == b"K"]
+        return self._claves
+
+    @staticmethod
+    def _registros(datos, posicion: int) -> Iterator[Tuple[bytes, int, int, Tuple]]:
+        """Recorre los registros desde `posicion`: (tipo, ciclo, posición, contenido)"""
+        fin = len(datos)
+        while posicion < fin:
+            tipo = datos[posicion:posicion + 1]
+            if tipo == b"T":
+                if posicion + TRANSICION.size > fin:
+                    return  # Registro incompleto al final de un archivo interrumpido
+                _, ciclo, pid, desde, hacia = TRANSICION.unpack_from(datos, posicion)
+                yield tipo, ciclo, posicion, (pid, desde, hacia)
+                posicion += TRANSICION.size
+            elif tipo == b"K":
+                if posicion + CLAVE.size > fin:
+                    return
+                _, ciclo, longitud = CLAVE.unpack_from(datos, posicion)
+                if posicion + CLAVE.size + longitud > fin:
+                    return
+                yield tipo, ciclo, posicion, None
+                posicion += CLAVE.size + longitud
+            else:
+                raise ValueError(f"Registro desconocido en la posición {posicion}")
+
+    def _desde_clave(self, datos, ciclo: int) -> Tuple[EstadoColas, int]:
+        """Estado del fotograma clave más cercano anterior a `ciclo` y posición siguiente"""
+        claves = self._indice_claves(datos)
+        indice = bisect.bisect_right(claves, (ciclo, float("inf"))) - 1
+        if indice < 0:
+            return EstadoColas(), len(MAGICO)
+        _, posicion = claves[indice]
+        _, _, longitud = CLAVE.unpack_from(datos, posicion)
+        estado = EstadoColas.deserializar(datos, posicion + CLAVE.size)
+        return estado, posicion + CLAVE.size + longitud
+
+    def transiciones(self) -> Iterator[Tuple[int, int, Optional[EstadoProceso], EstadoProceso]]:
+        """Recorre todas las transiciones: (ciclo, pid, estado anterior, estado nuevo)"""
+        estados = list(EstadoProceso)
+        for tipo, ciclo, _, contenido in self._registros(self._datos(), len(MAGICO)):
+            if tipo == b"T":
+                pid, desde, hacia = contenido
+                yield ciclo, pid, None if desde == SIN_ESTADO else estados[desde], estados[hacia]
+
+    def lotes_transiciones(self, tamano: int = 1 << 16) -> Iterator["np.ndarray"]:
+        """
+        Recorre las transiciones en lotes, leídas directamente del archivo con NumPy.
+
+        Yields:
+            np.ndarray: Arreglo estructurado con los campos ciclo, pid, desde y hacia
+                (desde es SIN_ESTADO en una admisión); a lo sumo `tamano` transiciones
+        """
+        import numpy as np
+        tipo = np.dtype([('tipo', 'S1'), ('ciclo', '<i8'), ('pid', '<i8'), ('desde', 'i1'), ('hacia', 'i1')])
+        datos = self._datos()
+        # Las transiciones son registros contiguos entre un fotograma clave y el siguiente
+        tramos = []
+        inicio = len(MAGICO)
+        for _, posicion in self._indice_claves(datos):
+            tramos.append((inicio, posicion))
+            _, _, longitud = CLAVE.unpack_from(datos, posicion)
+            inicio = posicion + CLAVE.size + longitud
+        tramos.append((inicio, len(datos)))
+        for inicio, fin in tramos:
+            registros = np.frombuffer(datos, dtype=tipo, count=(fin - inicio) // TRANSICION.size, offset=inicio)
+            # Un archivo interrumpido puede terminar con un fotograma clave incompleto
+            otros = np.flatnonzero(registros['tipo'] != b"T")
+            if len(otros):
+                registros = registros[:otros[0]]
+            for desde in range(0, len(registros), tamano):
+                # Se copia para no retener el mmap (que se reemplaza cuando el archivo crece)
+                yield registros[desde:desde + tamano][['ciclo', 'pid', 'desde', 'hacia']].copy()
+            del registros
+
+    def instantaneas(self, desde: int = 1, hasta: Optional[int] = None) -> Iterator[Tuple[int, Dict[str, List[int]]]]:
+        """
+        Reconstruye el estado de las colas ciclo a ciclo.
+
+        Args:
+            desde (int): Primer ciclo
+            hasta (Optional[int]): Último ciclo (por defecto, el de la última transición)
+
+        Yields:
+            Tuple[int, Dict[str, List[int]]]: Ciclo e ids de cada cola al terminar ese ciclo
+        """
+        datos = self._datos()
+        estado, posicion = self._desde_clave(datos, desde)
+        ciclo = desde
+        for tipo, ciclo_registro, _, contenido in self._registros(datos, posicion):
+            if tipo != b"T":
+                continue
+            while ciclo < ciclo_registro:
+                if hasta is not None and ciclo > hasta:
+                    return
+                yield ciclo, estado.como_diccionario()
+                ciclo += 1
+            estado.aplicar(*contenido)
+        ultimo = hasta if hasta is not None else ciclo
+        while ciclo <= ultimo:
+            yield ciclo, estado.como_diccionario()
+            ciclo += 1
+
+    def instantanea(self, ciclo: int) -> Dict[str, List[int]]:
+        """Retorna los ids de cada cola al terminar `ciclo`"""
+        for _, estado in self.instantaneas(ciclo, ciclo):
+            return estado
+        return EstadoColas().como_diccionario()
+
+    def cerrar(self):
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+
+class HistorialEstados(Sequence):
+    """
+    Historial de estados de una simulación, reconstruido bajo demanda.
+
+    Se comporta como la lista de instantáneas que guardaba Simulador: un elemento por
+    ciclo con 'ciclo_actual', 'estado_sistema' y 'estadisticas'. Cada elemento se
+    reconstruye desde el registro de transiciones al pedirlo, así que la memoria no
+    crece con el número de ciclos. Como antes, 'estado_sistema' contiene los procesos
+    (con sus atributos actuales), no copias de su estado en ese ciclo.
+    """
+
+    def __init__(self, simulador):
+        """
+        Args:
+            simulador (Simulador): Simulador cuyo registro de transiciones se lee
+        """
+        self._simulador = simulador
+        self._lector = simulador.registro.lector()
+
+    def __len__(self) -> int:
+        return self._simulador.ciclo_actual
+
+    def _elemento(self, ciclo: int, ids: Dict[str, List[int]]) -> Dict:
+        procesos = self._simulador.procesos
+        return {
+            'ciclo_actual': ciclo,
+            # Los procesos descartados al terminar (conservar_terminados=False) no se muestran
+            'estado_sistema': {nombre: [procesos[pid] for pid in cola if pid in procesos]
+                               for nombre, cola in ids.items()},
+            'estadisticas': self._simulador.estadisticas_del_ciclo(ciclo),
+        }
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de historial fuera de rango")
+        ciclo = indice + 1
+        return self._elemento(ciclo, self._lector.instantanea(ciclo))
+
+    def __iter__(self) -> Iterator[Dict]:
+        for ciclo, ids in self._lector.instantaneas(1, len(self)):
+            yield self._elemento(ciclo, ids)
@@ -0,0 +1,259 @@
+import argparse
+import cProfile
+import json
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from proceso import Proceso, EstadoProceso
+
+# Operaciones de ColaProcesos que se cuentan
+OPERACIONES_COLA = ('agregar', 'extraer', 'primero', 'quitar', 'copiar')
+
+# Colas del planificador y su nombre en las métricas
+COLAS = {
+    'cola_nuevos': 'nuevos',
+    'cola_listos': 'listos',
+    'cola_esperando': 'esperando',
+    'cola_listo_suspendido': 'listo_suspendido',
+    'cola_esperando_suspendido': 'esperando_suspendido',
+}
+
+class Instrumentacion:
+    """
+    Medición opcional del trabajo de un planificador.
+
+    Al conectarla, `ejecutar_ciclo` mide el tiempo de cada fase (nuevos, I/O y
+    despacho), se cuentan las transiciones por estado de origen y destino y las
+    operaciones sobre cada cola. Desconectada no cuesta nada: el
+    planificador sólo comprueba que `instrumentacion` es None y las colas vuelven a sus
+    métodos originales.
+
+    Atributos:
+        ciclos (int): Ciclos medidos
+        segundos_fase (Dict[str, float]): Tiempo acumulado en cada fase
+        transiciones (Counter): Transiciones por (estado anterior, estado nuevo)
+        operaciones_cola (Counter): Operaciones por (cola, operación)
+    """
+
+    def __init__(self):
+        self.ciclos = 0
+        self.segundos_fase: Dict[str, float] = {}
+        self.transiciones: Counter = Counter()
+        self.operaciones_cola: Counter = Counter()
+        self._planificador = None
+        self._fases: List[Tuple[str, Callable]] = []
+
+    def conectar(self, planificador):
+        """Empieza a medir un planificador (PlanificadorProcesos o PlanificadorEventos)"""
+        if self._planificador is not None:
+            raise RuntimeError("La instrumentación ya está conectada a un planificador")
+        self._planificador = planificador
+        self._fases = [(fase.lstrip('_'), getattr(planificador, fase)) for fase in planificador.FASES]
+        for nombre, _ in self._fases:
+            self.segundos_fase.setdefault(nombre, 0.0)
+        for atributo, nombre in COLAS.items():
+            cola = getattr(planificador, atributo)
+            for operacion in OPERACIONES_COLA:
+                # Un atributo de instancia oculta al método de la clase mientras dure la medición
+                setattr(cola, operacion, self._contador(nombre, operacion, getattr(cola, operacion)))
+        planificador.suscribir_transiciones(self._registrar_transicion)
+        planificador.instrumentacion = self
+
+    def desconectar(self):
+        """Deja de medir y restaura el planificador y sus colas"""
+        planificador = self._planificador
+        if planificador is None:
+            return
+        planificador.instrumentacion = None
+        planificador.desuscribir_transiciones(self._registrar_transicion)
+        for atributo in COLAS:
+            cola = getattr(planificador, atributo)
+            for operacion in OPERACIONES_COLA:
+                vars(cola).pop(operacion, None)
+        self._planificador = None
+        self._fases = []
+
+    def _contador(self, cola: str, operacion: str, metodo: Callable) -> Callable:
+        clave = (cola, operacion)
+        operaciones = self.operaciones_cola
+
+        def contar(*args, **kwargs):
+            operaciones[clave] += 1
+            return metodo(*args, **kwargs)
+
+        return contar
+
+    def _registrar_transicion(self, ciclo: int, proceso: Proceso, anterior: Optional[EstadoProceso],
+                              nuevo: EstadoProceso):
+        self.transiciones[(anterior.value if anterior else "ADMISION", nuevo.value)] += 1
+
+    def ejecutar_fases(self, planificador):
+        """Ejecuta las fases de un ciclo midiendo cada una (lo llama `ejecutar_ciclo`)"""
+        reloj = time.perf_counter
+        segundos = self.segundos_fase
+        for nombre, fase in self._fases:
+            inicio = reloj()
+            fase()
+            segundos[nombre] += reloj() - inicio
+        self.ciclos += 1
+
+    def resumen(self) -> Dict:
+        """Retorna todas las mediciones en un diccionario serializable como JSON"""
+        return {
+            'ciclos': self.ciclos,
+            'segundos_fase': dict(self.segundos_fase),
+            'transiciones': [
+                {'desde': desde, 'hacia': hacia, 'cantidad': cantidad}
+                for (desde, hacia), cantidad in sorted(self.transiciones.items())
+            ],
+            'operaciones_cola': [
+                {'cola': cola, 'operacion': operacion, 'cantidad': cantidad}
+                for (cola, operacion), cantidad in sorted(self.operaciones_cola.items())
+            ],
+        }
+
+    def a_prometheus(self) -> str:
+        """Retorna las mediciones en el formato de texto de Prometheus"""
+        lineas = [
+            "# HELP simulador_ciclos_total Ciclos medidos del planificador",
+            "# TYPE simulador_ciclos_total counter",
+            f"simulador_ciclos_total {self.ciclos}",
+            "# HELP simulador_fase_segundos_total Tiempo acumulado en cada fase de ejecutar_ciclo",
+            "# TYPE simulador_fase_segundos_total counter",
+        ]
+        lineas += [f'simulador_fase_segundos_total{{fase="{fase}"}} {segundos:.9f}'
+                   for fase, segundos in self.segundos_fase.items()]
+        lineas += [
+            "# HELP simulador_transiciones_total Transiciones de estado por origen y destino",
+            "# TYPE simulador_transiciones_total counter",
+        ]
+        lineas += [f'simulador_transiciones_total{{desde="{desde}",hacia="{hacia}"}} {cantidad}'
+                   for (desde, hacia), cantidad in sorted(self.transiciones.items())]
+        lineas += [
+            "# HELP simulador_operaciones_cola_total Operaciones sobre cada cola del planificador",
+            "# TYPE simulador_operaciones_cola_total counter",
+        ]
+        lineas += [f'simulador_operaciones_cola_total{{cola="{cola}",operacion="{operacion}"}} {cantidad}'
+                   for (cola, operacion), cantidad in sorted(self.operaciones_cola.items())]
+        return "\n".join(lineas) + "\n"
+
+    def guardar_prometheus(self, ruta: str):
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(self.a_prometheus())
+
+    def guardar_json(self, ruta: str):
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(self.resumen(), archivo, indent=2)
+
+def perfilar(funcion: Callable, ruta: Optional[str] = None) -> Tuple[object, pstats.Stats]:
+    """
+    Ejecuta una función bajo cProfile.
+
+    Args:
+        funcion (Callable): Función sin argumentos a perfilar (p. ej. ``lambda: simulador.simular(15)``)
+        ruta (Optional[str]): Archivo donde guardar el perfil (legible con pstats o snakeviz)
+
+    Returns:
+        Tuple[object, pstats.Stats]: Resultado de la función y estadísticas del perfil
+    """
+    perfil = cProfile.Profile()
+    resultado = perfil.runcall(funcion)
+    if ruta is not None:
+        perfil.dump_stats(ruta)
+    return resultado, pstats.Stats(perfil)
+
+class MuestreadorPila:
+    """
+    Perfilador por muestreo: cada `intervalo` segundos anota la pila del hilo medido.
+
+    A diferencia de cProfile no intercepta cada llamada, así que casi no altera los
+    tiempos. El resultado se puede escribir en formato de pilas colapsadas
+    ("a;b;c cantidad"), que leen flamegraph.pl y speedscope.
+
+    Atributos:
+        intervalo (float): Segundos entre muestras
+        pilas (Counter): Muestras por pila (tupla de "archivo:función", de afuera hacia adentro)
+    """
+
+    def __init__(self, intervalo: float = 0.001):
+        self.intervalo = intervalo
+        self.pilas: Counter = Counter()
+        self._hilo_medido: Optional[int] = None
+        self._detener = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+
+    def _muestrear(self):
+        while not self._detener.wait(self.intervalo):
+            marco = sys._current_frames().get(self._hilo_medido)
+            pila = []
+            while marco is not None:
+                codigo = marco.f_code
+                pila.append(f"{codigo.co_filename.rsplit('/', 1)[-1]}:{codigo.co_name}")
+                marco = marco.f_back
+            if pila:
+                self.pilas[tuple(reversed(pila))] += 1
+
+    def __enter__(self) -> "MuestreadorPila":
+        self._hilo_medido = threading.get_ident()
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._muestrear, daemon=True)
+        self._hilo.start()
+        return self
+
+    def __exit__(self, *excepcion):
+        self._detener.set()
+        self._hilo.join()
+
+    def colapsadas(self) -> str:
+        """Retorna las muestras en formato de pilas colapsadas"""
+        return "".join(f"{';'.join(pila)} {cantidad}\n" for pila, cantidad in self.pilas.most_common())
+
+def main(argv: Optional[Sequence[str]] = None):
+    from simulador import Simulador
+
+    parser = argparse.ArgumentParser(description="Ejecuta una simulación instrumentada")
+    parser.add_argument("--quantum", type=int, default=2)
+    parser.add_argument("--ciclos", type=int, default=10000)
+    parser.add_argument("--cantidad-procesos", type=int, default=1000)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--motor", choices=Simulador.MOTORES, default="ticks")
+    parser.add_argument("--prometheus", help="Archivo de métricas en formato Prometheus")
+    parser.add_argument("--json", help="Archivo de resumen JSON")
+    parser.add_argument("--perfil", choices=["cprofile", "muestreo"],
+                        help="Perfilar además toda la simulación")
+    parser.add_argument("--salida-perfil", help="Archivo del perfil (.prof o pilas colapsadas)")
+    argumentos = parser.parse_args(argv)
+
+    simulador = Simulador(quantum=argumentos.quantum, ciclos=argumentos.ciclos, semilla=argumentos.semilla,
+                          motor=argumentos.motor, mostrar_swapping=False)
+    instrumentacion = Instrumentacion()
+    instrumentacion.conectar(simulador.planificador)
+    simular = lambda: simulador.simular(argumentos.cantidad_procesos)
+
+    if argumentos.perfil == "cprofile":
+        _, estadisticas = perfilar(simular, argumentos.salida_perfil)
+        estadisticas.sort_stats("cumulative").print_stats(20)
+    elif argumentos.perfil == "muestreo":
+        with MuestreadorPila() as muestreador:
+            simular()
+        if argumentos.salida_perfil:
+            with open(argumentos.salida_perfil, "w", encoding="utf-8") as archivo:
+                archivo.write(muestreador.colapsadas())
+        else:
+            print(muestreador.colapsadas()[:4000])
+    else:
+        simular()
+    instrumentacion.desconectar()
+
+    if argumentos.prometheus:
+        instrumentacion.guardar_prometheus(argumentos.prometheus)
+    if argumentos.json:
+        instrumentacion.guardar_json(argumentos.json)
+    if not (argumentos.prometheus or argumentos.json):
+        print(instrumentacion.a_prometheus())
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,13 @@
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.progress import Progress
 from rich.panel import Panel
 from rich.layout import Layout
 from rich.live import Live
 from rich.text import Text
-from typing import Dict, List
+from typing import Dict, List, Optional
+from itertools import islice
 import time
-import random
 
 class Interfaz:
     """
@@ -16,22 +16,40 @@ class Interfaz:
     
     Atributos:
         console (Console): Instancia de la consola rich para mostrar información
+        fps (float): Cuadros por segundo máximos al mostrar la simulación en vivo
+        limite_procesos (int): Procesos que se listan por estado; el resto se resume
+        sin_pantalla (bool): Si es True la simulación se ejecuta sin mostrar nada
     """
     
-    def __init__(self):
-        """Inicializa la interfaz de usuario."""
+    def __init__(self, fps: float = 10, limite_procesos: int = 15, sin_pantalla: bool = False):
+        """
+        Inicializa la interfaz de usuario.
+        
+        Args:
+            fps (float): Cuadros por segundo máximos
+            limite_procesos (int): Procesos que se listan por estado
+            sin_pantalla (bool): Ejecutar sin mostrar nada (modo headless)
+        """
+        if fps <= 0:
+            raise ValueError(f"fps debe ser positivo: {fps}")
         self.console = Console()
+        self.fps = fps
+        self.limite_procesos = limite_procesos
+        self.sin_pantalla = sin_pantalla
     
     def mostrar_bienvenida(self):
         """
         Muestra el mensaje de bienvenida del simulador.
-        Se muestra al inicio de la simulación y permanece visible por 5 segundos.
         """
-        self.console.print(Panel.fit(
+        self.console.print(self.crear_panel_bienvenida())
+    
+    def crear_panel_bienvenida(self) -> Panel:
+        """Crea el panel con el título del simulador"""
+        return Panel.fit(
             "[bold blue]Simulador de Estados de Procesos[/bold blue]\n"
             "[yellow]Sistema Operativo - Simulación de Procesos[/yellow]",
             border_style="blue"
-        ))
+        )
     
     def crear_tabla_estado(self, estado: Dict) -> Table:
         """Crea una tabla con el estado actual del sistema"""
@@ -42,23 +60,46 @@ class Interfaz:
         
         for estado_nombre, procesos in estado['estado_sistema'].items():
             cantidad = len(procesos)
-            lista_procesos = ", ".join([f"P{p.id}" for p in procesos]) if procesos else "-"
-            tabla.add_row(estado_nombre, str(cantidad), lista_procesos)
+            tabla.add_row(estado_nombre, str(cantidad), self._resumir_procesos(procesos, cantidad))
         
         return tabla
     
+    def _resumir_procesos(self, procesos, cantidad: int) -> str:
+        """Lista los primeros `limite_procesos` ids y resume el resto sin recorrerlo"""
+        if cantidad == 0:
+            return "-"
+        if hasattr(procesos, "primeros"):
+            primeros = procesos.primeros(self.limite_procesos)
+        else:
+            primeros = list(islice(procesos, self.limite_procesos))
+        lista_procesos = ", ".join([f"P{p.id}" for p in primeros])
+        if cantidad > len(primeros):
+            lista_procesos += f" ... (+{cantidad - len(primeros)} más)"
+        return lista_procesos
+    
     def crear_panel_estadisticas(self, estado: Dict) -> Panel:
         """Crea un panel con las estadísticas actuales"""
         stats = estado['estadisticas']
-        return Panel(
+        texto = (
             f"[bold]Estadísticas del Sistema[/bold]\n"
             f"Ciclo actual: {estado['ciclo_actual']}\n"
             f"Tiempo de espera promedio: {stats['tiempo_espera_promedio']:.2f}\n"
             f"Tiempo de respuesta promedio: {stats['tiempo_respuesta_promedio']:.2f}\n"
-            f"Throughput: {stats['throughput']:.2f}",
-            title="Métricas",
-            border_style="green"
+            f"Throughput: {stats['throughput']:.2f}"
         )
+        # Percentiles de las métricas incrementales (sólo el estado en vivo las incluye)
+        metricas = estado.get('metricas')
+        if metricas is not None:
+            for nombre, metrica in (("espera", metricas.espera), ("respuesta", metricas.respuesta),
+                                    ("retorno", metricas.retorno)):
+                texto += (f"\nTiempo de {nombre} p50/p95/p99: "
+                          f"{metrica.p50:.1f} / {metrica.p95:.1f} / {metrica.p99:.1f}")
+        return Panel(texto, title="Métricas", border_style="green")
+    
+    def crear_vista(self, estado: Dict) -> Group:
+        """Crea todo lo que se muestra en un cuadro: título, tabla de estados y métricas"""
+        return Group(self.crear_panel_bienvenida(), self.crear_tabla_estado(estado),
+                     self.crear_panel_estadisticas(estado))
     
     def mostrar_estado_actual(self, estado: Dict):
         """Muestra el estado actual del sistema"""
@@ -100,57 +141,50 @@ class Interfaz:
         
         self.console.print(tabla)
     
-    def simular_en_tiempo_real(self, simulador, cantidad_procesos: int = 15):
+    def simular_en_tiempo_real(self, simulador, cantidad_procesos: int = 15,
+                               ciclos_por_segundo: Optional[float] = None) -> Dict:
         """
-        Ejecuta la simulación en tiempo real con actualización continua.
+        Ejecuta la simulación mostrando su estado en vivo.
+        
+        La simulación avanza tan rápido como puede (o a `ciclos_por_segundo` si se indica)
+        y la pantalla se actualiza aparte, como mucho `fps` veces por segundo: cuando toca
+        un cuadro se dibuja sólo el estado más reciente y los ciclos intermedios no se
+        dibujan. En modo `sin_pantalla` se ejecuta la misma simulación sin dibujar nada.
+        Ctrl+C interrumpe la simulación.
         
         Args:
             simulador (Simulador): Instancia del simulador
             cantidad_procesos (int): Número de procesos a simular
+            ciclos_por_segundo (Optional[float]): Ritmo de la simulación (sin límite si es None)
         
-        La simulación:
-        1. Muestra el mensaje de bienvenida por 5 segundos
-        2. Genera los procesos iniciales
-        3. Ejecuta ciclos hasta alcanzar el límite configurado
-        4. Muestra el estado actual en cada ciclo
-        5. Permite interrumpir la simulación con Ctrl+C
+        Returns:
+            Dict: Resultados finales de la simulación
         """
+        if self.sin_pantalla:
+            return simulador.simular(cantidad_procesos)
+        
         try:
-            # Mostrar mensaje de bienvenida por 5 segundos
-            self.console.clear()
-            self.mostrar_bienvenida()
-            time.sleep(5)
-            
             # Generar todos los procesos pero no admitirlos inmediatamente
-            simulador.procesos_pendientes = simulador.generar_procesos(cantidad_procesos)
-            ciclo_actual = 0
+            simulador.iniciar(cantidad_procesos)
             
-            while ciclo_actual < simulador.ciclos:  # Verificar el límite de ciclos
-                # Incrementar ciclo actual
-                ciclo_actual += 1
-                
-                # Limpiar pantalla
-                self.console.clear()
-                
-                # Intentar admitir nuevos procesos
-                if simulador.procesos_pendientes and random.random() < simulador.probabilidad_admision:
-                    proceso = simulador.procesos_pendientes.pop(0)
-                    simulador.planificador.admitir_proceso(proceso)
+            intervalo_cuadro = 1 / self.fps
+            intervalo_ciclo = 1 / ciclos_por_segundo if ciclos_por_segundo else 0
+            with Live(self.crear_vista(simulador.obtener_estado_actual()), console=self.console,
+                      auto_refresh=False) as live:
+                proximo_cuadro = time.perf_counter() + intervalo_cuadro
+                while simulador.ciclo_actual < simulador.ciclos:  # Verificar el límite de ciclos
+                    # Admisión, ciclo del planificador y swapping
+                    simulador.avanzar_ciclo()
+                    
+                    ahora = time.perf_counter()
+                    if ahora >= proximo_cuadro:
+                        live.update(self.crear_vista(simulador.obtener_estado_actual()), refresh=True)
+                        proximo_cuadro = ahora + intervalo_cuadro
+                    if intervalo_ciclo:
+                        time.sleep(intervalo_ciclo)
                 
-                # Ejecutar ciclo del planificador
-                simulador.planificador.ejecutar_ciclo()
-                
-                # Simular swapping
-                if random.random() < simulador.probabilidad_suspension:
-                    simulador._simular_swapping()
-                
-                # Mostrar estado actual
-                estado_actual = simulador.obtener_estado_actual()
-                estado_actual['ciclo_actual'] = ciclo_actual
-                self.mostrar_estado_actual(estado_actual)
-                
-                # Esperar antes de la siguiente actualización
-                time.sleep(1)
+                # El último cuadro siempre muestra el estado final
+                live.update(self.crear_vista(simulador.obtener_estado_actual()), refresh=True)
             
             # Mostrar resultados finales
             self.mostrar_resultados_finales(simulador.obtener_estado_actual())
@@ -161,4 +195,6 @@ class Interfaz:
             self.console.print(f"\n[bold red]Error durante la simulación: {str(e)}[/bold red]")
         finally:
             self.console.print("\n[bold yellow]Presiona Enter para volver al menú principal...[/bold yellow]")
-            input() 
\ No newline at end of file
+            input()
+        
+        return simulador.obtener_resultados_finales()
@@ -1,18 +1,230 @@
+"""
+Punto de entrada del simulador.
+
+Subcomandos:
+
+    interactivo   simulación con visualización en vivo (por defecto, sin subcomando)
+    lote          simulación sin pantalla; escribe los resultados en JSON
+    barrido       barrido de parámetros en varios núcleos (ver barrido.py)
+    reproducir    vuelve a ejecutar una traza grabada con `lote --grabar-traza`
+
+Sólo se importa lo que usa el subcomando (rich sólo para dibujar), así que una corrida
+en lote arranca en milisegundos y se puede llamar miles de veces desde un script:
+
+    python main.py lote --semilla 7 --ciclos 100000 --cantidad-procesos 5000
+    python main.py lote --semilla 7 --grabar-traza carga.traza --salida base.json
+    python main.py reproducir carga.traza --quantum 4
+    python main.py lote --carga procesos.csv --grabar-traza carga.traza && python main.py reproducir carga.traza --carga procesos.csv
+    python main.py lote --semilla 7 --ciclos 100000 --cache ~/.cache/simulador
+    python main.py barrido --quantum 1 2 4 --replicas 10 --salida barrido.csv
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, Optional, Sequence
 from simulador import Simulador
-from interfaz import Interfaz
-
-def main():
-    # Configuración de la simulación
-    QUANTUM = 2
-    CICLOS = 100
-    CANTIDAD_PROCESOS = 15
-    
-    # Crear instancias
-    simulador = Simulador(quantum=QUANTUM, ciclos=CICLOS)
-    interfaz = Interfaz()
-    
+from politicas import POLITICAS, crear_politica
+
+# Valores por defecto de la simulación
+QUANTUM = 2
+CICLOS = 100
+CANTIDAD_PROCESOS = 15
+FPS = 10  # Cuadros por segundo máximos de la pantalla
+CICLOS_POR_SEGUNDO = None  # Ritmo de la simulación (None: sin pausas)
+
+def _agregar_parametros(parser: argparse.ArgumentParser, motor: str, semilla: bool = True):
+    """Agrega las opciones de la simulación comunes a todos los subcomandos que simulan"""
+    parser.add_argument("--quantum", type=int, default=QUANTUM)
+    parser.add_argument("--ciclos", type=int, default=CICLOS)
+    parser.add_argument("--cantidad-procesos", type=int, default=CANTIDAD_PROCESOS,
+                        help="Procesos a generar (con --carga, máximo a tomar de ella)")
+    if semilla:
+        parser.add_argument("--semilla", type=int, help="Semilla del generador aleatorio")
+    parser.add_argument("--motor", choices=Simulador.MOTORES, default=motor)
+    parser.add_argument("--representacion", choices=Simulador.REPRESENTACIONES, default="objetos")
+    parser.add_argument("--nucleos", type=int, default=1, help="Número de CPU simuladas")
+    parser.add_argument("--politica", choices=list(POLITICAS), default="rr", help="Política de planificación")
+    parser.add_argument("--probabilidad-admision", type=float, default=0.3)
+    parser.add_argument("--probabilidad-suspension", type=float, default=0.4)
+
+def _agregar_salida(parser: argparse.ArgumentParser):
+    """Agrega las opciones de salida de los subcomandos sin pantalla"""
+    parser.add_argument("--salida", help="Archivo JSON de resultados (por defecto, la salida estándar)")
+    parser.add_argument("--exportar", metavar="DIRECTORIO",
+                        help="Exportar además procesos, ciclos y transiciones por columnas")
+    parser.add_argument("--formato-exportacion", choices=("parquet", "arrow", "npz"),
+                        help="Formato de --exportar (parquet si pyarrow está instalado, si no npz)")
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Crea el parser de argumentos de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Simulador de estados de procesos")
+    subcomandos = parser.add_subparsers(dest="comando", metavar="COMANDO")
+
+    interactivo = subcomandos.add_parser("interactivo", help="Simulación con visualización en vivo")
+    _agregar_parametros(interactivo, "ticks")
+    interactivo.add_argument("--fps", type=float, default=FPS, help="Cuadros por segundo máximos")
+    interactivo.add_argument("--ciclos-por-segundo", type=float, default=CICLOS_POR_SEGUNDO,
+                             help="Ritmo de la simulación (sin pausas si no se indica)")
+
+    lote = subcomandos.add_parser("lote", help="Simulación sin pantalla con resultados en JSON")
+    _agregar_parametros(lote, "eventos")
+    lote.add_argument("--carga", help="Carga de trabajo: CSV (ver carga.guardar_csv) o traza .swf")
+    lote.add_argument("--grabar-traza", metavar="RUTA", help="Grabar las decisiones aleatorias para reproducir")
+    lote.add_argument("--cache", metavar="DIRECTORIO",
+                      help="Caché de resultados en disco (sólo con --semilla, sin --grabar-traza ni --exportar)")
+    lote.add_argument("--tamano-cache", type=int, default=256, metavar="MB", help="Tamaño máximo de la caché")
+    lote.add_argument("--sin-cache", action="store_true", help="Simular sin usar la caché (para medir tiempos)")
+    _agregar_salida(lote)
+
+    reproducir = subcomandos.add_parser("reproducir", help="Ejecuta de nuevo una traza grabada")
+    reproducir.add_argument("traza", help="Archivo grabado con lote --grabar-traza")
+    # Las decisiones aleatorias salen de la traza: no hay semilla
+    _agregar_parametros(reproducir, "eventos", semilla=False)
+    # La traza no guarda la carga: se pasa la misma que se usó al grabarla
+    reproducir.add_argument("--carga", help="Carga con la que se grabó la traza (CSV o .swf)")
+    _agregar_salida(reproducir)
+
+    # Las opciones del barrido las interpreta barrido.py, que sólo se importa si se usa
+    subcomandos.add_parser("barrido", add_help=False,
+                           help="Barrido de parámetros en varios núcleos (main.py barrido --help)")
+    return parser
+
+def _crear_simulador(argumentos: argparse.Namespace, **opciones) -> Simulador:
+    simulador = Simulador(quantum=argumentos.quantum, ciclos=argumentos.ciclos, semilla=getattr(argumentos, 'semilla', None),
+                          motor=argumentos.motor, representacion=argumentos.representacion,
+                          nucleos=argumentos.nucleos, politica=crear_politica(argumentos.politica), **opciones)
+    simulador.probabilidad_admision = argumentos.probabilidad_admision
+    simulador.probabilidad_suspension = argumentos.probabilidad_suspension
+    return simulador
+
+def _abrir_carga(ruta: str):
+    from carga import CargaCSV, CargaSWF
+
+    if os.path.splitext(ruta)[1].lower() == ".swf":
+        return CargaSWF(ruta)
+    return CargaCSV(ruta)
+
+def _parametros(argumentos: argparse.Namespace) -> Dict:
+    return {nombre: getattr(argumentos, nombre, None) for nombre in (
+        'quantum', 'ciclos', 'cantidad_procesos', 'semilla', 'motor', 'representacion', 'nucleos', 'politica',
+        'probabilidad_admision', 'probabilidad_suspension')}
+
+def ejecutar_lote(argumentos: argparse.Namespace, aleatorio=None, carga=None, cache=None) -> Dict:
+    """
+    Ejecuta una simulación sin pantalla a toda velocidad.
+
+    Con `cache` (CacheResultados) una configuración ya simulada se lee del disco; la clave
+    incluye los parámetros, la semilla y el contenido del archivo de carga.
+
+    Returns:
+        Dict: Parámetros, resultados finales (sin los historiales), duración en segundos y,
+            con caché, sus contadores
+    """
+    if cache is not None:
+        from cache_resultados import huella_archivo
+
+        ruta_carga = getattr(argumentos, 'carga', None)
+        configuracion = {**_parametros(argumentos), 'carga': huella_archivo(ruta_carga) if ruta_carga else None}
+        inicio = time.perf_counter()
+        resultados = cache.obtener_o_calcular(configuracion, lambda: ejecutar_lote(argumentos, aleatorio, carga))
+        # En un acierto la duración es la de la lectura
+        return {**resultados, 'duracion_segundos': time.perf_counter() - inicio, 'cache': cache.contadores()}
+
+    # Los resultados no listan procesos ni historiales: sólo la exportación los necesita
+    exportar = bool(argumentos.exportar)
+    simulador = _crear_simulador(argumentos, mostrar_swapping=False, aleatorio=aleatorio, carga=carga,
+                                 conservar_terminados=exportar, historial=exportar)
+    exportador = None
+    if argumentos.exportar:
+        from exportacion import ExportadorSimulacion
+        exportador = ExportadorSimulacion(simulador, argumentos.exportar, argumentos.formato_exportacion)
+
+    inicio = time.perf_counter()
+    resultados = simulador.simular(argumentos.cantidad_procesos)
+    duracion = time.perf_counter() - inicio
+    if exportador is not None:
+        exportador.cerrar()
+    simulador.cerrar()
+
+    resultados.pop('historial_estados', None)
+    resultados.pop('historial_estadisticas', None)
+    return {'parametros': _parametros(argumentos), **resultados, 'duracion_segundos': duracion}
+
+def _escribir_resultados(resultados: Dict, ruta: Optional[str]):
+    texto = json.dumps(resultados, ensure_ascii=False)
+    if ruta is None:
+        print(texto)
+        return
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write(texto + "\n")
+
+def _interactivo(argumentos: argparse.Namespace):
+    from interfaz import Interfaz
+
+    simulador = _crear_simulador(argumentos)
+    interfaz = Interfaz(fps=argumentos.fps)
     # Ejecutar simulación con visualización en tiempo real
-    interfaz.simular_en_tiempo_real(simulador, CANTIDAD_PROCESOS)
+    interfaz.simular_en_tiempo_real(simulador, argumentos.cantidad_procesos, argumentos.ciclos_por_segundo)
+
+def _lote(argumentos: argparse.Namespace):
+    aleatorio = carga = None
+    if argumentos.grabar_traza:
+        from traza import GrabadorTraza
+        aleatorio = GrabadorTraza(argumentos.semilla)
+    if argumentos.carga:
+        carga = _abrir_carga(argumentos.carga)
+    cache = None
+    # Sin semilla la corrida no se repite, y grabar o exportar necesitan simular
+    if argumentos.cache and argumentos.semilla is not None and not argumentos.grabar_traza and not argumentos.exportar:
+        from cache_resultados import CacheResultados
+        cache = CacheResultados(argumentos.cache, argumentos.tamano_cache * 2**20, argumentos.sin_cache)
+    resultados = ejecutar_lote(argumentos, aleatorio, carga, cache)
+    if aleatorio is not None:
+        aleatorio.guardar(argumentos.grabar_traza)
+    _escribir_resultados(resultados, argumentos.salida)
+
+def _reproducir(argumentos: argparse.Namespace):
+    from traza import ReproductorTraza
+
+    reproductor = ReproductorTraza(argumentos.traza)
+    carga = None
+    try:
+        if argumentos.carga:
+            carga = _abrir_carga(argumentos.carga)
+        resultados = ejecutar_lote(argumentos, aleatorio=reproductor, carga=carga)
+    except EOFError as error:
+        if carga is None:
+            raise EOFError(f"{error} (si se grabó con --carga, hay que indicar la misma carga)") from error
+        raise
+    finally:
+        reproductor.cerrar()
+    resultados['traza'] = argumentos.traza
+    _escribir_resultados(resultados, argumentos.salida)
+
+def main(argv: Optional[Sequence[str]] = None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    parser = crear_parser()
+    argumentos, resto = parser.parse_known_args(argv)
+    if argumentos.comando == "barrido":
+        import barrido
+        return barrido.main(resto)
+    if resto:
+        parser.error(f"argumentos no reconocidos: {' '.join(resto)}")
+    if argumentos.comando is None:
+        # Sin subcomando: la simulación interactiva con los valores por defecto
+        argumentos = parser.parse_args(["interactivo"])
+
+    try:
+        if argumentos.comando == "interactivo":
+            _interactivo(argumentos)
+        elif argumentos.comando == "lote":
+            _lote(argumentos)
+        else:
+            _reproducir(argumentos)
+    except (ValueError, OSError, EOFError) as error:
+        parser.exit(2, f"{parser.prog} {argumentos.comando}: error: {error}\n")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,341 @@
+import heapq
+import re
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+from distribuciones import FuenteAleatoria
+from proceso import Proceso, EstadoProceso
+
+# Un byte del mapa con algún marco libre
+_BYTE_CON_LIBRES = re.compile(rb"[^\xff]")
+
+class MapaMarcos:
+    """
+    Marcos de memoria física con su ocupación en un mapa de bits.
+
+    El marco `m` es el bit `m % 8` del byte `m // 8`. La búsqueda de marcos libres
+    continúa desde el último byte usado (next-fit) y salta los bytes llenos con una
+    expresión regular, que recorre el mapa en C.
+
+    Atributos:
+        total (int): Marcos de la memoria
+        libres (int): Marcos sin asignar
+    """
+
+    def __init__(self, marcos: int):
+        if marcos < 1:
+            raise ValueError(f"El número de marcos debe ser positivo: {marcos}")
+        self.total = marcos
+        self.libres = marcos
+        self._bits = bytearray((marcos + 7) // 8)
+        if marcos % 8:
+            # Los bits sobrantes del último byte cuentan como ocupados
+            self._bits[-1] = (0xFF << (marcos % 8)) & 0xFF
+        self._siguiente = 0
+
+    def asignar(self, cantidad: int) -> array:
+        """Marca como ocupados `cantidad` marcos libres y retorna sus números"""
+        if cantidad > self.libres:
+            raise ValueError(f"No hay {cantidad} marcos libres (quedan {self.libres})")
+        marcos = array('i')
+        bits = self._bits
+        while len(marcos) < cantidad:
+            encontrado = _BYTE_CON_LIBRES.search(bits, self._siguiente) or _BYTE_CON_LIBRES.search(bits)
+            indice = encontrado.start()
+            byte = bits[indice]
+            while byte != 0xFF and len(marcos) < cantidad:
+                bit = (~byte & (byte + 1)).bit_length() - 1
+                byte |= 1 << bit
+                marcos.append(indice * 8 + bit)
+            bits[indice] = byte
+            self._siguiente = indice
+        self.libres -= cantidad
+        return marcos
+
+    def liberar(self, marcos: array):
+        """Marca como libres los marcos indicados"""
+        bits = self._bits
+        for marco in marcos:
+            bits[marco >> 3] &= ~(1 << (marco & 7)) & 0xFF
+        self.libres += len(marcos)
+
+    def ocupado(self, marco: int) -> bool:
+        if not 0 <= marco < self.total:
+            raise IndexError(f"Marco fuera de rango: {marco}")
+        return bool(self._bits[marco >> 3] & (1 << (marco & 7)))
+
+class PoliticaLRU:
+    """Expulsa el proceso residente que lleva más tiempo sin ejecutarse"""
+
+    def __init__(self):
+        # De menos a más reciente
+        self._orden: "OrderedDict[int, None]" = OrderedDict()
+
+    def agregar(self, pid: int, marcos: int, ciclo: int):
+        self._orden[pid] = None
+
+    def acceder(self, pid: int, ciclo: int):
+        if pid in self._orden:
+            self._orden.move_to_end(pid)
+
+    def quitar(self, pid: int):
+        self._orden.pop(pid, None)
+
+    def victima(self, ciclo: int, excluir: Optional[int] = None) -> Optional[int]:
+        return next((pid for pid in self._orden if pid != excluir), None)
+
+    def __len__(self) -> int:
+        return len(self._orden)
+
+class PoliticaClock:
+    """
+    Algoritmo del reloj (segunda oportunidad).
+
+    Los residentes forman un anillo con un bit de referencia que se enciende al
+    ejecutarse; la aguja es la cabeza del anillo. Un proceso con el bit encendido lo
+    pierde y pasa al final; el primero con el bit apagado es la víctima.
+    """
+
+    def __init__(self):
+        self._anillo: "OrderedDict[int, bool]" = OrderedDict()
+
+    def agregar(self, pid: int, marcos: int, ciclo: int):
+        self._anillo[pid] = True
+
+    def acceder(self, pid: int, ciclo: int):
+        if pid in self._anillo:
+            self._anillo[pid] = True
+
+    def quitar(self, pid: int):
+        self._anillo.pop(pid, None)
+
+    def victima(self, ciclo: int, excluir: Optional[int] = None) -> Optional[int]:
+        anillo = self._anillo
+        # En dos vueltas todos los candidatos pierden el bit: la aguja no gira más que eso
+        for _ in range(2 * len(anillo)):
+            pid, referenciado = next(iter(anillo.items()))
+            if pid == excluir:
+                anillo.move_to_end(pid)
+                continue
+            if not referenciado:
+                return pid
+            anillo[pid] = False
+            anillo.move_to_end(pid)
+        return None
+
+    def __len__(self) -> int:
+        return len(self._anillo)
+
+class PoliticaConjuntoTrabajo:
+    """
+    Política del conjunto de trabajo.
+
+    Un proceso que no se ejecutó en los últimos `ventana` ciclos está fuera de su
+    conjunto de trabajo; entre ellos se expulsa primero el que ocupa más marcos, para
+    liberar la mayor cantidad de memoria con un solo intercambio. Si todos están
+    dentro de la ventana se expulsa el menos reciente, como en LRU.
+
+    Atributos:
+        ventana (int): Ciclos sin ejecutarse tras los que un proceso sale del conjunto de trabajo
+    """
+
+    def __init__(self, ventana: int = 50):
+        if ventana < 1:
+            raise ValueError(f"La ventana debe ser positiva: {ventana}")
+        self.ventana = ventana
+        self._ultimo: Dict[int, int] = {}
+        self._marcos: Dict[int, int] = {}
+        # Residentes dentro de la ventana, de menos a más reciente
+        self._recientes: "OrderedDict[int, None]" = OrderedDict()
+        # Residentes fuera de la ventana: (-marcos, último acceso, pid), con entradas obsoletas
+        self._inactivos: List[Tuple[int, int, int]] = []
+
+    def agregar(self, pid: int, marcos: int, ciclo: int):
+        self._ultimo[pid] = ciclo
+        self._marcos[pid] = marcos
+        self._recientes[pid] = None
+
+    def acceder(self, pid: int, ciclo: int):
+        if pid not in self._ultimo:
+            return
+        self._ultimo[pid] = ciclo
+        self._recientes[pid] = None
+        self._recientes.move_to_end(pid)
+
+    def quitar(self, pid: int):
+        self._ultimo.pop(pid, None)
+        self._marcos.pop(pid, None)
+        self._recientes.pop(pid, None)
+
+    def _vigente(self, entrada: Tuple[int, int, int]) -> bool:
+        _, ultimo, pid = entrada
+        return self._ultimo.get(pid) == ultimo and pid not in self._recientes
+
+    def victima(self, ciclo: int, excluir: Optional[int] = None) -> Optional[int]:
+        recientes = self._recientes
+        # Los que salieron de la ventana pasan al heap de inactivos
+        while recientes:
+            pid = next(iter(recientes))
+            if self._ultimo[pid] >= ciclo - self.ventana:
+                break
+            del recientes[pid]
+            heapq.heappush(self._inactivos, (-self._marcos[pid], self._ultimo[pid], pid))
+        inactivos = self._inactivos
+        while inactivos and not self._vigente(inactivos[0]):
+            heapq.heappop(inactivos)
+        if inactivos and inactivos[0][2] == excluir:
+            # El excluido se aparta mientras se busca el siguiente y vuelve al heap
+            apartado = heapq.heappop(inactivos)
+            while inactivos and not self._vigente(inactivos[0]):
+                heapq.heappop(inactivos)
+            candidato = inactivos[0][2] if inactivos else None
+            heapq.heappush(inactivos, apartado)
+            if candidato is not None:
+                return candidato
+        elif inactivos:
+            return inactivos[0][2]
+        return next((pid for pid in recientes if pid != excluir), None)
+
+    def __len__(self) -> int:
+        return len(self._ultimo)
+
+POLITICAS = {
+    'lru': PoliticaLRU,
+    'clock': PoliticaClock,
+    'conjunto_trabajo': PoliticaConjuntoTrabajo,
+}
+
+Politica = Union[PoliticaLRU, PoliticaClock, PoliticaConjuntoTrabajo]
+
+class GestorMemoria:
+    """
+    Memoria principal de la simulación: marcos, procesos residentes y swapping.
+
+    Un proceso ocupa memoria mientras está en LISTO, EJECUTANDO o ESPERANDO. Cuando
+    entrar a memoria (al salir de NUEVO o al reanudarse) excede la capacidad, la
+    política elige qué residentes se suspenden para liberar marcos. Cada intercambio
+    cuesta `latencia_swap` ciclos por marco, que se cargan al `tiempo_swap` del proceso
+    intercambiado.
+
+    Atributos:
+        mapa (MapaMarcos): Ocupación de los marcos
+        politica (Politica): Política que elige las víctimas del swapping
+        marcos_por_proceso (Tuple[int, int]): Mínimo y máximo de marcos de un proceso
+        latencia_swap (int): Ciclos que cuesta intercambiar un marco con el disco
+        swaps_entrada (int): Procesos cargados desde el área de swap
+        swaps_salida (int): Procesos expulsados al área de swap
+        marcos_intercambiados (int): Marcos copiados en ambos sentidos
+    """
+
+    def __init__(self, marcos: int, politica: Union[str, Politica] = "lru",
+                 marcos_por_proceso: Tuple[int, int] = (1, 16), latencia_swap: int = 1):
+        """
+        Args:
+            marcos (int): Marcos de la memoria principal
+            politica (Union[str, Politica]): Nombre de una política de POLITICAS o una instancia
+            marcos_por_proceso (Tuple[int, int]): Rango del tamaño de cada proceso, en marcos
+            latencia_swap (int): Ciclos por marco de cada intercambio
+        """
+        minimo, maximo = marcos_por_proceso
+        if not 1 <= minimo <= maximo:
+            raise ValueError(f"Rango de marcos por proceso inválido: {marcos_por_proceso}")
+        if maximo > marcos:
+            raise ValueError(f"Un proceso de {maximo} marcos no cabe en una memoria de {marcos}")
+        if isinstance(politica, str):
+            if politica not in POLITICAS:
+                raise ValueError(f"Política desconocida: {politica}. Opciones: {', '.join(POLITICAS)}")
+            politica = POLITICAS[politica]()
+        self.mapa = MapaMarcos(marcos)
+        self.politica = politica
+        self.marcos_por_proceso = (minimo, maximo)
+        self.latencia_swap = latencia_swap
+        self.swaps_entrada = 0
+        self.swaps_salida = 0
+        self.marcos_intercambiados = 0
+        self._tamanos: Dict[int, int] = {}
+        self._asignados: Dict[int, array] = {}
+        self._residentes: Dict[int, Proceso] = {}
+
+    def tamano(self, proceso: Proceso, aleatorio: FuenteAleatoria) -> int:
+        """Retorna los marcos que ocupa un proceso (se muestrea la primera vez)"""
+        marcos = self._tamanos.get(proceso.id)
+        if marcos is None:
+            marcos = self._tamanos[proceso.id] = aleatorio.marcos_proceso(*self.marcos_por_proceso)
+        return marcos
+
+    def cabe(self, marcos: int) -> bool:
+        """Indica si hay `marcos` marcos libres sin expulsar a nadie"""
+        return marcos <= self.mapa.libres
+
+    def residente(self, proceso: Proceso) -> bool:
+        return proceso.id in self._residentes
+
+    def victima(self, ciclo: int, excluir: Optional[Proceso] = None) -> Optional[Proceso]:
+        """
+        Retorna el residente que la política expulsaría ahora, o None si no hay ninguno.
+
+        Args:
+            ciclo (int): Ciclo actual
+            excluir (Optional[Proceso]): Residente que no se puede expulsar (el que está en la CPU)
+        """
+        pid = self.politica.victima(ciclo, None if excluir is None else excluir.id)
+        return self._residentes[pid] if pid is not None else None
+
+    def cargar(self, proceso: Proceso, ciclo: int, intercambio: bool):
+        """
+        Asigna marcos a un proceso que entra a memoria.
+
+        Args:
+            proceso (Proceso): Proceso a cargar; su tamaño ya debe estar muestreado
+            ciclo (int): Ciclo de la carga
+            intercambio (bool): Si viene del área de swap (se cobra la latencia)
+        """
+        marcos = self._tamanos[proceso.id]
+        self._asignados[proceso.id] = self.mapa.asignar(marcos)
+        self._residentes[proceso.id] = proceso
+        self.politica.agregar(proceso.id, marcos, ciclo)
+        if intercambio:
+            self.swaps_entrada += 1
+            self._cobrar_intercambio(proceso, marcos)
+
+    def descargar(self, proceso: Proceso, intercambio: bool):
+        """
+        Libera los marcos de un proceso.
+
+        Args:
+            proceso (Proceso): Proceso residente
+            intercambio (bool): Si se copia al área de swap (se cobra la latencia);
+                False cuando el proceso termina
+        """
+        marcos = self._asignados.pop(proceso.id)
+        self.mapa.liberar(marcos)
+        del self._residentes[proceso.id]
+        self.politica.quitar(proceso.id)
+        if intercambio:
+            self.swaps_salida += 1
+            self._cobrar_intercambio(proceso, len(marcos))
+        else:
+            del self._tamanos[proceso.id]  # Terminó: no vuelve a cargarse
+
+    def _cobrar_intercambio(self, proceso: Proceso, marcos: int):
+        self.marcos_intercambiados += marcos
+        proceso.tiempo_swap += marcos * self.latencia_swap
+
+    def registrar(self, ciclo: int, proceso: Proceso, anterior: Optional[EstadoProceso], nuevo: EstadoProceso):
+        """Oyente de transiciones: cada despacho cuenta como un acceso a la memoria del proceso"""
+        if nuevo == EstadoProceso.EJECUTANDO:
+            self.politica.acceder(proceso.id, ciclo)
+
+    def obtener_estadisticas(self) -> Dict:
+        """Retorna la ocupación de la memoria y los contadores de swapping"""
+        return {
+            'marcos': self.mapa.total,
+            'marcos_libres': self.mapa.libres,
+            'utilizacion': 1 - self.mapa.libres / self.mapa.total,
+            'residentes': len(self._residentes),
+            'politica': type(self.politica).__name__,
+            'swaps_entrada': self.swaps_entrada,
+            'swaps_salida': self.swaps_salida,
+            'marcos_intercambiados': self.marcos_intercambiados,
+            'ciclos_swap': self.marcos_intercambiados * self.latencia_swap,
+        }
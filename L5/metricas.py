@@ -0,0 +1,232 @@
+import bisect
+import math
+from array import array
+from typing import Dict, Optional
+from proceso import Proceso, EstadoProceso, CODIGO_ESTADO
+
+class EstadisticaIncremental:
+    """
+    Media y varianza de una serie de valores, actualizadas valor a valor (método de Welford).
+
+    Atributos:
+        cantidad (int): Valores agregados
+        media (float): Media de los valores
+        minimo (float): Menor valor agregado
+        maximo (float): Mayor valor agregado
+    """
+    __slots__ = ("cantidad", "media", "_m2", "minimo", "maximo")
+
+    def __init__(self):
+        self.cantidad = 0
+        self.media = 0.0
+        self._m2 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+
+    def agregar(self, valor: float):
+        """Agrega un valor en O(1)"""
+        self.cantidad += 1
+        delta = valor - self.media
+        self.media += delta / self.cantidad
+        self._m2 += delta * (valor - self.media)
+        if valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+
+    @property
+    def varianza(self) -> float:
+        """Varianza muestral (0 con menos de dos valores)"""
+        return self._m2 / (self.cantidad - 1) if self.cantidad > 1 else 0.0
+
+    @property
+    def desviacion(self) -> float:
+        return math.sqrt(self.varianza)
+
+class CuantilP2:
+    """
+    Estimación de un cuantil sin guardar los valores (algoritmo P² de Jain y Chlamtac).
+
+    Mantiene cinco marcadores cuyas alturas aproximan el mínimo, el cuantil p/2, el
+    cuantil p, el cuantil (1+p)/2 y el máximo; cada valor nuevo los ajusta con una
+    interpolación parabólica. Agregar y consultar cuestan O(1) y la memoria es constante.
+    Con cinco valores o menos el resultado es exacto.
+
+    Atributos:
+        p (float): Cuantil estimado, entre 0 y 1
+        cantidad (int): Valores agregados
+    """
+    __slots__ = ("p", "cantidad", "_alturas", "_posiciones", "_deseadas", "_incrementos")
+
+    def __init__(self, p: float):
+        if not 0 < p < 1:
+            raise ValueError(f"El cuantil debe estar entre 0 y 1: {p}")
+        self.p = p
+        self.cantidad = 0
+        self._alturas = []
+        self._posiciones = [1, 2, 3, 4, 5]
+        self._deseadas = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self._incrementos = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def agregar(self, valor: float):
+        """Agrega un valor en O(1)"""
+        self.cantidad += 1
+        q = self._alturas
+        if self.cantidad <= 5:
+            bisect.insort(q, valor)
+            return
+
+        # Celda en la que cae el valor; los extremos se amplían si hace falta
+        if valor < q[0]:
+            q[0] = valor
+            k = 0
+        elif valor >= q[4]:
+            q[4] = valor
+            k = 3
+        else:
+            k = bisect.bisect_right(q, valor, 1, 4) - 1
+
+        n = self._posiciones
+        for i in range(k + 1, 5):
+            n[i] += 1
+        deseadas = self._deseadas
+        for i in range(5):
+            deseadas[i] += self._incrementos[i]
+
+        # Ajustar los marcadores intermedios que se alejaron de su posición deseada
+        for i in (1, 2, 3):
+            d = deseadas[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                s = 1 if d > 0 else -1
+                parabolica = q[i] + s / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + s) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+                    (n[i + 1] - n[i] - s) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if q[i - 1] < parabolica < q[i + 1]:
+                    q[i] = parabolica
+                else:
+                    q[i] += s * (q[i + s] - q[i]) / (n[i + s] - n[i])
+                n[i] += s
+
+    @property
+    def valor(self) -> float:
+        """Cuantil estimado (0 si no hay valores)"""
+        if self.cantidad == 0:
+            return 0.0
+        if self.cantidad <= 5:
+            return self._alturas[min(self.cantidad - 1, int(self.p * self.cantidad))]
+        return self._alturas[2]
+
+class MetricaTiempo:
+    """
+    Distribución de una métrica de tiempo: media, varianza y percentiles 50, 95 y 99.
+
+    Atributos:
+        estadistica (EstadisticaIncremental): Cantidad, media, varianza, mínimo y máximo
+    """
+    __slots__ = ("estadistica", "_p50", "_p95", "_p99")
+
+    def __init__(self):
+        self.estadistica = EstadisticaIncremental()
+        self._p50 = CuantilP2(0.50)
+        self._p95 = CuantilP2(0.95)
+        self._p99 = CuantilP2(0.99)
+
+    def agregar(self, valor: float):
+        self.estadistica.agregar(valor)
+        self._p50.agregar(valor)
+        self._p95.agregar(valor)
+        self._p99.agregar(valor)
+
+    @property
+    def media(self) -> float:
+        return self.estadistica.media
+
+    @property
+    def varianza(self) -> float:
+        return self.estadistica.varianza
+
+    # Cada percentil se estima por separado; con pocos valores las estimaciones pueden
+    # cruzarse, así que se fuerza que no decrezcan
+    @property
+    def p50(self) -> float:
+        return self._p50.valor
+
+    @property
+    def p95(self) -> float:
+        return max(self._p95.valor, self.p50)
+
+    @property
+    def p99(self) -> float:
+        return max(self._p99.valor, self.p95)
+
+    def resumen(self) -> Dict[str, float]:
+        """Retorna todas las medidas en un diccionario"""
+        estadistica = self.estadistica
+        return {
+            'media': estadistica.media,
+            'desviacion': estadistica.desviacion,
+            'minimo': estadistica.minimo if estadistica.cantidad else 0,
+            'maximo': estadistica.maximo if estadistica.cantidad else 0,
+            'p50': self.p50,
+            'p95': self.p95,
+            'p99': self.p99,
+        }
+
+class MetricasIncrementales:
+    """
+    Métricas de la simulación actualizadas en cada transición de estado.
+
+    Se usa como oyente de PlanificadorProcesos.suscribir_transiciones. Mantiene la
+    cantidad de procesos en cada estado y, para los procesos terminados, la distribución
+    de los tiempos de espera, respuesta y retorno (finalización menos creación). Todas
+    las lecturas (`cantidad`, `espera.p99`, ...) cuestan O(1) y no recorren las colas, así
+    que se pueden consultar en cada ciclo.
+
+    Atributos:
+        poblacion (array): Procesos en cada estado, indexado por CODIGO_ESTADO
+        admitidos (int): Procesos admitidos en el sistema
+        espera (MetricaTiempo): Tiempo de espera de los procesos terminados
+        respuesta (MetricaTiempo): Tiempo de respuesta de los procesos terminados
+        retorno (MetricaTiempo): Tiempo de retorno de los procesos terminados
+    """
+
+    def __init__(self):
+        self.poblacion = array('q', [0] * len(CODIGO_ESTADO))
+        self.admitidos = 0
+        self.espera = MetricaTiempo()
+        self.respuesta = MetricaTiempo()
+        self.retorno = MetricaTiempo()
+
+    def registrar(self, ciclo: int, proceso: Proceso, anterior: Optional[EstadoProceso],
+                  nuevo: EstadoProceso):
+        """Actualiza las métricas con una transición"""
+        if anterior is None:
+            self.admitidos += 1
+        else:
+            self.poblacion[CODIGO_ESTADO[anterior]] -= 1
+        self.poblacion[CODIGO_ESTADO[nuevo]] += 1
+
+        if nuevo == EstadoProceso.TERMINADO:
+            self.espera.agregar(proceso.tiempo_espera)
+            self.respuesta.agregar(proceso.tiempo_respuesta or 0)
+            self.retorno.agregar(proceso.tiempo_finalizacion - proceso.tiempo_creacion)
+
+    def cantidad(self, estado: EstadoProceso) -> int:
+        """Retorna cuántos procesos hay en un estado"""
+        return self.poblacion[CODIGO_ESTADO[estado]]
+
+    @property
+    def completados(self) -> int:
+        return self.poblacion[CODIGO_ESTADO[EstadoProceso.TERMINADO]]
+
+    def resumen(self) -> Dict:
+        """Retorna todas las métricas en un diccionario (para resultados finales)"""
+        return {
+            'poblacion': {estado.value: self.poblacion[codigo] for estado, codigo in CODIGO_ESTADO.items()},
+            'admitidos': self.admitidos,
+            'completados': self.completados,
+            'tiempo_espera': self.espera.resumen(),
+            'tiempo_respuesta': self.respuesta.resumen(),
+            'tiempo_retorno': self.retorno.resumen(),
+        }
@@ -0,0 +1,270 @@
+import math
+from statistics import NormalDist
+from typing import Dict, List, Optional
+import numpy as np
+from proceso import EstadoProceso, CODIGO_ESTADO
+
+# Códigos de estado en los arreglos; PENDIENTE marca procesos aún no admitidos
+PENDIENTE = -1
+NUEVO = CODIGO_ESTADO[EstadoProceso.NUEVO]
+LISTO = CODIGO_ESTADO[EstadoProceso.LISTO]
+EJECUTANDO = CODIGO_ESTADO[EstadoProceso.EJECUTANDO]
+ESPERANDO = CODIGO_ESTADO[EstadoProceso.ESPERANDO]
+TERMINADO = CODIGO_ESTADO[EstadoProceso.TERMINADO]
+LISTO_SUSPENDIDO = CODIGO_ESTADO[EstadoProceso.LISTO_SUSPENDIDO]
+ESPERANDO_SUSPENDIDO = CODIGO_ESTADO[EstadoProceso.ESPERANDO_SUSPENDIDO]
+
+# Fases de un ciclo en las que un proceso puede entrar a LISTO, en orden
+FASE_NUEVOS, FASE_IO, FASE_QUANTUM, FASE_REANUDACION = range(4)
+
+SIN_CLAVE = np.iinfo(np.int64).max
+
+class SimuladorMonteCarlo:
+    """
+    Ejecuta muchas réplicas independientes de la simulación a la vez sobre arreglos NumPy.
+
+    Reproduce el modelo de Simulador (admisión, retardo en NUEVO, Round-Robin, I/O y
+    swapping de la cabeza de cada cola) pero guarda el estado de todos los procesos de
+    todas las réplicas en arreglos de forma (replicaciones × procesos) y avanza todas las
+    réplicas en cada ciclo con operaciones vectorizadas. Los números aleatorios de cada
+    decisión se muestrean en bloque para todas las réplicas.
+
+    El orden FIFO de cada cola se representa con una clave por proceso (ciclo, fase y
+    orden dentro de la fase); la cabeza de una cola es el proceso con la menor clave.
+
+    Los resultados siguen la distribución del motor de Simulador, pero no son idénticos
+    réplica a réplica porque el orden en que se consumen los números aleatorios es distinto.
+
+    Atributos:
+        quantum (int): Tiempo máximo de ejecución por proceso
+        ciclos (int): Número total de ciclos de cada réplica
+        replicaciones (int): Número de réplicas independientes
+        probabilidad_admision (float): Probabilidad por ciclo de admitir un nuevo proceso (30%)
+        probabilidad_suspension (float): Probabilidad de suspender un proceso (40%)
+        probabilidad_reanudacion (float): Probabilidad de reanudar un proceso suspendido (30%)
+        probabilidad_io (float): Probabilidad de que un proceso necesite I/O tras ejecutar (20%)
+        probabilidad_fin_io (float): Probabilidad por ciclo de completar una operación de I/O (30%)
+        retardo_admision (int): Tiempo mínimo que un proceso permanece en NUEVO
+        rng (np.random.Generator): Generador aleatorio de todas las réplicas
+    """
+
+    def __init__(self, quantum: int = 2, ciclos: int = 100, replicaciones: int = 1000,
+                 semilla: Optional[int] = None):
+        """
+        Inicializa el simulador Monte Carlo.
+
+        Args:
+            quantum (int): Tiempo máximo de ejecución por proceso
+            ciclos (int): Número total de ciclos de cada réplica
+            replicaciones (int): Número de réplicas independientes
+            semilla (Optional[int]): Semilla del generador aleatorio
+        """
+        self.quantum = quantum
+        self.ciclos = ciclos
+        self.replicaciones = replicaciones
+        self.probabilidad_admision = 0.3
+        self.probabilidad_suspension = 0.4
+        self.probabilidad_reanudacion = 0.3
+        self.probabilidad_io = 0.2
+        self.probabilidad_fin_io = 0.3
+        self.retardo_admision = 3
+        self.rng = np.random.default_rng(semilla)
+
+    def _geometrica(self, probabilidad: float, cantidad: int) -> np.ndarray:
+        """Muestrea en bloque el número de ciclos hasta el próximo evento"""
+        if probabilidad <= 0:
+            return np.full(cantidad, SIN_CLAVE // 2, dtype=np.int64)
+        return self.rng.geometric(min(probabilidad, 1.0), cantidad)
+
+    @staticmethod
+    def _cabezas(mascara: np.ndarray, claves: np.ndarray):
+        """
+        Localiza la cabeza de una cola en cada réplica.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Réplicas con la cola no vacía y la columna de su cabeza
+        """
+        enmascaradas = np.where(mascara, claves, SIN_CLAVE)
+        columnas = enmascaradas.argmin(axis=1)
+        filas = np.flatnonzero(enmascaradas[np.arange(columnas.size), columnas] != SIN_CLAVE)
+        return filas, columnas[filas]
+
+    def simular(self, cantidad_procesos: int = 15, nivel_confianza: float = 0.95) -> Dict:
+        """
+        Ejecuta todas las réplicas.
+
+        Args:
+            cantidad_procesos (int): Número de procesos de cada réplica
+            nivel_confianza (float): Nivel de confianza de los intervalos agregados
+
+        Returns:
+            Dict: 'replicaciones' con el resultado de cada réplica (mismas claves que
+                Simulador.obtener_resultados_finales, sin historiales) y 'agregados'
+                con media, desviación estándar e intervalo de confianza de cada métrica
+        """
+        R, N = self.replicaciones, cantidad_procesos
+        rng = self.rng
+        # Las claves de ESPERANDO (2 por ciclo) y de NUEVOS (columna) caben en una fase
+        ancho_fase = max(N, 2 * self.ciclos + 2)
+
+        estado = np.full((R, N), PENDIENTE, dtype=np.int8)
+        restante = rng.integers(5, 21, size=(R, N), dtype=np.int64)
+        creacion = np.zeros((R, N), dtype=np.int64)
+        espera = np.zeros((R, N), dtype=np.int64)
+        respuesta = np.full((R, N), -1, dtype=np.int64)
+        fin_io = np.zeros((R, N), dtype=np.int64)
+        clave_listo = np.zeros((R, N), dtype=np.int64)
+        clave_espera = np.zeros((R, N), dtype=np.int64)
+        clave_suspendido = np.zeros((R, N), dtype=np.int64)
+
+        tiempo = np.zeros(R, dtype=np.int64)
+        siguiente_admitido = np.zeros(R, dtype=np.int64)
+        proxima_admision = self._geometrica(self.probabilidad_admision, R)
+        proximo_swapping = self._geometrica(self.probabilidad_suspension, R)
+        espera_total = np.zeros(R, dtype=np.int64)
+        respuesta_total = np.zeros(R, dtype=np.int64)
+        completados = np.zeros(R, dtype=np.int64)
+
+        for ciclo in range(1, self.ciclos + 1):
+            # Clave FIFO de LISTO para cada fase del ciclo
+            clave = [(ciclo * 4 + fase) * ancho_fase for fase in range(4)]
+
+            # Admisión
+            filas = np.flatnonzero((proxima_admision == ciclo) & (siguiente_admitido < N))
+            if filas.size:
+                columnas = siguiente_admitido[filas]
+                estado[filas, columnas] = NUEVO
+                creacion[filas, columnas] = tiempo[filas]
+                siguiente_admitido[filas] += 1
+                proxima_admision[filas] = ciclo + self._geometrica(self.probabilidad_admision, filas.size)
+
+            tiempo += 1
+
+            # NUEVO -> LISTO, en orden de admisión
+            mascara = (estado == NUEVO) & (tiempo[:, None] - creacion >= self.retardo_admision)
+            filas, columnas = np.nonzero(mascara)
+            estado[filas, columnas] = LISTO
+            clave_listo[filas, columnas] = clave[FASE_NUEVOS] + columnas
+
+            # ESPERANDO -> LISTO, en orden de llegada a ESPERANDO
+            mascara = (estado == ESPERANDO) & (fin_io <= ciclo)
+            estado[mascara] = LISTO
+            clave_listo[mascara] = clave[FASE_IO] + clave_espera[mascara]
+
+            # Despacho y ejecución de la cabeza de LISTO
+            filas, columnas = self._cabezas(estado == LISTO, clave_listo)
+            if filas.size:
+                estado[filas, columnas] = EJECUTANDO
+                sin_respuesta = respuesta[filas, columnas] < 0
+                respuesta[filas[sin_respuesta], columnas[sin_respuesta]] = (
+                    tiempo[filas[sin_respuesta]] - creacion[filas[sin_respuesta], columnas[sin_respuesta]])
+
+                usado = np.minimum(self.quantum, restante[filas, columnas])
+                restante[filas, columnas] -= usado
+                tiempo[filas] += usado
+
+                io = rng.random(filas.size) < self.probabilidad_io
+                terminado = ~io & (restante[filas, columnas] <= 0)
+                expirado = ~io & ~terminado
+
+                f, c = filas[io], columnas[io]
+                estado[f, c] = ESPERANDO
+                fin_io[f, c] = ciclo + self._geometrica(self.probabilidad_fin_io, f.size)
+                clave_espera[f, c] = 2 * ciclo
+
+                f, c = filas[terminado], columnas[terminado]
+                estado[f, c] = TERMINADO
+                completados[f] += 1
+                espera_total[f] += espera[f, c]
+                respuesta_total[f] += np.maximum(respuesta[f, c], 0)
+
+                # Si no necesitó I/O ni terminó, agotó su quantum
+                f, c = filas[expirado], columnas[expirado]
+                estado[f, c] = LISTO
+                clave_listo[f, c] = clave[FASE_QUANTUM]
+
+            espera += estado == LISTO
+
+            # Swapping de la cabeza de cada cola
+            filas = np.flatnonzero(proximo_swapping == ciclo)
+            if filas.size:
+                self._swapping(ciclo, filas, estado, clave_listo, clave_espera, clave_suspendido,
+                               fin_io, clave[FASE_REANUDACION])
+                proximo_swapping[filas] = ciclo + self._geometrica(self.probabilidad_suspension, filas.size)
+
+            # Si ninguna réplica tiene procesos vivos, el resto de ciclos sólo avanza el reloj
+            if (siguiente_admitido == N).all() and (estado == TERMINADO).all():
+                tiempo += self.ciclos - ciclo
+                break
+
+        pendientes = np.isin(estado, (LISTO, ESPERANDO, LISTO_SUSPENDIDO, ESPERANDO_SUSPENDIDO)).sum(axis=1)
+        return self._resultados(tiempo, completados, espera_total, respuesta_total, pendientes,
+                                nivel_confianza)
+
+    def _swapping(self, ciclo: int, en_swapping: np.ndarray, estado, clave_listo, clave_espera,
+                  clave_suspendido, fin_io, clave_reanudacion: int):
+        """Suspende y reanuda la cabeza de cada cola en las réplicas que hacen swapping"""
+        rng = self.rng
+
+        def cabezas(codigo, claves, probabilidad):
+            filas, columnas = self._cabezas(estado[en_swapping] == codigo, claves[en_swapping])
+            elegidas = rng.random(filas.size) < probabilidad
+            return en_swapping[filas[elegidas]], columnas[elegidas]
+
+        f, c = cabezas(LISTO, clave_listo, self.probabilidad_suspension)
+        estado[f, c] = LISTO_SUSPENDIDO
+        clave_suspendido[f, c] = ciclo
+
+        f, c = cabezas(LISTO_SUSPENDIDO, clave_suspendido, self.probabilidad_reanudacion)
+        estado[f, c] = LISTO
+        clave_listo[f, c] = clave_reanudacion
+
+        f, c = cabezas(ESPERANDO, clave_espera, self.probabilidad_suspension)
+        estado[f, c] = ESPERANDO_SUSPENDIDO
+        clave_suspendido[f, c] = ciclo
+
+        f, c = cabezas(ESPERANDO_SUSPENDIDO, clave_suspendido, self.probabilidad_reanudacion)
+        estado[f, c] = ESPERANDO
+        fin_io[f, c] = ciclo + self._geometrica(self.probabilidad_fin_io, f.size)
+        clave_espera[f, c] = 2 * ciclo + 1
+
+    def _resultados(self, tiempo, completados, espera_total, respuesta_total, pendientes,
+                    nivel_confianza: float) -> Dict:
+        """Arma el resultado de cada réplica y los agregados"""
+        divisor = np.maximum(completados, 1)
+        metricas = {
+            'tiempo_espera_promedio': np.where(completados > 0, espera_total / divisor, 0.0),
+            'tiempo_respuesta_promedio': np.where(completados > 0, respuesta_total / divisor, 0.0),
+            'throughput': np.where(completados > 0, completados / np.maximum(tiempo, 1), 0.0),
+        }
+
+        replicaciones: List[Dict] = [
+            {
+                'estadisticas_finales': {nombre: float(valores[r]) for nombre, valores in metricas.items()},
+                'ciclos_ejecutados': self.ciclos,
+                'procesos_terminados': int(completados[r]),
+                'procesos_pendientes': int(pendientes[r]),
+            }
+            for r in range(self.replicaciones)
+        ]
+
+        metricas['procesos_terminados'] = completados.astype(float)
+        metricas['procesos_pendientes'] = pendientes.astype(float)
+        return {
+            'replicaciones': replicaciones,
+            'agregados': {nombre: self._intervalo(valores, nivel_confianza)
+                          for nombre, valores in metricas.items()},
+        }
+
+    @staticmethod
+    def _intervalo(valores: np.ndarray, nivel_confianza: float) -> Dict:
+        """Media, desviación estándar e intervalo de confianza (aproximación normal)"""
+        n = valores.size
+        media = float(valores.mean()) if n else 0.0
+        desviacion = float(valores.std(ddof=1)) if n > 1 else 0.0
+        margen = NormalDist().inv_cdf(0.5 + nivel_confianza / 2) * desviacion / math.sqrt(n) if n else 0.0
+        return {
+            'media': media,
+            'desviacion': desviacion,
+            'intervalo': (media - margen, media + margen),
+        }
@@ -1,7 +1,10 @@
-from queue import Queue
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Sequence
 from proceso import Proceso, EstadoProceso
-import random
+from distribuciones import FuenteAleatoria, Geometrica
+from cola_procesos import ColaProcesos, VistaProcesos, VistaPrefijo
+from dispositivos_io import DispositivoIO, SubsistemaIO
+from memoria import GestorMemoria
+from politicas import PoliticaPlanificacion, RoundRobin, crear_politica
 
 class PlanificadorProcesos:
     """
@@ -11,35 +14,79 @@ class PlanificadorProcesos:
     Atributos:
         quantum (int): Tiempo máximo de ejecución por proceso
         tiempo_actual (int): Tiempo actual de la simulación
+        ciclo_actual (int): Número de ciclos ejecutados por el planificador
+        retardo_admision (int): Tiempo mínimo que un proceso permanece en NUEVO
+        aleatorio (FuenteAleatoria): Fuente de las decisiones aleatorias (I/O)
+        io (SubsistemaIO): Dispositivos de I/O y fines de I/O programados
+        memoria (Optional[GestorMemoria]): Memoria principal; si es None la memoria es
+            ilimitada y sólo se suspende a pedido
+        politica (PoliticaPlanificacion): Decide qué proceso en LISTO se ejecuta y cuándo se
+            lo desaloja (Round-Robin por defecto; ver politicas.py)
         proceso_actual (Proceso): Proceso que está ejecutándose actualmente
-        cola_nuevos (Queue): Cola de procesos en estado NUEVO
-        cola_listos (Queue): Cola de procesos en estado LISTO
-        cola_esperando (Queue): Cola de procesos en estado ESPERANDO
-        cola_terminados (List): Lista de procesos terminados
-        cola_listo_suspendido (Queue): Cola de procesos en estado LISTO_SUSPENDIDO
-        cola_esperando_suspendido (Queue): Cola de procesos en estado ESPERANDO_SUSPENDIDO
+        cola_nuevos (ColaProcesos): Cola de procesos en estado NUEVO
+        cola_listos (ColaProcesos): Cola de procesos en estado LISTO, en orden de llegada
+            (la política puede despacharlos en otro orden)
+        cola_esperando (ColaProcesos): Cola de procesos en estado ESPERANDO
+        cola_terminados (List): Lista de procesos terminados (vacía si no se conservan)
+        conservar_terminados (bool): Si es False los procesos terminados no se guardan en
+            `cola_terminados` (las estadísticas sólo usan los acumulados)
+        cola_listo_suspendido (ColaProcesos): Cola de procesos en estado LISTO_SUSPENDIDO
+        cola_esperando_suspendido (ColaProcesos): Cola de procesos en estado ESPERANDO_SUSPENDIDO
+        instrumentacion (Optional[Instrumentacion]): Medición por fase de `ejecutar_ciclo`
+            (None si está desactivada)
+        _oyentes (List[Callable]): Funciones notificadas en cada transición de estado
+        _en_ciclo (bool): Indica si se está ejecutando `ejecutar_ciclo`
     """
     
-    def __init__(self, quantum: int = 2):
+    # Fases de `ejecutar_ciclo`, en orden
+    FASES = ('_procesar_nuevos', '_procesar_io', '_ejecutar_proceso')
+    
+    def __init__(self, quantum: int = 2, aleatorio: Optional[FuenteAleatoria] = None,
+                 dispositivos: Optional[Sequence[DispositivoIO]] = None,
+                 memoria: Optional[GestorMemoria] = None,
+                 politica: Optional[PoliticaPlanificacion] = None):
         """
         Inicializa el planificador de procesos.
         
         Args:
             quantum (int): Tiempo máximo de ejecución por proceso
+            aleatorio (Optional[FuenteAleatoria]): Fuente de decisiones aleatorias
+                (una nueva sin semilla si es None)
+            dispositivos (Optional[Sequence[DispositivoIO]]): Dispositivos de I/O (por
+                defecto, un disco con 30% de probabilidad de completar I/O en cada ciclo)
+            memoria (Optional[GestorMemoria]): Memoria principal con capacidad limitada
+            politica (Optional[PoliticaPlanificacion]): Política de planificación
+                (Round-Robin si es None)
         """
         self.quantum = quantum
         self.tiempo_actual = 0
+        self.ciclo_actual = 0
+        self.retardo_admision = 3
+        self.aleatorio = aleatorio if aleatorio is not None else FuenteAleatoria()
+        self.io = SubsistemaIO(dispositivos)
         self.proceso_actual: Optional[Proceso] = None
         
         # Colas para cada estado
-        self.cola_nuevos = Queue()
-        self.cola_listos = Queue()
-        self.cola_esperando = Queue()
+        self.cola_nuevos = ColaProcesos()
+        self.cola_listos = ColaProcesos()
+        self.cola_esperando = ColaProcesos()
         self.cola_terminados: List[Proceso] = []
+        self.conservar_terminados = True
         
         # Colas para estados suspendidos
-        self.cola_listo_suspendido = Queue()
-        self.cola_esperando_suspendido = Queue()
+        self.cola_listo_suspendido = ColaProcesos()
+        self.cola_esperando_suspendido = ColaProcesos()
+        
+        self.instrumentacion = None
+        self._oyentes: List[Callable] = []
+        self._en_ciclo = False
+        
+        self.memoria = memoria
+        if memoria is not None:
+            self.suscribir_transiciones(memoria.registrar)
+        self._politica: PoliticaPlanificacion = RoundRobin()
+        if politica is not None:
+            self.politica = politica
         
         # Estadísticas
         self.estadisticas = {
@@ -48,49 +95,220 @@ class PlanificadorProcesos:
             'procesos_completados': 0
         }
     
+    @property
+    def probabilidad_fin_io(self) -> Optional[float]:
+        """Probabilidad por ciclo de completar I/O del primer dispositivo, si su duración es geométrica"""
+        distribucion = self.io.dispositivos[0].distribucion
+        return distribucion.probabilidad if isinstance(distribucion, Geometrica) else None
+    
+    @probabilidad_fin_io.setter
+    def probabilidad_fin_io(self, probabilidad: float):
+        self.io.dispositivos[0].distribucion = Geometrica(probabilidad)
+    
+    @property
+    def politica(self) -> PoliticaPlanificacion:
+        """Política de planificación en uso"""
+        return self._politica
+    
+    @politica.setter
+    def politica(self, politica):
+        """
+        Cambia la política (acepta también su nombre en POLITICAS); los procesos en LISTO
+        pasan a la nueva en orden de llegada.
+        """
+        if isinstance(politica, str):
+            politica = crear_politica(politica)
+        self._validar_politica(politica)
+        self._politica = politica
+        if politica.ordenada:
+            # Cada proceso conserva el ciclo en que entró a LISTO (y con él su envejecimiento)
+            for proceso in self.cola_listos.copiar():
+                politica.agregar(proceso, proceso.ciclo_estado)
+    
+    def _validar_politica(self, politica: PoliticaPlanificacion):
+        """Rechaza las políticas que este planificador no puede aplicar"""
+    
+    def cambiar_prioridad(self, pid: int, prioridad: int):
+        """Cambia la prioridad de un proceso; si está en LISTO se reordena en O(log n)"""
+        proceso = self._buscar(pid)
+        proceso.prioridad = prioridad
+        if self._politica.ordenada and proceso.estado == EstadoProceso.LISTO:
+            self._politica.actualizar(proceso, proceso.ciclo_estado)
+    
+    def _buscar(self, pid: int) -> Proceso:
+        """Busca un proceso vivo por id en la CPU o en las colas"""
+        if self.proceso_actual is not None and self.proceso_actual.id == pid:
+            return self.proceso_actual
+        for cola in (self.cola_listos, self.cola_nuevos, self.cola_esperando,
+                     self.cola_listo_suspendido, self.cola_esperando_suspendido):
+            proceso = cola.buscar(pid)
+            if proceso is not None:
+                return proceso
+        raise ValueError(f"El proceso {pid} no está en el planificador")
+    
+    def suscribir_transiciones(self, oyente: Callable):
+        """
+        Registra una función que se llama en cada transición de estado.
+        
+        La función recibe (ciclo, proceso, estado_anterior, estado_nuevo). El ciclo es el
+        primero cuyo estado refleja la transición: las que ocurren fuera de `ejecutar_ciclo`
+        (admisión y swapping) cuentan para el ciclo siguiente. El estado anterior es None
+        cuando el proceso recién se admite.
+        """
+        self._oyentes.append(oyente)
+    
+    def desuscribir_transiciones(self, oyente: Callable):
+        """Deja de notificar a una función registrada con `suscribir_transiciones`"""
+        self._oyentes.remove(oyente)
+    
+    def _transicion(self, proceso: Proceso, estado: EstadoProceso, admision: bool = False):
+        """
+        Cambia el estado de un proceso y notifica a los oyentes.
+        
+        El tiempo que el proceso pasó en su estado anterior (incluida la espera en LISTO)
+        se carga aquí, así que no hay que recorrer las colas en cada ciclo.
+        """
+        ciclo = self.ciclo_actual if self._en_ciclo else self.ciclo_actual + 1
+        if admision:
+            anterior = None
+            proceso.estado = estado
+            proceso.ciclo_estado = ciclo
+        else:
+            anterior = proceso.estado
+            proceso.cambiar_estado(estado, ciclo)
+        if self._oyentes:
+            for oyente in self._oyentes:
+                oyente(ciclo, proceso, anterior, estado)
+    
     def admitir_proceso(self, proceso: Proceso):
         """Admite un nuevo proceso al sistema"""
         proceso.tiempo_creacion = self.tiempo_actual
-        proceso.estado = EstadoProceso.NUEVO  # Aseguramos que el proceso comience en NUEVO
-        self.cola_nuevos.put(proceso)
+        self._transicion(proceso, EstadoProceso.NUEVO, admision=True)  # Aseguramos que el proceso comience en NUEVO
+        self.cola_nuevos.agregar(proceso)
     
     def mover_a_listo(self, proceso: Proceso):
         """Mueve un proceso al estado LISTO"""
-        proceso.estado = EstadoProceso.LISTO
-        self.cola_listos.put(proceso)
+        self._transicion(proceso, EstadoProceso.LISTO)
+        self._encolar_listo(proceso)
+    
+    def _encolar_listo(self, proceso: Proceso):
+        """Agrega un proceso en LISTO a la cola de listos y a la de la política"""
+        self.cola_listos.agregar(proceso)
+        if self._politica.ordenada:
+            self._politica.agregar(proceso, proceso.ciclo_estado)
     
     def mover_a_esperando(self, proceso: Proceso):
-        """Mueve un proceso al estado ESPERANDO"""
-        proceso.estado = EstadoProceso.ESPERANDO
-        self.cola_esperando.put(proceso)
+        """Mueve un proceso al estado ESPERANDO y programa el ciclo en que termina su I/O"""
+        self._transicion(proceso, EstadoProceso.ESPERANDO)
+        proceso.ciclo_fin_io = self.io.solicitar(proceso, self.ciclo_actual, self.aleatorio)
+        self.cola_esperando.agregar(proceso)
     
     def mover_a_terminado(self, proceso: Proceso):
         """Mueve un proceso al estado TERMINADO"""
-        proceso.estado = EstadoProceso.TERMINADO
         proceso.calcular_tiempo_finalizacion(self.tiempo_actual)
-        self.cola_terminados.append(proceso)
+        self._transicion(proceso, EstadoProceso.TERMINADO)
+        if self.conservar_terminados:
+            self.cola_terminados.append(proceso)
+        self._politica.terminado(proceso)
         self.estadisticas['procesos_completados'] += 1
         self.estadisticas['tiempo_espera_total'] += proceso.tiempo_espera
         if proceso.tiempo_respuesta:
             self.estadisticas['tiempo_respuesta_total'] += proceso.tiempo_respuesta
+        if self.memoria is not None:
+            self.memoria.descargar(proceso, intercambio=False)
+            self._reanudar_con_memoria_libre()
     
     def suspender_proceso(self, proceso: Proceso):
-        """Suspende un proceso (simula swapping)"""
+        """Suspende un proceso en LISTO o ESPERANDO, esté donde esté en su cola (simula swapping)"""
         if proceso.estado == EstadoProceso.LISTO:
-            proceso.estado = EstadoProceso.LISTO_SUSPENDIDO
-            self.cola_listo_suspendido.put(proceso)
+            self.cola_listos.quitar(proceso.id)
+            if self._politica.ordenada:
+                self._politica.quitar(proceso)
+            self._transicion(proceso, EstadoProceso.LISTO_SUSPENDIDO)
+            self.cola_listo_suspendido.agregar(proceso)
         elif proceso.estado == EstadoProceso.ESPERANDO:
-            proceso.estado = EstadoProceso.ESPERANDO_SUSPENDIDO
-            self.cola_esperando_suspendido.put(proceso)
+            self.cola_esperando.quitar(proceso.id)
+            self.io.cancelar(proceso)
+            self._transicion(proceso, EstadoProceso.ESPERANDO_SUSPENDIDO)
+            self.cola_esperando_suspendido.agregar(proceso)
+        else:
+            return
+        if self.memoria is not None:
+            self.memoria.descargar(proceso, intercambio=True)
     
     def reanudar_proceso(self, proceso: Proceso):
-        """Reanuda un proceso suspendido"""
+        """
+        Reanuda un proceso suspendido, esté donde esté en su cola.
+        
+        Con memoria limitada el proceso se carga antes, expulsando a los residentes que
+        elija la política si no hay marcos libres.
+        """
+        if proceso.estado not in (EstadoProceso.LISTO_SUSPENDIDO, EstadoProceso.ESPERANDO_SUSPENDIDO):
+            return
+        if not self._cargar_en_memoria(proceso, intercambio=True):
+            return
         if proceso.estado == EstadoProceso.LISTO_SUSPENDIDO:
-            proceso.estado = EstadoProceso.LISTO
-            self.cola_listos.put(proceso)
+            self.cola_listo_suspendido.quitar(proceso.id)
+            self._transicion(proceso, EstadoProceso.LISTO)
+            self._encolar_listo(proceso)
         elif proceso.estado == EstadoProceso.ESPERANDO_SUSPENDIDO:
-            proceso.estado = EstadoProceso.ESPERANDO
-            self.cola_esperando.put(proceso)
+            self.cola_esperando_suspendido.quitar(proceso.id)
+            self.mover_a_esperando(proceso)
+    
+    def emigrar(self, pid: int) -> Proceso:
+        """
+        Quita del planificador un proceso en LISTO para trasladarlo a otro (ver cluster.py).
+        
+        El proceso sigue en LISTO mientras viaja: al llegar, `inmigrar` carga ese tiempo
+        como espera.
+        """
+        proceso = self.cola_listos.quitar(pid)
+        if self._politica.ordenada:
+            self._politica.quitar(proceso)
+        self._politica.terminado(proceso)
+        if self.memoria is not None:
+            self.memoria.descargar(proceso, intercambio=True)
+        return proceso
+    
+    def inmigrar(self, proceso: Proceso):
+        """Recibe en LISTO (o en LISTO_SUSPENDIDO, si no cabe en memoria) un proceso emigrado de otro planificador"""
+        self._admitir_en_memoria(proceso)
+    
+    def _cargar_en_memoria(self, proceso: Proceso, intercambio: bool) -> bool:
+        """
+        Asigna memoria a un proceso, suspendiendo víctimas de la política si hace falta.
+        
+        Returns:
+            bool: True si el proceso quedó cargado (siempre, si la memoria es ilimitada)
+        """
+        memoria = self.memoria
+        if memoria is None:
+            return True
+        ciclo = self.ciclo_actual if self._en_ciclo else self.ciclo_actual + 1
+        marcos = memoria.tamano(proceso, self.aleatorio)
+        while not memoria.cabe(marcos):
+            # Sólo se puede expulsar a quien no está en la CPU
+            victima = memoria.victima(ciclo, excluir=self.proceso_actual)
+            if victima is None or victima.estado not in (EstadoProceso.LISTO, EstadoProceso.ESPERANDO):
+                return False
+            self.suspender_proceso(victima)
+        memoria.cargar(proceso, ciclo, intercambio)
+        return True
+    
+    def _reanudar_con_memoria_libre(self):
+        """Reanuda, en orden, los suspendidos que caben en los marcos libres sin expulsar a nadie"""
+        memoria = self.memoria
+        for cola in (self.cola_listo_suspendido, self.cola_esperando_suspendido):
+            while cola and memoria.cabe(memoria.tamano(cola.primero(), self.aleatorio)):
+                self.reanudar_proceso(cola.primero())
+    
+    def _admitir_en_memoria(self, proceso: Proceso):
+        """Pasa a LISTO un proceso que cumplió su retardo en NUEVO, o a LISTO_SUSPENDIDO si no cabe"""
+        if self._cargar_en_memoria(proceso, intercambio=False):
+            self.mover_a_listo(proceso)
+        else:
+            self._transicion(proceso, EstadoProceso.LISTO_SUSPENDIDO)
+            self.cola_listo_suspendido.agregar(proceso)
     
     def ejecutar_ciclo(self) -> Dict:
         """
@@ -100,75 +318,96 @@ class PlanificadorProcesos:
         1. Procesar nuevos procesos (permanecen en NUEVO por 3 ciclos)
         2. Procesar I/O completado
         3. Ejecutar proceso actual o seleccionar uno nuevo
-        4. Actualizar tiempos de espera
+        
+        Los tiempos de espera no se actualizan por ciclo: se cargan en cada transición.
         
         Returns:
             Dict: Estadísticas actuales del sistema
         """
         # Incrementar el tiempo actual al inicio del ciclo
+        self.ciclo_actual += 1
         self.tiempo_actual += 1
         
-        # Procesar nuevos procesos
+        self._en_ciclo = True
+        if self.instrumentacion is None:
+            self._procesar_nuevos()
+            self._procesar_io()
+            self._ejecutar_proceso()
+        else:
+            self.instrumentacion.ejecutar_fases(self)
+        self._en_ciclo = False
+        
+        return self.obtener_estadisticas()
+    
+    def _procesar_nuevos(self):
+        """Mueve a LISTO los procesos que han cumplido el retardo de admisión en NUEVO"""
         procesos_nuevos = []
-        while not self.cola_nuevos.empty():
-            proceso = self.cola_nuevos.get()
+        while self.cola_nuevos:
+            proceso = self.cola_nuevos.extraer()
             # Si el proceso ha estado en NUEVO por al menos 3 ciclos, lo movemos a LISTO
-            if self.tiempo_actual - proceso.tiempo_creacion >= 3:
-                self.mover_a_listo(proceso)
+            if self.tiempo_actual - proceso.tiempo_creacion >= self.retardo_admision:
+                self._admitir_en_memoria(proceso)
             else:
                 procesos_nuevos.append(proceso)
         
         # Devolver procesos que aún deben permanecer en NUEVO
         for proceso in procesos_nuevos:
-            self.cola_nuevos.put(proceso)
-        
-        # Procesar I/O completado
-        procesos_esperando = []
-        while not self.cola_esperando.empty():
-            proceso = self.cola_esperando.get()
-            if random.random() < 0.3:  # 30% de probabilidad de completar I/O
-                self.mover_a_listo(proceso)
-            else:
-                procesos_esperando.append(proceso)
-        
-        # Devolver procesos no completados a la cola
-        for proceso in procesos_esperando:
-            self.cola_esperando.put(proceso)
+            self.cola_nuevos.agregar(proceso)
+    
+    def _procesar_io(self):
+        """Mueve a LISTO los procesos cuya operación de I/O terminó en este ciclo"""
+        for proceso in self.io.extraer_completados(self.ciclo_actual):
+            self.cola_esperando.quitar(proceso.id)
+            self.mover_a_listo(proceso)
+    
+    def _seleccionar_siguiente(self) -> Proceso:
+        """Extrae de la cola de listos el siguiente proceso a ejecutar según la política"""
+        politica = self._politica
+        if not politica.ordenada:
+            return self.cola_listos.extraer()
+        proceso = politica.extraer(self.ciclo_actual)
+        self.cola_listos.quitar(proceso.id)
+        return proceso
+    
+    def _ejecutar_proceso(self):
+        """Ejecuta el proceso actual o selecciona uno nuevo de la cola de listos"""
+        politica = self._politica
+        # Una política expropiativa desaloja al proceso en la CPU si en LISTO hay uno mejor
+        if (politica.expropiativa and self.proceso_actual is not None
+                and self.proceso_actual.estado == EstadoProceso.EJECUTANDO
+                and politica.debe_expropiar(self.proceso_actual, self.ciclo_actual)):
+            self.mover_a_listo(self.proceso_actual)
+            self.proceso_actual = None
         
-        # Ejecutar proceso actual o seleccionar uno nuevo
         if self.proceso_actual is None or self.proceso_actual.estado != EstadoProceso.EJECUTANDO:
-            if not self.cola_listos.empty():
-                self.proceso_actual = self.cola_listos.get()
-                self.proceso_actual.estado = EstadoProceso.EJECUTANDO
+            if self.cola_listos:
+                self.proceso_actual = self._seleccionar_siguiente()
+                self._transicion(self.proceso_actual, EstadoProceso.EJECUTANDO)
                 self.proceso_actual.calcular_tiempo_respuesta(self.tiempo_actual)
         
         # Ejecutar proceso actual si existe
         if self.proceso_actual is not None:
-            tiempo_usado = self.proceso_actual.ejecutar(self.quantum)
+            quantum = politica.quantum(self.proceso_actual, self.quantum)
+            tiempo_usado = self.proceso_actual.ejecutar(quantum)
             self.tiempo_actual += tiempo_usado
             
             # Verificar si el proceso necesita I/O
-            if self.proceso_actual.necesita_io():
+            if self.proceso_actual.necesita_io(self.aleatorio):
                 self.mover_a_esperando(self.proceso_actual)
                 self.proceso_actual = None
             # Verificar si el proceso ha terminado
             elif self.proceso_actual.completado():
                 self.mover_a_terminado(self.proceso_actual)
                 self.proceso_actual = None
-            # Verificar si se agotó el quantum
-            elif tiempo_usado == self.quantum:
+            # Verificar si se agotó el quantum (si no, sigue en la CPU el ciclo siguiente)
+            elif tiempo_usado == quantum and politica.expropiar_por_quantum:
+                politica.agoto_quantum(self.proceso_actual)
                 self.mover_a_listo(self.proceso_actual)
                 self.proceso_actual = None
-        
-        # Actualizar tiempos de espera
-        for proceso in list(self.cola_listos.queue):
-            proceso.actualizar_tiempo_espera()
-        
-        return self.obtener_estadisticas()
     
     def obtener_estadisticas(self) -> Dict:
         """Retorna estadísticas actuales del sistema"""
-        total_procesos = len(self.cola_terminados)
+        total_procesos = self.estadisticas['procesos_completados']
         if total_procesos == 0:
             return {
                 'tiempo_espera_promedio': 0,
@@ -182,14 +421,36 @@ class PlanificadorProcesos:
             'throughput': total_procesos / self.tiempo_actual if self.tiempo_actual > 0 else 0
         }
     
-    def obtener_estado_actual(self) -> Dict:
-        """Retorna el estado actual del sistema"""
+    def obtener_estado_actual(self, instantanea: bool = False) -> Dict:
+        """
+        Retorna el estado actual del sistema.
+        
+        Args:
+            instantanea (bool): Si es True copia las colas en listas que no cambian con
+                la simulación (los terminados, que sólo crecen, en una vista acotada a los
+                que hay ahora); si es False retorna vistas de sólo lectura sin copiar nada
+        
+        Returns:
+            Dict: Procesos de cada estado
+        """
+        ejecutando = [self.proceso_actual] if self.proceso_actual else []
+        # Los terminados sólo crecen: la instantánea comparte la lista pero sólo ve su largo actual
+        if instantanea:
+            return {
+                'nuevos': self.cola_nuevos.copiar(),
+                'listos': self.cola_listos.copiar(),
+                'ejecutando': ejecutando,
+                'esperando': self.cola_esperando.copiar(),
+                'terminados': VistaPrefijo(self.cola_terminados),
+                'listo_suspendido': self.cola_listo_suspendido.copiar(),
+                'esperando_suspendido': self.cola_esperando_suspendido.copiar()
+            }
         return {
-            'nuevos': list(self.cola_nuevos.queue),
-            'listos': list(self.cola_listos.queue),
-            'ejecutando': [self.proceso_actual] if self.proceso_actual else [],
-            'esperando': list(self.cola_esperando.queue),
-            'terminados': self.cola_terminados,
-            'listo_suspendido': list(self.cola_listo_suspendido.queue),
-            'esperando_suspendido': list(self.cola_esperando_suspendido.queue)
+            'nuevos': self.cola_nuevos.vista(),
+            'listos': self.cola_listos.vista(),
+            'ejecutando': VistaProcesos(ejecutando),
+            'esperando': self.cola_esperando.vista(),
+            'terminados': VistaProcesos(self.cola_terminados),
+            'listo_suspendido': self.cola_listo_suspendido.vista(),
+            'esperando_suspendido': self.cola_esperando_suspendido.vista()
         } 
\ No newline at end of file
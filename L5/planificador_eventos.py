@@ -0,0 +1,64 @@
+from typing import Optional, Sequence
+from distribuciones import FuenteAleatoria
+from dispositivos_io import DispositivoIO
+from memoria import GestorMemoria
+from planificador import PlanificadorProcesos
+from politicas import PoliticaPlanificacion
+
+class PlanificadorEventos(PlanificadorProcesos):
+    """
+    Planificador de eventos discretos equivalente a PlanificadorProcesos.
+
+    La cola de NUEVO se consume sólo por su cabeza (está ordenada por tiempo de
+    creación) en lugar de recorrerla en cada ciclo. Con `proximo_ciclo_evento` y
+    `avanzar_inactivo` el simulador puede saltar directamente los ciclos en los que la
+    CPU está ociosa y nada cambia; el próximo fin de I/O lo da la rueda de temporizadores.
+
+    Para la misma semilla produce las mismas transiciones y métricas que el motor por ticks.
+    """
+
+    def __init__(self, quantum: int = 2, aleatorio: Optional[FuenteAleatoria] = None,
+                 dispositivos: Optional[Sequence[DispositivoIO]] = None,
+                 memoria: Optional[GestorMemoria] = None,
+                 politica: Optional[PoliticaPlanificacion] = None):
+        """
+        Inicializa el planificador de eventos.
+
+        Args:
+            quantum (int): Tiempo máximo de ejecución por proceso
+            aleatorio (Optional[FuenteAleatoria]): Fuente de decisiones aleatorias
+            dispositivos (Optional[Sequence[DispositivoIO]]): Dispositivos de I/O
+            memoria (Optional[GestorMemoria]): Memoria principal con capacidad limitada
+            politica (Optional[PoliticaPlanificacion]): Política de planificación
+                (Round-Robin si es None)
+        """
+        super().__init__(quantum, aleatorio, dispositivos, memoria, politica)
+
+    def _procesar_nuevos(self):
+        """Mueve a LISTO los procesos que han cumplido el retardo de admisión en NUEVO"""
+        # La cola está ordenada por tiempo de creación: basta con mirar la cabeza
+        while (self.cola_nuevos and
+               self.tiempo_actual - self.cola_nuevos.primero().tiempo_creacion >= self.retardo_admision):
+            self._admitir_en_memoria(self.cola_nuevos.extraer())
+
+    def proximo_ciclo_evento(self) -> float:
+        """
+        Retorna el próximo ciclo en el que el planificador tiene trabajo.
+
+        Returns:
+            float: Ciclo del próximo evento (o infinito si no hay ninguno pendiente)
+        """
+        if self.proceso_actual is not None or self.cola_listos:
+            return self.ciclo_actual + 1
+
+        siguiente = self.io.proximo_completado()
+        if self.cola_nuevos:
+            # Con la CPU ociosa el tiempo avanza una unidad por ciclo
+            faltante = self.cola_nuevos.primero().tiempo_creacion + self.retardo_admision - self.tiempo_actual
+            siguiente = min(siguiente, self.ciclo_actual + max(1, faltante))
+        return siguiente
+
+    def avanzar_inactivo(self, ciclos: int):
+        """Avanza el reloj `ciclos` ciclos en los que la CPU está ociosa"""
+        self.ciclo_actual += ciclos
+        self.tiempo_actual += ciclos
@@ -0,0 +1,199 @@
+from typing import Dict, List, Optional, Sequence
+from cola_procesos import ColaProcesos
+from distribuciones import FuenteAleatoria
+from dispositivos_io import DispositivoIO
+from memoria import GestorMemoria
+from proceso import Proceso, EstadoProceso
+from planificador_eventos import PlanificadorEventos
+from politicas import PoliticaPlanificacion, RoundRobin
+
+# Procesos que se examinan en la cabeza de una cola ajena buscando uno sin afinidad fija
+LIMITE_BUSQUEDA_ROBO = 8
+
+class PlanificadorMultinucleo(PlanificadorEventos):
+    """
+    Planificador con varias CPU, cada una con su propia cola de listos.
+
+    Cada núcleo ejecuta en cada ciclo un quantum del primer proceso de su cola. Un
+    proceso que vuelve a LISTO se encola en el último núcleo que lo ejecutó (o en el de
+    su afinidad, si la tiene); los procesos nuevos se reparten por turnos. Un núcleo
+    ocioso roba trabajo de la cola más larga, sin tomar procesos con afinidad fija.
+    `cola_listos` sigue conteniendo todos los procesos en LISTO, en orden de llegada,
+    para el swapping y las consultas.
+
+    Los núcleos trabajan en paralelo: en cada ciclo el tiempo avanza lo que usó el
+    quantum más largo. Con un solo núcleo el resultado es idéntico al de PlanificadorEventos.
+
+    Atributos:
+        nucleos (int): Número de CPU
+        colas_nucleo (List[ColaProcesos]): Cola de listos de cada núcleo
+        afinidad (Dict[int, int]): Núcleo fijo de los procesos con afinidad, por id
+        ciclos_ocupado (List[int]): Ciclos en que cada núcleo ejecutó un proceso
+        tiempo_cpu (List[int]): Tiempo de CPU entregado por cada núcleo
+        despachos (List[int]): Procesos despachados por cada núcleo
+        robos (List[int]): Procesos que cada núcleo robó de otras colas
+    """
+
+    def __init__(self, quantum: int = 2, aleatorio: Optional[FuenteAleatoria] = None, nucleos: int = 2,
+                 dispositivos: Optional[Sequence[DispositivoIO]] = None,
+                 memoria: Optional[GestorMemoria] = None):
+        """
+        Inicializa el planificador.
+
+        Args:
+            quantum (int): Tiempo máximo de ejecución por proceso
+            aleatorio (Optional[FuenteAleatoria]): Fuente de decisiones aleatorias
+            nucleos (int): Número de CPU
+            dispositivos (Optional[Sequence[DispositivoIO]]): Dispositivos de I/O
+            memoria (Optional[GestorMemoria]): Memoria principal con capacidad limitada
+        """
+        if nucleos < 1:
+            raise ValueError(f"El número de núcleos debe ser positivo: {nucleos}")
+        super().__init__(quantum, aleatorio, dispositivos, memoria)
+        self.nucleos = nucleos
+        self.colas_nucleo = [ColaProcesos() for _ in range(nucleos)]
+        self.afinidad: Dict[int, int] = {}
+        self.ciclos_ocupado = [0] * nucleos
+        self.tiempo_cpu = [0] * nucleos
+        self.despachos = [0] * nucleos
+        self.robos = [0] * nucleos
+        # Núcleo en cuya cola está cada proceso en LISTO (o el último que lo ejecutó)
+        self._nucleo_de: Dict[int, int] = {}
+        self._turno = 0
+
+    def _validar_politica(self, politica: PoliticaPlanificacion):
+        """Cada núcleo atiende su cola por turnos: sólo se admite Round-Robin"""
+        if not isinstance(politica, RoundRobin):
+            raise ValueError(f"El planificador multinúcleo sólo admite Round-Robin, no {politica.nombre}")
+
+    def fijar_afinidad(self, pid: int, nucleo: int):
+        """Restringe un proceso a un núcleo; si está en LISTO en otra cola, lo mueve"""
+        if not 0 <= nucleo < self.nucleos:
+            raise ValueError(f"Núcleo fuera de rango: {nucleo}")
+        self.afinidad[pid] = nucleo
+        actual = self._nucleo_de.get(pid)
+        if actual is not None and actual != nucleo:
+            try:
+                proceso = self.colas_nucleo[actual].quitar(pid)
+            except ValueError:
+                pass  # No está en LISTO: irá a su núcleo la próxima vez
+            else:
+                self.colas_nucleo[nucleo].agregar(proceso)
+                self._nucleo_de[pid] = nucleo
+
+    def mover_a_listo(self, proceso: Proceso):
+        """Mueve un proceso a LISTO y lo encola en su núcleo"""
+        super().mover_a_listo(proceso)
+        self._encolar_en_nucleo(proceso)
+
+    def reanudar_proceso(self, proceso: Proceso):
+        """Reanuda un proceso suspendido; si vuelve a LISTO se encola en su núcleo"""
+        super().reanudar_proceso(proceso)
+        if proceso.estado == EstadoProceso.LISTO:
+            self._encolar_en_nucleo(proceso)
+
+    def _encolar_en_nucleo(self, proceso: Proceso):
+        """Encola un proceso en LISTO en su núcleo de afinidad, en el último que lo ejecutó o por turnos"""
+        nucleo = self.afinidad.get(proceso.id)
+        if nucleo is None:
+            nucleo = self._nucleo_de.get(proceso.id)
+        if nucleo is None:
+            nucleo = self._turno
+            self._turno = (self._turno + 1) % self.nucleos
+        self.colas_nucleo[nucleo].agregar(proceso)
+        self._nucleo_de[proceso.id] = nucleo
+
+    def suspender_proceso(self, proceso: Proceso):
+        """Suspende un proceso, quitándolo también de la cola de su núcleo"""
+        if proceso.estado == EstadoProceso.LISTO:
+            self.colas_nucleo[self._nucleo_de[proceso.id]].quitar(proceso.id)
+        super().suspender_proceso(proceso)
+
+    def mover_a_terminado(self, proceso: Proceso):
+        """Termina un proceso y olvida su núcleo"""
+        super().mover_a_terminado(proceso)
+        del self._nucleo_de[proceso.id]
+
+    def emigrar(self, pid: int) -> Proceso:
+        """Quita un proceso en LISTO para migrarlo, también de la cola de su núcleo"""
+        self.colas_nucleo[self._nucleo_de.pop(pid)].quitar(pid)
+        return super().emigrar(pid)
+
+    def _robar(self, nucleo: int) -> Optional[Proceso]:
+        """Toma un proceso sin afinidad de la cola de otro núcleo, empezando por la más larga"""
+        victimas = sorted((cola for indice, cola in enumerate(self.colas_nucleo) if indice != nucleo and cola),
+                          key=len, reverse=True)
+        for victima in victimas:
+            for proceso in victima.primeros(LIMITE_BUSQUEDA_ROBO):
+                if proceso.id not in self.afinidad:
+                    self.robos[nucleo] += 1
+                    return victima.quitar(proceso.id)
+        return None
+
+    def _despachar(self, nucleo: int) -> Optional[Proceso]:
+        """Elige el proceso que ejecutará un núcleo en este ciclo"""
+        cola = self.colas_nucleo[nucleo]
+        if cola:
+            proceso = cola.extraer()
+        elif self.cola_listos:
+            proceso = self._robar(nucleo)
+            if proceso is None:
+                return None
+        else:
+            return None
+
+        self.cola_listos.quitar(proceso.id)
+        self._nucleo_de[proceso.id] = nucleo
+        self._transicion(proceso, EstadoProceso.EJECUTANDO)
+        proceso.calcular_tiempo_respuesta(self.tiempo_actual)
+        self.despachos[nucleo] += 1
+        return proceso
+
+    def _ejecutar_proceso(self):
+        """Despacha un proceso en cada núcleo y ejecuta un quantum en todos a la vez"""
+        # Primero se despacha en todos los núcleos, para que un proceso que vuelve a
+        # LISTO en este ciclo no pueda ejecutarse otra vez en otro núcleo
+        en_ejecucion = []
+        for nucleo in range(self.nucleos):
+            proceso = self._despachar(nucleo)
+            if proceso is not None:
+                en_ejecucion.append((nucleo, proceso, proceso.ejecutar(self.quantum)))
+
+        inicio = self.tiempo_actual
+        maximo = 0
+        for nucleo, proceso, tiempo_usado in en_ejecucion:
+            self.ciclos_ocupado[nucleo] += 1
+            self.tiempo_cpu[nucleo] += tiempo_usado
+            maximo = max(maximo, tiempo_usado)
+            # Cada núcleo termina su quantum en su propio instante
+            self.tiempo_actual = inicio + tiempo_usado
+
+            if proceso.necesita_io(self.aleatorio):
+                self.mover_a_esperando(proceso)
+            elif proceso.completado():
+                self.mover_a_terminado(proceso)
+            elif tiempo_usado == self.quantum:
+                self.mover_a_listo(proceso)
+        self.tiempo_actual = inicio + maximo
+
+    def obtener_estadisticas_nucleos(self) -> Dict:
+        """
+        Retorna las métricas de cada núcleo y la utilización total.
+
+        La utilización es la fracción de ciclos en que el núcleo ejecutó un proceso.
+        """
+        ciclos = self.ciclo_actual or 1
+        return {
+            'nucleos': [
+                {
+                    'nucleo': nucleo,
+                    'utilizacion': self.ciclos_ocupado[nucleo] / ciclos,
+                    'tiempo_cpu': self.tiempo_cpu[nucleo],
+                    'despachos': self.despachos[nucleo],
+                    'robos': self.robos[nucleo],
+                    'en_cola': len(self.colas_nucleo[nucleo]),
+                }
+                for nucleo in range(self.nucleos)
+            ],
+            'utilizacion_total': sum(self.ciclos_ocupado) / (ciclos * self.nucleos),
+        }
@@ -0,0 +1,262 @@
+"""
+Políticas de planificación: qué proceso en LISTO pasa a la CPU y cuándo se lo desaloja.
+
+El planificador mantiene siempre `cola_listos` en orden de llegada (la usan el swapping,
+las consultas y el historial); una política ordenada lleva además su propia cola, un
+montículo indexado (ColaPrioridad), así que despachar, cambiar una prioridad o quitar un
+proceso suspendido cuestan O(log n) y nunca se recorre la cola de listos.
+
+En cada ciclo el proceso en la CPU ejecuta a lo sumo un quantum. Con Round-Robin y MLFQ
+vuelve a LISTO al agotarlo; con las demás sigue en la CPU hasta pedir I/O o terminar,
+salvo que la política sea expropiativa y haya en LISTO un proceso con mejor clave.
+
+Uso:
+
+    simulador = Simulador(ciclos=20000, carga=carga, politica=crear_politica("srtf"))
+    comparar_politicas(["rr", "srtf", "mlfq"], lambda: CargaSintetica(LlegadasPoisson(0.05), semilla=1), 20000)
+"""
+from functools import partial
+from typing import Callable, Dict, Iterable, Optional, Sequence
+from cola_procesos import ColaPrioridad
+from proceso import Proceso
+
+class PoliticaPlanificacion:
+    """
+    Interfaz de una política de planificación.
+
+    Una política ordenada define `clave`: en LISTO se despacha el proceso de menor clave
+    (a igual clave, el que llegó antes). Una instancia pertenece a un solo planificador.
+
+    Atributos:
+        nombre (str): Nombre de la política (clave de POLITICAS)
+        ordenada (bool): Si es False se despacha en el orden de `cola_listos` y la política
+            no lleva cola propia
+        expropiar_por_quantum (bool): Si es True el proceso vuelve a LISTO al agotar su
+            quantum; si es False sigue en la CPU hasta pedir I/O o terminar
+        expropiativa (bool): Si es True, en cada ciclo un proceso en LISTO con menor clave
+            desaloja al que está en la CPU
+        cola (Optional[ColaPrioridad]): Procesos en LISTO ordenados por clave
+    """
+    nombre = ""
+    ordenada = True
+    expropiar_por_quantum = False
+
+    def __init__(self, expropiativa: bool = False):
+        self.expropiativa = expropiativa
+        self.cola: Optional[ColaPrioridad] = ColaPrioridad() if self.ordenada else None
+
+    def clave(self, proceso: Proceso, ciclo: int):
+        """Clave de un proceso que entra a LISTO en `ciclo` (menor se despacha antes)"""
+        raise NotImplementedError
+
+    def clave_en_ejecucion(self, proceso: Proceso, ciclo: int):
+        """Clave con la que el proceso en la CPU compite con los de LISTO"""
+        return self.clave(proceso, ciclo)
+
+    def agregar(self, proceso: Proceso, ciclo: int):
+        """Un proceso entra a LISTO"""
+        self.cola.agregar(proceso, self.clave(proceso, ciclo))
+
+    def quitar(self, proceso: Proceso):
+        """Un proceso sale de LISTO sin pasar a la CPU (p. ej. se suspende)"""
+        self.cola.quitar(proceso.id)
+
+    def extraer(self, ciclo: int) -> Proceso:
+        """Extrae el próximo proceso a ejecutar"""
+        return self.cola.extraer()
+
+    def actualizar(self, proceso: Proceso, ciclo: int):
+        """Recalcula la clave de un proceso en LISTO (p. ej. si cambió su prioridad)"""
+        self.cola.actualizar(proceso.id, self.clave(proceso, ciclo))
+
+    def debe_expropiar(self, proceso: Proceso, ciclo: int) -> bool:
+        """Indica si el proceso en la CPU debe ceder su lugar a uno en LISTO"""
+        return bool(self.cola) and self.cola.clave_primero() < self.clave_en_ejecucion(proceso, ciclo)
+
+    def quantum(self, proceso: Proceso, quantum: int) -> int:
+        """Quantum del proceso en este despacho (por defecto, el del planificador)"""
+        return quantum
+
+    def agoto_quantum(self, proceso: Proceso):
+        """El proceso usó su quantum completo y vuelve a LISTO"""
+
+    def terminado(self, proceso: Proceso):
+        """El proceso terminó: se descarta lo que la política guarde de él"""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.nombre})"
+
+class RoundRobin(PoliticaPlanificacion):
+    """Turnos en orden de llegada a LISTO, con un quantum por turno (la política por defecto)"""
+    nombre = "rr"
+    ordenada = False
+    expropiar_por_quantum = True
+
+class FCFS(PoliticaPlanificacion):
+    """Orden de llegada a LISTO, sin quantum: cada proceso sigue hasta pedir I/O o terminar"""
+    nombre = "fcfs"
+    ordenada = False
+
+class TrabajoMasCorto(PoliticaPlanificacion):
+    """
+    Primero el proceso al que le queda menos tiempo de CPU: SJF o, si es expropiativa,
+    SRTF (un proceso que llega con menos tiempo restante desaloja al que está en la CPU).
+    """
+
+    def __init__(self, expropiativa: bool = False):
+        super().__init__(expropiativa)
+        self.nombre = "srtf" if expropiativa else "sjf"
+
+    def clave(self, proceso: Proceso, ciclo: int) -> int:
+        return proceso.tiempo_restante
+
+class Prioridad(PoliticaPlanificacion):
+    """Prioridad estática: primero el proceso con menor número de prioridad"""
+
+    def __init__(self, expropiativa: bool = False):
+        super().__init__(expropiativa)
+        self.nombre = "prioridad_expropiativa" if expropiativa else "prioridad"
+
+    def clave(self, proceso: Proceso, ciclo: int) -> int:
+        return proceso.prioridad
+
+class PrioridadEnvejecimiento(PoliticaPlanificacion):
+    """
+    Prioridad con envejecimiento: cada `intervalo` ciclos de espera en LISTO mejoran la
+    prioridad de un proceso en un nivel, así que ninguno espera indefinidamente.
+
+    La clave `prioridad * intervalo + ciclo de llegada a LISTO` ordena los procesos igual
+    que la prioridad efectiva (prioridad - espera / intervalo) en cualquier ciclo, porque
+    la espera crece igual para todos: envejecer no exige recalcular claves ni recorrer la cola.
+
+    Atributos:
+        intervalo (int): Ciclos de espera que valen un nivel de prioridad
+    """
+
+    def __init__(self, intervalo: int = 10, expropiativa: bool = False):
+        if intervalo < 1:
+            raise ValueError(f"El intervalo de envejecimiento debe ser positivo: {intervalo}")
+        super().__init__(expropiativa)
+        self.intervalo = intervalo
+        self.nombre = "envejecimiento"
+
+    def clave(self, proceso: Proceso, ciclo: int) -> int:
+        return proceso.prioridad * self.intervalo + ciclo
+
+class ColaMultinivel(PoliticaPlanificacion):
+    """
+    Cola multinivel con retroalimentación (MLFQ).
+
+    Los procesos entran al nivel 0; el que agota su quantum baja un nivel, donde se despacha
+    después pero con el doble de quantum; el que pide I/O antes conserva su nivel. Cada
+    `intervalo_impulso` ciclos todos vuelven al nivel 0 para que ninguno quede relegado.
+
+    Atributos:
+        niveles (int): Cantidad de niveles
+        intervalo_impulso (Optional[int]): Ciclos entre impulsos al nivel 0 (sin impulsos si es None)
+        _nivel (Dict[int, int]): Nivel de cada proceso que no está en el nivel 0, por id
+        _epoca (int): Impulsos ocurridos hasta ahora
+    """
+    nombre = "mlfq"
+    expropiar_por_quantum = True
+
+    def __init__(self, niveles: int = 3, intervalo_impulso: Optional[int] = 100):
+        if niveles < 1:
+            raise ValueError(f"La cantidad de niveles debe ser positiva: {niveles}")
+        if intervalo_impulso is not None and intervalo_impulso < 1:
+            raise ValueError(f"El intervalo de impulso debe ser positivo: {intervalo_impulso}")
+        super().__init__()
+        self.niveles = niveles
+        self.intervalo_impulso = intervalo_impulso
+        self._nivel: Dict[int, int] = {}
+        self._epoca = 0
+
+    def _impulsar(self, ciclo: int):
+        """Devuelve todos los procesos al nivel 0 si pasó un impulso desde la última consulta"""
+        if self.intervalo_impulso is None:
+            return
+        epoca = ciclo // self.intervalo_impulso
+        if epoca != self._epoca:
+            self._epoca = epoca
+            if self._nivel:
+                self._nivel.clear()
+                self.cola.reordenar(lambda proceso: 0)
+
+    def nivel(self, proceso: Proceso) -> int:
+        """Nivel actual de un proceso"""
+        return self._nivel.get(proceso.id, 0)
+
+    def clave(self, proceso: Proceso, ciclo: int) -> int:
+        self._impulsar(ciclo)
+        return self._nivel.get(proceso.id, 0)
+
+    def extraer(self, ciclo: int) -> Proceso:
+        self._impulsar(ciclo)
+        return self.cola.extraer()
+
+    def quantum(self, proceso: Proceso, quantum: int) -> int:
+        return quantum << self._nivel.get(proceso.id, 0)
+
+    def agoto_quantum(self, proceso: Proceso):
+        nivel = self._nivel.get(proceso.id, 0)
+        if nivel + 1 < self.niveles:
+            self._nivel[proceso.id] = nivel + 1
+
+    def terminado(self, proceso: Proceso):
+        self._nivel.pop(proceso.id, None)
+
+# Nombre -> constructor de cada política
+POLITICAS: Dict[str, Callable[[], PoliticaPlanificacion]] = {
+    'rr': RoundRobin,
+    'fcfs': FCFS,
+    'sjf': TrabajoMasCorto,
+    'srtf': partial(TrabajoMasCorto, expropiativa=True),
+    'prioridad': Prioridad,
+    'prioridad_expropiativa': partial(Prioridad, expropiativa=True),
+    'envejecimiento': PrioridadEnvejecimiento,
+    'mlfq': ColaMultinivel,
+}
+
+def crear_politica(nombre: str) -> PoliticaPlanificacion:
+    """Crea una política nueva con sus parámetros por defecto a partir de su nombre"""
+    try:
+        return POLITICAS[nombre]()
+    except KeyError:
+        raise ValueError(f"Política desconocida: {nombre}. Opciones: {', '.join(POLITICAS)}") from None
+
+def comparar_politicas(nombres: Sequence[str], crear_carga: Callable[[], Iterable], ciclos: int,
+                       semilla: Optional[int] = 0, quantum: int = 2, motor: str = "eventos") -> Dict[str, Dict]:
+    """
+    Ejecuta la misma carga con cada política y retorna sus métricas.
+
+    La carga (ver carga.py) tiene su propio generador, así que todas las políticas reciben
+    los mismos procesos con las mismas llegadas, ráfagas y prioridades.
+
+    Args:
+        nombres (Sequence[str]): Políticas a comparar (claves de POLITICAS)
+        crear_carga (Callable[[], Iterable]): Crea una carga nueva (la misma en cada llamada)
+        ciclos (int): Ciclos de cada simulación
+        semilla (Optional[int]): Semilla del resto de las decisiones (I/O, swapping)
+        quantum (int): Quantum base
+        motor (str): Motor de simulación
+
+    Returns:
+        Dict[str, Dict]: Por política, procesos terminados y media, desviación y
+            percentiles de los tiempos de espera, respuesta y retorno
+    """
+    from simulador import Simulador
+
+    resultados = {}
+    for nombre in nombres:
+        simulador = Simulador(quantum=quantum, ciclos=ciclos, semilla=semilla, motor=motor,
+                              mostrar_swapping=False, carga=crear_carga(), politica=crear_politica(nombre),
+                              conservar_terminados=False, historial=False)
+        metricas = simulador.simular()['metricas']
+        simulador.cerrar()
+        resultados[nombre] = {
+            'completados': metricas['completados'],
+            'tiempo_espera': metricas['tiempo_espera'],
+            'tiempo_respuesta': metricas['tiempo_respuesta'],
+            'tiempo_retorno': metricas['tiempo_retorno'],
+        }
+    return resultados
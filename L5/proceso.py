@@ -1,6 +1,6 @@
 from enum import Enum
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 import random
 
 class EstadoProceso(Enum):
@@ -12,6 +12,9 @@ class EstadoProceso(Enum):
     LISTO_SUSPENDIDO = "LISTO_SUSPENDIDO"
     ESPERANDO_SUSPENDIDO = "ESPERANDO_SUSPENDIDO"
 
+# Código entero de cada estado, para representaciones compactas en arreglos
+CODIGO_ESTADO = {estado: codigo for codigo, estado in enumerate(EstadoProceso)}
+
 @dataclass
 class Proceso:
     id: int
@@ -24,6 +27,11 @@ class Proceso:
     tiempo_espera: int = 0
     tiempo_respuesta: Optional[int] = None
     tiempo_finalizacion: Optional[int] = None
+    ciclo_fin_io: Optional[int] = None
+    tiempo_swap: int = 0
+    # Ciclo en que entró a su estado actual y ciclos acumulados en cada estado (por CODIGO_ESTADO)
+    ciclo_estado: int = 0
+    tiempos_estado: List[int] = field(default_factory=lambda: [0] * len(CODIGO_ESTADO))
     
     def __post_init__(self):
         self.tiempo_restante = self.tiempo_ejecucion
@@ -34,9 +42,17 @@ class Proceso:
         self.tiempo_restante -= tiempo_usado
         return tiempo_usado
     
-    def necesita_io(self) -> bool:
-        """Determina si el proceso necesita realizar operaciones de I/O"""
+    def necesita_io(self, aleatorio=None) -> bool:
+        """
+        Determina si el proceso necesita realizar operaciones de I/O.
+        
+        Args:
+            aleatorio (Optional[FuenteAleatoria]): Fuente de la simulación; si es None se
+                usa el generador global de `random`
+        """
         # 20% de probabilidad de necesitar I/O
+        if aleatorio is not None:
+            return aleatorio.necesita_io(0.2)
         return random.random() < 0.2
     
     def completado(self) -> bool:
@@ -47,6 +63,46 @@ class Proceso:
         """Incrementa el tiempo de espera del proceso"""
         self.tiempo_espera += 1
     
+    def cambiar_estado(self, estado: EstadoProceso, ciclo: int):
+        """
+        Cambia el estado del proceso cargando de una vez el tiempo que pasó en el anterior.
+        
+        Los tiempos se cuentan en ciclos completos: un proceso que entra a un estado en el
+        ciclo `c` y sale en el ciclo `d` permaneció en él `d - c` ciclos. El tiempo en
+        LISTO se suma además al tiempo de espera.
+        
+        Args:
+            estado (EstadoProceso): Nuevo estado
+            ciclo (int): Ciclo en que ocurre la transición
+        """
+        transcurridos = ciclo - self.ciclo_estado
+        self._sumar_tiempo_estado(CODIGO_ESTADO[self.estado], transcurridos)
+        if self.estado == EstadoProceso.LISTO:
+            self.tiempo_espera += transcurridos
+        self.estado = estado
+        self.ciclo_estado = ciclo
+    
+    def _sumar_tiempo_estado(self, codigo: int, ciclos: int):
+        self.tiempos_estado[codigo] += ciclos
+    
+    def _ciclos_en_estado_actual(self, ciclo: int) -> int:
+        """Ciclos transcurridos en el estado actual al terminar el ciclo `ciclo`"""
+        return max(0, ciclo + 1 - self.ciclo_estado)
+    
+    def tiempo_espera_hasta(self, ciclo: int) -> int:
+        """Retorna el tiempo de espera al terminar el ciclo `ciclo`, incluida la espera en curso"""
+        if self.estado == EstadoProceso.LISTO:
+            return self.tiempo_espera + self._ciclos_en_estado_actual(ciclo)
+        return self.tiempo_espera
+    
+    def tiempo_en_estado(self, estado: EstadoProceso, ciclo: int) -> int:
+        """Retorna los ciclos que el proceso pasó en `estado` hasta el final del ciclo `ciclo`"""
+        codigo = CODIGO_ESTADO[estado]
+        tiempo = self.tiempos_estado[codigo]
+        if self.estado == estado:
+            tiempo += self._ciclos_en_estado_actual(ciclo)
+        return tiempo
+    
     def calcular_tiempo_respuesta(self, tiempo_actual: int):
         """Calcula el tiempo de respuesta del proceso"""
         if self.tiempo_respuesta is None:
@@ -0,0 +1,266 @@
+"""
+Puntos de control y bifurcaciones de una simulación en curso.
+
+Un punto de control guarda el estado completo de un Simulador (colas, proceso en
+ejecución, contadores, procesos pendientes, dispositivos, memoria y el estado del
+generador aleatorio) en un archivo binario; al cargarlo, `Simulador.continuar` sigue
+exactamente como habría seguido la simulación original.
+
+Con `bifurcar` se obtiene una copia independiente en el mismo proceso, y con
+`explorar_ramas` se prueban variantes (por ejemplo, otro quantum) a partir de un mismo
+calentamiento: cada rama es un proceso hijo creado con fork, que comparte la memoria
+del original copia-en-escritura y no tiene que repetir ni serializar el calentamiento.
+
+Uso:
+
+    simulador = Simulador(ciclos=10000, semilla=1)
+    simulador.iniciar(1000)
+    simulador.continuar(hasta=2000)
+    guardar(simulador, "calentamiento.pc")
+    ramas = explorar_ramas(simulador, [{'quantum': q} for q in (1, 2, 4, 8)])
+"""
+import copyreg
+import dataclasses
+import gc
+import io
+import multiprocessing
+import multiprocessing.connection
+import operator
+import os
+import pickle
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+from proceso import Proceso
+from historial import RegistroTransiciones, HistorialEstados
+from simulador import Simulador
+
+MAGICO = b"PUNTOCTRL1\n"
+
+PROTOCOLO = pickle.HIGHEST_PROTOCOL
+
+# Atributos que una variante de `explorar_ramas` puede cambiar y dónde están
+VARIABLES_RAMA = {
+    'quantum': 'planificador',
+    'politica': 'planificador',
+    'ciclos': 'simulador',
+    'probabilidad_admision': 'simulador',
+    'probabilidad_suspension': 'simulador',
+}
+
+_CAMPOS_PROCESO = tuple(campo.name for campo in dataclasses.fields(Proceso))
+_valores_proceso = operator.attrgetter(*_CAMPOS_PROCESO)
+
+class _BloqueProcesos:
+    """
+    Todos los procesos de la simulación guardados juntos, una tupla de campos por proceso.
+
+    Serializar cada Proceso por separado (un diccionario por objeto) es varias veces más
+    lento; al cargar, el bloque se restaura como una lista de procesos y cada referencia a
+    un proceso es sólo un índice en ella.
+    """
+
+    def __init__(self, procesos: List[Proceso]):
+        self.procesos = procesos
+
+    def __reduce__(self):
+        return _restaurar_procesos, ([_valores_proceso(proceso) for proceso in self.procesos],)
+
+def _restaurar_procesos(filas: List[tuple]) -> List[Proceso]:
+    nuevo = object.__new__
+    procesos = []
+    for valores in filas:
+        proceso = nuevo(Proceso)
+        proceso.__dict__.update(zip(_CAMPOS_PROCESO, valores))
+        procesos.append(proceso)
+    return procesos
+
+def _reducir_simulador_sin_historial(simulador: Simulador):
+    estado = vars(simulador).copy()
+    # Sólo se conservan las estadísticas del último ciclo (las que usa estadisticas_del_ciclo)
+    estado['historial_estadisticas'] = simulador.historial_estadisticas[-1:]
+    estado['_ciclos_estadisticas'] = simulador._ciclos_estadisticas[-1:]
+    return copyreg.__newobj__, (type(simulador),), estado
+
+@contextmanager
+def _sin_recolector() -> Iterator[None]:
+    """
+    Suspende el recolector de ciclos: con cientos de miles de objetos vivos, las
+    colecciones que disparan las tuplas y procesos recién creados dominan el tiempo
+    de serializar y restaurar.
+    """
+    activo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if activo:
+            gc.enable()
+
+class _Serializador(pickle.Pickler):
+    """Pickler que guarda los procesos en un bloque y, si se pide, descarta el historial"""
+
+    def __init__(self, archivo, simulador: Simulador, incluir_historial: bool):
+        super().__init__(archivo, protocol=PROTOCOLO)
+        # Con la representación "tabla" los procesos ya están en columnas
+        procesos = list(simulador.procesos.values()) if simulador.tabla is None else []
+        self._bloque = _BloqueProcesos(procesos)
+        self._filas = {id(proceso): fila for fila, proceso in enumerate(procesos)}
+        self.dispatch_table = copyreg.dispatch_table.copy()
+        self.dispatch_table[Proceso] = self._reducir_proceso
+        if not incluir_historial:
+            self.dispatch_table[RegistroTransiciones] = RegistroTransiciones.reduccion_sin_historial
+            self.dispatch_table[Simulador] = _reducir_simulador_sin_historial
+
+    def _reducir_proceso(self, proceso: Proceso):
+        fila = self._filas.get(id(proceso))
+        if fila is None:
+            return proceso.__reduce_ex__(PROTOCOLO)
+        return operator.getitem, (self._bloque, fila)
+
+def serializar(simulador: Simulador, incluir_historial: bool = False) -> bytes:
+    """
+    Serializa el estado completo de una simulación.
+
+    Args:
+        simulador (Simulador): Simulación a guardar (entre dos ciclos)
+        incluir_historial (bool): Si es True se guarda también el registro de
+            transiciones y las estadísticas de cada ciclo; si es False la simulación
+            restaurada sólo conserva el historial desde el punto de control (los ciclos
+            anteriores se ven con el estado del punto de control y sin estadísticas)
+
+    Returns:
+        bytes: Punto de control
+    """
+    if simulador.planificador.instrumentacion is not None:
+        raise ValueError("Desconecte la instrumentación antes de guardar un punto de control")
+    if simulador.registro is not None:
+        simulador.registro.vaciar()
+    archivo = io.BytesIO()
+    archivo.write(MAGICO)
+    with _sin_recolector():
+        _Serializador(archivo, simulador, incluir_historial).dump(simulador)
+    return archivo.getvalue()
+
+def deserializar(datos: bytes) -> Simulador:
+    """Restaura una simulación serializada con `serializar`"""
+    if datos[:len(MAGICO)] != MAGICO:
+        raise ValueError("Los datos no son un punto de control del simulador")
+    with _sin_recolector():
+        return pickle.loads(memoryview(datos)[len(MAGICO):])
+
+def guardar(simulador: Simulador, ruta: str, incluir_historial: bool = False):
+    """Guarda un punto de control en `ruta` (ver `serializar`)"""
+    datos = serializar(simulador, incluir_historial)
+    # Se escribe aparte y se reemplaza, para no dejar un punto de control a medias
+    temporal = f"{ruta}.tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(datos)
+    os.replace(temporal, ruta)
+
+def cargar(ruta: str) -> Simulador:
+    """Restaura la simulación guardada en `ruta`"""
+    with open(ruta, "rb") as archivo:
+        return deserializar(archivo.read())
+
+def bifurcar(simulador: Simulador) -> Simulador:
+    """
+    Retorna una copia independiente de la simulación en su estado actual.
+
+    La copia no comparte nada con el original (tampoco el generador aleatorio: ambas
+    siguen la misma secuencia hasta que sus decisiones difieren) y su historial empieza
+    en el ciclo de la bifurcación.
+    """
+    return deserializar(serializar(simulador))
+
+def aplicar_variante(simulador: Simulador, variante: Dict):
+    """Aplica a una rama los cambios de una variante (claves de VARIABLES_RAMA)"""
+    for nombre, valor in variante.items():
+        destino = VARIABLES_RAMA.get(nombre)
+        if destino is None:
+            raise ValueError(f"Variable desconocida: {nombre}. Opciones: {', '.join(VARIABLES_RAMA)}")
+        setattr(simulador.planificador if destino == 'planificador' else simulador, nombre, valor)
+
+def resumen_rama(simulador: Simulador) -> Dict:
+    """Resultados finales de una rama, sin los historiales"""
+    resultados = simulador.obtener_resultados_finales()
+    resultados.pop('historial_estados', None)
+    resultados.pop('historial_estadisticas', None)
+    return resultados
+
+def _ejecutar_rama(simulador: Simulador, variante: Dict, resultado: Callable[[Simulador], object]):
+    aplicar_variante(simulador, variante)
+    simulador.continuar()
+    return resultado(simulador)
+
+def _rama_en_hijo(simulador: Simulador, variante: Dict, resultado: Callable, conexion):
+    # El hijo comparte con el padre el archivo del registro: sigue escribiendo en uno propio
+    if simulador.registro is not None:
+        simulador.registro.separar()
+        simulador.historial_estados = HistorialEstados(simulador)
+    try:
+        conexion.send((True, _ejecutar_rama(simulador, variante, resultado)))
+    except BaseException as error:
+        conexion.send((False, error))
+    finally:
+        conexion.close()
+
+def explorar_ramas(simulador: Simulador, variantes: Sequence[Dict],
+                   resultado: Callable[[Simulador], object] = resumen_rama,
+                   trabajadores: Optional[int] = None) -> List:
+    """
+    Continúa la simulación hasta el final una vez por variante, todas desde su estado actual.
+
+    Cada rama corre en un proceso hijo creado con fork, que ve el estado actual sin
+    copiarlo (copia-en-escritura). Donde fork no existe, cada rama parte de `bifurcar`
+    y se ejecutan una tras otra. El simulador original no cambia.
+
+    Args:
+        simulador (Simulador): Simulación iniciada, típicamente tras un calentamiento
+        variantes (Sequence[Dict]): Cambios de cada rama, p. ej. ``{'quantum': 4}``
+        resultado (Callable[[Simulador], object]): Qué retornar de cada rama (debe poder
+            enviarse entre procesos); por defecto, los resultados finales sin historiales
+        trabajadores (Optional[int]): Ramas simultáneas (todos los núcleos si es None)
+
+    Returns:
+        List: Resultado de cada rama, en el orden de `variantes`
+    """
+    for variante in variantes:
+        for nombre in variante:
+            if nombre not in VARIABLES_RAMA:
+                raise ValueError(f"Variable desconocida: {nombre}. Opciones: {', '.join(VARIABLES_RAMA)}")
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return [_ejecutar_rama(bifurcar(simulador), variante, resultado) for variante in variantes]
+
+    if simulador.registro is not None:
+        simulador.registro.vaciar()
+    contexto = multiprocessing.get_context("fork")
+    trabajadores = trabajadores or os.cpu_count() or 1
+    resultados: List = [None] * len(variantes)
+    pendientes = list(enumerate(variantes))
+    activas = {}
+    try:
+        while pendientes or activas:
+            while pendientes and len(activas) < trabajadores:
+                indice, variante = pendientes.pop(0)
+                lectura, escritura = contexto.Pipe(duplex=False)
+                hijo = contexto.Process(target=_rama_en_hijo, args=(simulador, variante, resultado, escritura))
+                hijo.start()
+                escritura.close()
+                activas[lectura] = (indice, hijo)
+            for lectura in multiprocessing.connection.wait(list(activas)):
+                indice, hijo = activas.pop(lectura)
+                try:
+                    exito, valor = lectura.recv()
+                except EOFError:
+                    exito, valor = False, RuntimeError(f"La rama {indice} terminó sin resultado")
+                lectura.close()
+                hijo.join()
+                if not exito:
+                    raise valor
+                resultados[indice] = valor
+    finally:
+        for lectura, (_, hijo) in activas.items():
+            hijo.terminate()
+            hijo.join()
+            lectura.close()
+    return resultados
@@ -0,0 +1,436 @@
+"""
+Servidor asyncio que ejecuta una simulación y publica su estado en vivo.
+
+Los clientes reciben primero una instantánea y después un delta por ciclo (las
+transiciones de estado y las estadísticas), como JSON, por cualquiera de estos medios:
+
+- Un socket Unix local, un mensaje por línea.
+- HTTP: ``GET /stream`` responde con los mismos mensajes en transferencia chunked.
+- WebSockets: ``GET /ws`` con la cabecera ``Upgrade: websocket``, un mensaje por trama.
+
+Cada cliente tiene una cola acotada. Si un cliente lento la llena, se descartan sus
+deltas en lugar de detener la simulación y, cuando vuelve a tener espacio, recibe una
+instantánea nueva para resincronizarse.
+
+Uso (desde L5):
+
+    python servidor.py --puerto 8765 --socket /tmp/simulador.sock --ciclos-por-segundo 20
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+from typing import AsyncIterator, Callable, Dict, List, Optional, Sequence, Set
+from proceso import Proceso, EstadoProceso
+from simulador import Simulador
+
+# Formatos de envío
+LINEAS, CHUNKED, WEBSOCKET = "lineas", "chunked", "websocket"
+
+GUID_WEBSOCKET = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+CIERRE_WEBSOCKET = b"\x88\x00"
+
+class Mensaje:
+    """
+    Mensaje publicado, codificado una sola vez y compartido por todos los clientes.
+
+    Atributos:
+        datos (bytes): JSON del mensaje
+        final (bool): Si es el último mensaje de la transmisión
+    """
+    __slots__ = ("datos", "final", "_enmarcados")
+
+    def __init__(self, contenido: Dict, final: bool = False):
+        self.datos = json.dumps(contenido, separators=(",", ":")).encode()
+        self.final = final
+        self._enmarcados: Dict[str, bytes] = {}
+
+    def enmarcado(self, formato: str) -> bytes:
+        """Retorna el mensaje listo para escribir en el formato de un cliente"""
+        enmarcado = self._enmarcados.get(formato)
+        if enmarcado is None:
+            enmarcado = self._enmarcados[formato] = _enmarcar(formato, self.datos, self.final)
+        return enmarcado
+
+def _enmarcar(formato: str, datos: bytes, final: bool) -> bytes:
+    if formato == LINEAS:
+        return datos + b"\n"
+    if formato == CHUNKED:
+        linea = datos + b"\n"
+        trozo = b"%x\r\n%s\r\n" % (len(linea), linea)
+        return trozo + b"0\r\n\r\n" if final else trozo
+    # Trama de texto de WebSocket (el servidor no enmascara)
+    longitud = len(datos)
+    if longitud < 126:
+        cabecera = struct.pack("!BB", 0x81, longitud)
+    elif longitud < 1 << 16:
+        cabecera = struct.pack("!BBH", 0x81, 126, longitud)
+    else:
+        cabecera = struct.pack("!BBQ", 0x81, 127, longitud)
+    return cabecera + datos + (CIERRE_WEBSOCKET if final else b"")
+
+class Cliente:
+    """
+    Suscriptor conectado al servidor.
+
+    Atributos:
+        formato (str): LINEAS, CHUNKED o WEBSOCKET
+        cola (asyncio.Queue): Mensajes pendientes de enviar (acotada)
+        desincronizado (bool): Perdió deltas y necesita una instantánea
+        enviados (int): Mensajes escritos
+        descartados (int): Mensajes descartados por tener la cola llena
+    """
+
+    def __init__(self, escritor: asyncio.StreamWriter, formato: str, capacidad: int):
+        self.escritor = escritor
+        self.formato = formato
+        self.cola: asyncio.Queue = asyncio.Queue(capacidad)
+        self.desincronizado = False
+        self.enviados = 0
+        self.descartados = 0
+
+    def ofrecer(self, mensaje: Mensaje) -> bool:
+        """Encola un mensaje sin esperar; si la cola está llena lo descarta"""
+        try:
+            self.cola.put_nowait(mensaje)
+        except asyncio.QueueFull:
+            self.descartados += 1
+            self.desincronizado = True
+            return False
+        return True
+
+    def finalizar(self, mensaje: Mensaje, instantanea: Callable[[], Mensaje]):
+        """
+        Encola el último mensaje. Si el cliente perdió deltas o no tiene lugar, lo
+        pendiente se reemplaza por una instantánea para que termine sincronizado.
+        """
+        if self.desincronizado or self.cola.qsize() > self.cola.maxsize - 1:
+            while not self.cola.empty():
+                self.cola.get_nowait()
+                self.descartados += 1
+            self.cola.put_nowait(instantanea())
+            self.desincronizado = False
+        self.cola.put_nowait(mensaje)
+
+class ServidorSimulacion:
+    """
+    Ejecuta una simulación y la transmite a todos los clientes conectados.
+
+    La simulación nunca espera a los clientes: cada delta se codifica una vez y se
+    ofrece a la cola de cada uno, así que el costo de publicar no depende de lo que
+    tarden en leer.
+
+    Atributos:
+        simulador (Simulador): Simulación a transmitir
+        cantidad_procesos (int): Procesos a generar
+        ciclos_por_segundo (Optional[float]): Ritmo de la simulación (None: sin pausas)
+        capacidad_cliente (int): Mensajes que puede acumular cada cliente
+        intervalo_metricas (int): Ciclos entre envíos de las métricas completas
+        clientes (Set[Cliente]): Clientes conectados
+        resultados (Optional[Dict]): Resultados finales, al terminar
+    """
+
+    def __init__(self, simulador: Simulador, cantidad_procesos: int = 15,
+                 ciclos_por_segundo: Optional[float] = None, capacidad_cliente: int = 256,
+                 intervalo_metricas: int = 10):
+        if capacidad_cliente < 2:
+            # Al final hace falta lugar para una instantánea y el mensaje de cierre
+            raise ValueError(f"La capacidad por cliente debe ser al menos 2: {capacidad_cliente}")
+        self.simulador = simulador
+        self.cantidad_procesos = cantidad_procesos
+        self.ciclos_por_segundo = ciclos_por_segundo
+        self.capacidad_cliente = capacidad_cliente
+        self.intervalo_metricas = intervalo_metricas
+        self.clientes: Set[Cliente] = set()
+        self.resultados: Optional[Dict] = None
+        self._transiciones: List[list] = []
+        self._servidores: List[asyncio.AbstractServer] = []
+        self._tareas: Set[asyncio.Task] = set()
+        self._final: Optional[Mensaje] = None
+        simulador.planificador.suscribir_transiciones(self._registrar_transicion)
+
+    def _registrar_transicion(self, ciclo: int, proceso: Proceso, anterior: Optional[EstadoProceso],
+                              nuevo: EstadoProceso):
+        self._transiciones.append([proceso.id, anterior.value if anterior else None, nuevo.value])
+
+    async def iniciar(self, puerto_http: Optional[int] = None, ruta_socket: Optional[str] = None,
+                      anfitrion: str = "127.0.0.1"):
+        """Empieza a aceptar clientes por HTTP/WebSockets y/o por un socket Unix"""
+        if puerto_http is not None:
+            self._servidores.append(await asyncio.start_server(self._atender_http, anfitrion, puerto_http))
+        if ruta_socket is not None:
+            self._servidores.append(await asyncio.start_unix_server(self._atender_socket, ruta_socket))
+
+    @property
+    def puertos(self) -> List[int]:
+        """Puertos TCP en los que escucha (útil con puerto 0)"""
+        return [socket.getsockname()[1] for servidor in self._servidores for socket in servidor.sockets
+                if isinstance(socket.getsockname(), tuple)]
+
+    async def ejecutar(self) -> Dict:
+        """
+        Ejecuta la simulación completa publicando un delta por ciclo.
+
+        Returns:
+            Dict: Resultados finales de la simulación
+        """
+        simulador = self.simulador
+        simulador.iniciar(self.cantidad_procesos)
+        bucle = asyncio.get_running_loop()
+        inicio = bucle.time()
+        for numero in range(1, simulador.ciclos + 1):
+            estadisticas = simulador.avanzar_ciclo()
+            self._publicar(self._delta(estadisticas))
+            if self.ciclos_por_segundo:
+                await asyncio.sleep(max(0.0, inicio + numero / self.ciclos_por_segundo - bucle.time()))
+            else:
+                # Ceder el control para que los clientes escriban
+                await asyncio.sleep(0)
+        if simulador.registro is not None:
+            simulador.registro.vaciar()
+
+        resultados = simulador.obtener_resultados_finales()
+        self.resultados = {
+            'ciclos_ejecutados': resultados['ciclos_ejecutados'],
+            'procesos_terminados': resultados['procesos_terminados'],
+            'procesos_pendientes': resultados['procesos_pendientes'],
+            'estadisticas_finales': resultados['estadisticas_finales'],
+            'metricas': resultados['metricas'],
+        }
+        self._final = Mensaje({'tipo': 'fin', 'resultados': self.resultados}, final=True)
+        instantanea: Optional[Mensaje] = None
+
+        def obtener_instantanea() -> Mensaje:
+            nonlocal instantanea
+            if instantanea is None:
+                instantanea = Mensaje(self._instantanea())
+            return instantanea
+
+        for cliente in list(self.clientes):
+            cliente.finalizar(self._final, obtener_instantanea)
+        return self.resultados
+
+    async def cerrar(self):
+        """Deja de aceptar clientes y espera a que terminen los envíos pendientes"""
+        for servidor in self._servidores:
+            servidor.close()
+            await servidor.wait_closed()
+        if self._tareas:
+            await asyncio.gather(*self._tareas, return_exceptions=True)
+
+    def _delta(self, estadisticas: Dict) -> Dict:
+        delta = {
+            'tipo': 'delta',
+            'ciclo': self.simulador.ciclo_actual,
+            'transiciones': self._transiciones,
+            'estadisticas': estadisticas,
+        }
+        self._transiciones = []
+        if self.simulador.ciclo_actual % self.intervalo_metricas == 0:
+            delta['metricas'] = self.simulador.metricas.resumen()
+        return delta
+
+    def _instantanea(self) -> Dict:
+        planificador = self.simulador.planificador
+        procesos = []
+        for nombre, procesos_cola in planificador.obtener_estado_actual().items():
+            if nombre != 'terminados':
+                procesos.extend([proceso.id, proceso.estado.value] for proceso in procesos_cola)
+        return {
+            'tipo': 'instantanea',
+            'ciclo': self.simulador.ciclo_actual,
+            'procesos': procesos,
+            'terminados': planificador.estadisticas['procesos_completados'],
+            'estadisticas': planificador.obtener_estadisticas(),
+            'metricas': self.simulador.metricas.resumen(),
+        }
+
+    def _publicar(self, contenido: Dict):
+        """Ofrece un delta a todos los clientes; los desincronizados reciben una instantánea"""
+        if not self.clientes:
+            return
+        delta = Mensaje(contenido)
+        instantanea = None
+        for cliente in self.clientes:
+            if not cliente.desincronizado:
+                cliente.ofrecer(delta)
+            elif cliente.cola.full():
+                cliente.descartados += 1
+            else:
+                if instantanea is None:
+                    instantanea = Mensaje(self._instantanea())
+                cliente.desincronizado = not cliente.ofrecer(instantanea)
+
+    async def _conectar(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter, formato: str):
+        """Registra un cliente, le envía una instantánea y atiende su conexión hasta que termina"""
+        cliente = Cliente(escritor, formato, self.capacidad_cliente)
+        cliente.ofrecer(self._final or Mensaje(self._instantanea()))
+        self.clientes.add(cliente)
+        tarea = asyncio.current_task()
+        self._tareas.add(tarea)
+        escribir = asyncio.ensure_future(self._escribir(cliente))
+        leer = asyncio.ensure_future(self._leer_websocket(lector) if formato == WEBSOCKET else lector.read())
+        try:
+            await asyncio.wait({escribir, leer}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self.clientes.discard(cliente)
+            for pendiente in (escribir, leer):
+                pendiente.cancel()
+            await asyncio.gather(escribir, leer, return_exceptions=True)
+            escritor.close()
+            self._tareas.discard(tarea)
+
+    async def _escribir(self, cliente: Cliente):
+        while True:
+            mensaje = await cliente.cola.get()
+            cliente.escritor.write(mensaje.enmarcado(cliente.formato))
+            await cliente.escritor.drain()
+            cliente.enviados += 1
+            if mensaje.final:
+                return
+
+    async def _leer_websocket(self, lector: asyncio.StreamReader):
+        """Lee (y descarta) las tramas del cliente hasta que cierra la conexión"""
+        while True:
+            cabecera = await lector.readexactly(2)
+            codigo, longitud = cabecera[0] & 0x0F, cabecera[1] & 0x7F
+            if longitud == 126:
+                longitud = struct.unpack("!H", await lector.readexactly(2))[0]
+            elif longitud == 127:
+                longitud = struct.unpack("!Q", await lector.readexactly(8))[0]
+            if cabecera[1] & 0x80:
+                await lector.readexactly(4)  # Máscara
+            await lector.readexactly(longitud)
+            if codigo == 0x8:
+                return
+
+    async def _atender_socket(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        await self._conectar(lector, escritor, LINEAS)
+
+    async def _atender_http(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        try:
+            peticion = await lector.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            escritor.close()
+            return
+        lineas = peticion.decode("latin-1").split("\r\n")
+        partes = lineas[0].split()
+        ruta = partes[1] if len(partes) > 1 else ""
+        cabeceras = {}
+        for linea in lineas[1:]:
+            if ":" in linea:
+                nombre, valor = linea.split(":", 1)
+                cabeceras[nombre.strip().lower()] = valor.strip()
+
+        if ruta == "/ws" and cabeceras.get("upgrade", "").lower() == "websocket" and "sec-websocket-key" in cabeceras:
+            aceptar = base64.b64encode(hashlib.sha1(cabeceras["sec-websocket-key"].encode() + GUID_WEBSOCKET).digest())
+            escritor.write(b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                           b"Sec-WebSocket-Accept: " + aceptar + b"\r\n\r\n")
+            await self._conectar(lector, escritor, WEBSOCKET)
+        elif ruta == "/stream":
+            escritor.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                           b"Transfer-Encoding: chunked\r\nCache-Control: no-cache\r\nConnection: close\r\n\r\n")
+            await self._conectar(lector, escritor, CHUNKED)
+        else:
+            escritor.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            await escritor.drain()
+            escritor.close()
+
+class EspejoEstado:
+    """
+    Estado de la simulación reconstruido del lado del cliente a partir de los mensajes.
+
+    Atributos:
+        ciclo (int): Último ciclo recibido
+        estados (Dict[int, str]): Estado de cada proceso no terminado, por id
+        terminados (int): Procesos terminados
+        estadisticas (Dict): Últimas estadísticas recibidas
+        metricas (Optional[Dict]): Últimas métricas completas recibidas
+        resultados (Optional[Dict]): Resultados finales, cuando termina la simulación
+    """
+
+    def __init__(self):
+        self.ciclo = 0
+        self.estados: Dict[int, str] = {}
+        self.terminados = 0
+        self.estadisticas: Dict = {}
+        self.metricas: Optional[Dict] = None
+        self.resultados: Optional[Dict] = None
+
+    def aplicar(self, mensaje: Dict):
+        """Actualiza el estado con una instantánea, un delta o el mensaje final"""
+        tipo = mensaje['tipo']
+        if tipo == 'fin':
+            self.resultados = mensaje['resultados']
+            return
+        self.ciclo = mensaje['ciclo']
+        self.estadisticas = mensaje['estadisticas']
+        self.metricas = mensaje.get('metricas', self.metricas)
+        if tipo == 'instantanea':
+            self.estados = {pid: estado for pid, estado in mensaje['procesos']}
+            self.terminados = mensaje['terminados']
+            return
+        for pid, _, estado in mensaje['transiciones']:
+            if estado == EstadoProceso.TERMINADO.value:
+                self.estados.pop(pid, None)
+                self.terminados += 1
+            else:
+                self.estados[pid] = estado
+
+async def leer_socket(ruta_socket: str) -> AsyncIterator[Dict]:
+    """Se conecta al socket Unix del servidor y produce cada mensaje hasta el final"""
+    lector, escritor = await asyncio.open_unix_connection(ruta_socket)
+    try:
+        async for linea in lector:
+            mensaje = json.loads(linea)
+            yield mensaje
+            if mensaje['tipo'] == 'fin':
+                return
+    finally:
+        escritor.close()
+
+async def servir(simulador: Simulador, cantidad_procesos: int, puerto_http: Optional[int] = None,
+                 ruta_socket: Optional[str] = None, ciclos_por_segundo: Optional[float] = None,
+                 esperar_clientes: int = 0, **opciones) -> Dict:
+    """
+    Levanta el servidor, espera a `esperar_clientes` clientes, transmite la simulación
+    completa y cierra.
+
+    Returns:
+        Dict: Resultados finales
+    """
+    servidor = ServidorSimulacion(simulador, cantidad_procesos, ciclos_por_segundo, **opciones)
+    await servidor.iniciar(puerto_http, ruta_socket)
+    while len(servidor.clientes) < esperar_clientes:
+        await asyncio.sleep(0.05)
+    resultados = await servidor.ejecutar()
+    await servidor.cerrar()
+    return resultados
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Transmite una simulación en vivo")
+    parser.add_argument("--quantum", type=int, default=2)
+    parser.add_argument("--ciclos", type=int, default=1000)
+    parser.add_argument("--cantidad-procesos", type=int, default=50)
+    parser.add_argument("--semilla", type=int)
+    parser.add_argument("--motor", choices=Simulador.MOTORES, default="ticks")
+    parser.add_argument("--puerto", type=int, help="Puerto HTTP (/stream y /ws)")
+    parser.add_argument("--socket", help="Ruta del socket Unix")
+    parser.add_argument("--ciclos-por-segundo", type=float, default=10)
+    parser.add_argument("--esperar", type=int, default=0, help="Clientes a esperar antes de empezar")
+    parser.add_argument("--capacidad-cliente", type=int, default=256)
+    argumentos = parser.parse_args(argv)
+    if argumentos.puerto is None and argumentos.socket is None:
+        parser.error("Indique --puerto, --socket o ambos")
+
+    simulador = Simulador(quantum=argumentos.quantum, ciclos=argumentos.ciclos, semilla=argumentos.semilla,
+                          motor=argumentos.motor, mostrar_swapping=False)
+    resultados = asyncio.run(servir(simulador, argumentos.cantidad_procesos, argumentos.puerto,
+                                    argumentos.socket, argumentos.ciclos_por_segundo, argumentos.esperar,
+                                    capacidad_cliente=argumentos.capacidad_cliente))
+    print(json.dumps(resultados['estadisticas_finales'], indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,19 @@
-import random
-from typing import List, Dict
-from proceso import Proceso
+import bisect
+import math
+from collections import deque
+from typing import Callable, Deque, Iterable, Iterator, List, Dict, Optional, Sequence
+from proceso import Proceso, EstadoProceso
+from tabla_procesos import TablaProcesos
 from planificador import PlanificadorProcesos
+from planificador_eventos import PlanificadorEventos
+from planificador_multinucleo import PlanificadorMultinucleo
+from distribuciones import FuenteAleatoria
+from dispositivos_io import DispositivoIO
+from memoria import GestorMemoria
+from historial import RegistroTransiciones, HistorialEstados
+from carga import Llegada
+from metricas import MetricasIncrementales
+from politicas import PoliticaPlanificacion
 
 class Simulador:
     """
@@ -12,71 +24,356 @@ class Simulador:
         planificador (PlanificadorProcesos): Instancia del planificador de procesos
         ciclos (int): Número total de ciclos de simulación
         ciclo_actual (int): Ciclo actual de la simulación
-        historial_estados (List[Dict]): Historial de estados del sistema
-        historial_estadisticas (List[Dict]): Historial de estadísticas
-        procesos_pendientes (List[Proceso]): Lista de procesos pendientes de admisión
+        historial (bool): Si es False no se guarda el historial: no hay registro de
+            transiciones y de las estadísticas sólo se conservan las del último ciclo
+        historial_estados (Optional[HistorialEstados]): Historial de estados del sistema,
+            reconstruido bajo demanda desde el registro de transiciones (None sin historial)
+        historial_estadisticas (List[Dict]): Historial de estadísticas de cada ciclo ejecutado
+            (sin historial, sólo las del último)
+        registro (Optional[RegistroTransiciones]): Registro en disco de las transiciones de
+            estado (None sin historial)
+        procesos (Dict[int, Proceso]): Todos los procesos generados, por id (sin los
+            terminados si no se conservan)
+        conservar_terminados (bool): Si es False los procesos terminados se descartan en
+            cuanto terminan (sus tiempos ya quedaron en `metricas`), así que una carga
+            larga corre en memoria constante
+        metricas (MetricasIncrementales): Conteo por estado y percentiles de los tiempos,
+            actualizados en cada transición
+        procesos_pendientes (Deque[Proceso]): Procesos generados pendientes de admisión
+            (vacía con una carga: sus procesos se crean recién al llegar)
+        carga (Optional[Iterable[Llegada]]): Fuente de los procesos y sus llegadas (ver
+            carga.py), o None para generarlos al iniciar y admitirlos con `probabilidad_admision`
         probabilidad_admision (float): Probabilidad de admitir un nuevo proceso (30%)
         probabilidad_suspension (float): Probabilidad de suspender un proceso (40%)
+        semilla (Optional[int]): Semilla del generador aleatorio para reproducir una corrida
+        aleatorio (FuenteAleatoria): Fuente de todas las decisiones aleatorias de la simulación
+        motor (str): "ticks" ejecuta todos los ciclos; "eventos" salta los ciclos ociosos
+        nucleos (int): Número de CPU simuladas
+        mostrar_swapping (bool): Si es True imprime cada suspensión y reanudación
+        tabla (Optional[TablaProcesos]): Tabla por columnas donde se guardan los procesos,
+            o None si cada proceso es un objeto Proceso
     """
     
-    def __init__(self, quantum: int = 2, ciclos: int = 100):
+    MOTORES = ("ticks", "eventos")
+    REPRESENTACIONES = ("objetos", "tabla")
+    
+    def __init__(self, quantum: int = 2, ciclos: int = 100, semilla: Optional[int] = None,
+                 motor: str = "ticks", mostrar_swapping: bool = True,
+                 representacion: str = "objetos", ruta_historial: Optional[str] = None,
+                 intervalo_claves: int = 1000, aleatorio: Optional[FuenteAleatoria] = None,
+                 nucleos: int = 1, dispositivos_io: Optional[Sequence[DispositivoIO]] = None,
+                 memoria: Optional[GestorMemoria] = None, carga: Optional[Iterable[Llegada]] = None,
+                 politica: Optional[PoliticaPlanificacion] = None, conservar_terminados: bool = True,
+                 historial: bool = True):
         """
         Inicializa el simulador.
         
         Args:
             quantum (int): Tiempo máximo de ejecución por proceso
             ciclos (int): Número total de ciclos de simulación
+            semilla (Optional[int]): Semilla del generador aleatorio
+            motor (str): Motor de simulación ("ticks" o "eventos")
+            mostrar_swapping (bool): Imprimir las operaciones de swapping
+            representacion (str): "objetos" (un Proceso por proceso) o "tabla" (TablaProcesos)
+            ruta_historial (Optional[str]): Archivo donde se guarda el registro de transiciones
+                (por defecto, un archivo temporal)
+            intervalo_claves (int): Ciclos entre fotogramas clave del registro
+            aleatorio (Optional[FuenteAleatoria]): Fuente de decisiones aleatorias, por
+                ejemplo para grabar o reproducir una traza; si es None se crea una con `semilla`
+            nucleos (int): Número de CPU; con más de una se usa PlanificadorMultinucleo
+            dispositivos_io (Optional[Sequence[DispositivoIO]]): Dispositivos de I/O (por
+                defecto, un único disco)
+            memoria (Optional[GestorMemoria]): Memoria con capacidad limitada; con ella el
+                swapping lo deciden la falta de marcos y la política de reemplazo
+            carga (Optional[Iterable[Llegada]]): Fuente perezosa de procesos (ver carga.py);
+                si es None se generan todos al iniciar con tiempos uniformes
+            politica (Optional[PoliticaPlanificacion]): Política de planificación (ver
+                politicas.py); Round-Robin si es None. Con varios núcleos sólo Round-Robin
+            conservar_terminados (bool): Guardar los procesos terminados en `procesos` y en
+                la cola de terminados; si es False se descartan al terminar y el historial
+                de estados no los muestra
+            historial (bool): Guardar el historial de estados y de estadísticas; las
+                corridas en lote que sólo usan los resultados finales lo desactivan para
+                no escribir el registro en disco ni guardar un diccionario por ciclo
         """
-        self.planificador = PlanificadorProcesos(quantum)
+        if motor not in self.MOTORES:
+            raise ValueError(f"Motor desconocido: {motor}. Opciones: {', '.join(self.MOTORES)}")
+        if representacion not in self.REPRESENTACIONES:
+            raise ValueError(f"Representación desconocida: {representacion}. "
+                             f"Opciones: {', '.join(self.REPRESENTACIONES)}")
+        self.tabla: Optional[TablaProcesos] = TablaProcesos() if representacion == "tabla" else None
+        self.motor = motor
+        self.semilla = semilla
+        self.mostrar_swapping = mostrar_swapping
+        self.aleatorio = aleatorio if aleatorio is not None else FuenteAleatoria(semilla)
+        self.nucleos = nucleos
+        if nucleos > 1:
+            self.planificador = PlanificadorMultinucleo(quantum, self.aleatorio, nucleos, dispositivos_io, memoria)
+            if politica is not None:
+                self.planificador.politica = politica
+        else:
+            clase_planificador = PlanificadorEventos if motor == "eventos" else PlanificadorProcesos
+            self.planificador = clase_planificador(quantum, self.aleatorio, dispositivos_io, memoria, politica)
         self.ciclos = ciclos
         self.ciclo_actual = 0
-        self.historial_estados: List[Dict] = []
+        self.historial = historial
+        self.registro: Optional[RegistroTransiciones] = None
+        if historial:
+            self.registro = RegistroTransiciones(ruta_historial, intervalo_claves)
+            self.planificador.suscribir_transiciones(self.registro.registrar)
+        self.metricas = MetricasIncrementales()
+        self.planificador.suscribir_transiciones(self.metricas.registrar)
+        self.conservar_terminados = conservar_terminados
+        self.planificador.conservar_terminados = conservar_terminados
+        if not conservar_terminados:
+            self.planificador.suscribir_transiciones(self._descartar_terminado)
+        self.historial_estados = HistorialEstados(self) if historial else None
         self.historial_estadisticas: List[Dict] = []
-        self.procesos_pendientes: List[Proceso] = []
+        self._ciclos_estadisticas: List[int] = []
+        self.procesos: Dict[int, Proceso] = {}
+        self.procesos_pendientes: Deque[Proceso] = deque()
+        self.carga = carga
+        self._llegadas: Optional[Iterator[Llegada]] = None
+        self._llegadas_restantes: Optional[int] = None
+        self._proxima_llegada: Optional[Llegada] = None
+        self._inicio_carga = 0
+        self._ultimo_id = 0
+        self._oyentes_ciclo: List[Callable] = []
         self.probabilidad_admision = 0.3  # 30% de probabilidad de admitir un nuevo proceso
         self.probabilidad_suspension = 0.4  # 40% de probabilidad de suspender un proceso
+        self.proxima_admision = math.inf
+        self.proximo_swapping = math.inf
+    
+    def suscribir_ciclos(self, oyente: Callable):
+        """
+        Registra una función que se llama al terminar cada ciclo ejecutado.
+        
+        La función recibe (ciclo, estadisticas). Con el motor de eventos no se la llama en
+        los ciclos ociosos que se saltan.
+        """
+        self._oyentes_ciclo.append(oyente)
+    
+    def desuscribir_ciclos(self, oyente: Callable):
+        """Deja de notificar a una función registrada con `suscribir_ciclos`"""
+        self._oyentes_ciclo.remove(oyente)
+    
+    def _descartar_terminado(self, ciclo: int, proceso: Proceso, anterior: Optional[EstadoProceso],
+                             estado: EstadoProceso):
+        """Olvida un proceso que terminó (los oyentes anteriores ya registraron sus tiempos)"""
+        if estado == EstadoProceso.TERMINADO:
+            del self.procesos[proceso.id]
+            if self.tabla is not None:
+                self.tabla.liberar(proceso)
+    
+    def _crear_proceso(self, id: int, nombre: str, tiempo_ejecucion: int, prioridad: int) -> Proceso:
+        if self.tabla is not None:
+            return self.tabla.agregar(id, nombre, tiempo_ejecucion, prioridad)
+        return Proceso(
+            id=id,
+            nombre=nombre,
+            tiempo_ejecucion=tiempo_ejecucion,
+            prioridad=prioridad,
+            tiempo_restante=0  # Se inicializa en __post_init__
+        )
     
     def generar_procesos(self, cantidad: int) -> List[Proceso]:
         """Genera una lista de procesos con características aleatorias"""
         procesos = []
         for i in range(cantidad):
-            proceso = Proceso(
-                id=i + 1,
-                nombre=f"Proceso_{i + 1}",
-                tiempo_ejecucion=random.randint(5, 20),
-                prioridad=random.randint(1, 5),
-                tiempo_restante=0  # Se inicializa en __post_init__
-            )
-            procesos.append(proceso)
+            tiempo_ejecucion = self.aleatorio.tiempo_ejecucion()
+            prioridad = self.aleatorio.prioridad()
+            procesos.append(self._crear_proceso(i + 1, f"Proceso_{i + 1}", tiempo_ejecucion, prioridad))
         return procesos
     
-    def simular(self, cantidad_procesos: int = 15) -> Dict:
-        """Ejecuta la simulación completa"""
-        # Generar todos los procesos pero no admitirlos inmediatamente
-        self.procesos_pendientes = self.generar_procesos(cantidad_procesos)
+    def iniciar(self, cantidad_procesos: Optional[int] = None):
+        """
+        Prepara una simulación: genera los procesos y programa los primeros eventos.
         
-        # Ejecutar ciclos de simulación
-        for _ in range(self.ciclos):
-            self.ciclo_actual += 1
-            
-            # Intentar admitir nuevos procesos
-            if self.procesos_pendientes and random.random() < self.probabilidad_admision:
-                proceso = self.procesos_pendientes.pop(0)
-                self.planificador.admitir_proceso(proceso)
-            
-            # Ejecutar ciclo del planificador
-            estadisticas = self.planificador.ejecutar_ciclo()
-            
-            # Registrar estado actual y estadísticas
-            self.historial_estados.append(self.obtener_estado_actual())
+        La admisión y el swapping ocurren en cada ciclo con una probabilidad fija; en lugar
+        de lanzar la moneda ciclo a ciclo se muestrea directamente el ciclo en que ocurren,
+        con la misma distribución, para que ambos motores consuman los mismos números aleatorios.
+        Con una carga no se genera nada por adelantado: cada proceso se crea al llegar.
+        
+        Args:
+            cantidad_procesos (Optional[int]): Procesos a generar (15 si es None), o con una
+                carga, máximo de procesos a tomar de ella (todos si es None)
+        """
+        if self.carga is None:
+            # Generar todos los procesos pero no admitirlos inmediatamente
+            self.procesos_pendientes = deque(self.generar_procesos(15 if cantidad_procesos is None else cantidad_procesos))
+            self.procesos = {proceso.id: proceso for proceso in self.procesos_pendientes}
+            self._programar_admision()
+        else:
+            self.procesos_pendientes = deque()
+            self.procesos = {}
+            self._llegadas = iter(self.carga)
+            self._llegadas_restantes = cantidad_procesos
+            self._inicio_carga = self.ciclo_actual
+            self._ultimo_id = 0
+            self.proxima_admision = math.inf
+            self._programar_llegada()
+        self.proximo_swapping = self.ciclo_actual + self.aleatorio.ciclos_hasta_swapping(self.probabilidad_suspension)
+    
+    def avanzar_ciclo(self) -> Dict:
+        """
+        Ejecuta un ciclo de simulación: admisión, ciclo del planificador y swapping.
+        
+        Returns:
+            Dict: Estadísticas del sistema al terminar el ciclo
+        """
+        self.ciclo_actual += 1
+        
+        # Admitir los procesos que llegan en este ciclo
+        while self.proxima_admision <= self.ciclo_actual:
+            self._admitir_siguiente()
+        
+        # Ejecutar ciclo del planificador
+        estadisticas = self.planificador.ejecutar_ciclo()
+        
+        # Registrar estadísticas (el estado de las colas ya quedó en el registro de transiciones)
+        if self.historial:
             self.historial_estadisticas.append(estadisticas)
-            
-            # Simular swapping con mayor probabilidad
-            if random.random() < self.probabilidad_suspension:
-                self._simular_swapping()
+            self._ciclos_estadisticas.append(self.ciclo_actual)
+        else:
+            self.historial_estadisticas[-1:] = [estadisticas]
+            self._ciclos_estadisticas[-1:] = [self.ciclo_actual]
+        
+        # Simular swapping con mayor probabilidad
+        if self.proximo_swapping <= self.ciclo_actual:
+            self._simular_swapping()
+            self.proximo_swapping = self.ciclo_actual + self.aleatorio.ciclos_hasta_swapping(self.probabilidad_suspension)
+        
+        for oyente in self._oyentes_ciclo:
+            oyente(self.ciclo_actual, estadisticas)
+        
+        return estadisticas
+    
+    def _programar_admision(self):
+        """Muestrea el ciclo de la próxima admisión de un proceso generado"""
+        # Se muestrea aunque no queden procesos, para no alterar la secuencia aleatoria
+        siguiente = self.ciclo_actual + self.aleatorio.ciclos_hasta_admision(self.probabilidad_admision)
+        self.proxima_admision = siguiente if self.procesos_pendientes else math.inf
+    
+    def _programar_llegada(self):
+        """Toma de la carga la próxima llegada y la programa (infinito si no hay más)"""
+        llegada = None
+        if self._llegadas_restantes != 0:
+            llegada = next(self._llegadas, None)
+        if llegada is None:
+            self._proxima_llegada = None
+            self.proxima_admision = math.inf
+            return
+        if self._llegadas_restantes is not None:
+            self._llegadas_restantes -= 1
+        ciclo = self._inicio_carga + llegada.ciclo
+        if ciclo < self.proxima_admision < math.inf:
+            raise ValueError(f"La carga no está ordenada por llegada: ciclo {llegada.ciclo} después de "
+                             f"{self.proxima_admision - self._inicio_carga}")
+        self._proxima_llegada = llegada
+        self.proxima_admision = ciclo
+    
+    def _admitir_siguiente(self):
+        """Admite el próximo proceso que llega y programa la llegada siguiente"""
+        if self.carga is None:
+            self.planificador.admitir_proceso(self.procesos_pendientes.popleft())
+            self._programar_admision()
+            return
+        llegada = self._proxima_llegada
+        self._ultimo_id += 1
+        proceso = self._crear_proceso(self._ultimo_id, llegada.nombre or f"Proceso_{self._ultimo_id}",
+                                      llegada.tiempo_ejecucion, llegada.prioridad)
+        self.procesos[proceso.id] = proceso
+        self.planificador.admitir_proceso(proceso)
+        self._programar_llegada()
+    
+    def simular(self, cantidad_procesos: Optional[int] = None) -> Dict:
+        """Ejecuta la simulación completa (ver `iniciar`)"""
+        self.iniciar(cantidad_procesos)
+        return self.continuar()
+    
+    def continuar(self, hasta: Optional[int] = None) -> Dict:
+        """
+        Ejecuta los ciclos que faltan de una simulación ya iniciada.
+        
+        Detenerse en un ciclo intermedio y continuar después da el mismo resultado que
+        una corrida sin pausas, así que sirve para retomar un punto de control o una
+        bifurcación (ver punto_control.py).
         
+        Args:
+            hasta (Optional[int]): Ciclo en que detenerse (por defecto, `ciclos`)
+        
+        Returns:
+            Dict: Resultados de la simulación hasta el ciclo alcanzado
+        """
+        limite = self.ciclos if hasta is None else min(hasta, self.ciclos)
+        if self.motor == "eventos":
+            self._simular_eventos(limite)
+        else:
+            # Ejecutar ciclos de simulación
+            while self.ciclo_actual < limite:
+                self.avanzar_ciclo()
+        
+        if self.registro is not None:
+            self.registro.vaciar()
         return self.obtener_resultados_finales()
     
+    def cerrar(self):
+        """Cierra el registro de transiciones (si hay historial) y libera su archivo"""
+        if self.registro is not None:
+            self.registro.cerrar()
+    
+    def bifurcar(self) -> "Simulador":
+        """Retorna una copia independiente de la simulación en su estado actual (ver punto_control.bifurcar)"""
+        from punto_control import bifurcar
+        return bifurcar(self)
+    
+    def guardar_punto_control(self, ruta: str, incluir_historial: bool = False):
+        """Guarda el estado completo de la simulación en `ruta` (ver punto_control.guardar)"""
+        from punto_control import guardar
+        guardar(self, ruta, incluir_historial)
+    
+    @staticmethod
+    def cargar_punto_control(ruta: str) -> "Simulador":
+        """Restaura una simulación guardada con guardar_punto_control"""
+        from punto_control import cargar
+        return cargar(ruta)
+    
+    def _simular_eventos(self, limite: int):
+        """
+        Ejecuta la simulación saltando de evento en evento.
+        
+        Sólo se ejecutan los ciclos en los que ocurre algo (admisión, fin del retardo en
+        NUEVO, fin de I/O, swapping o un proceso listo para la CPU); los ciclos ociosos
+        intermedios sólo avanzan el reloj. El historial registra únicamente los ciclos
+        ejecutados, por lo que el costo crece con el número de eventos y no con `ciclos`.
+        El historial de estados sí cubre todos los ciclos: se reconstruye desde el registro.
+        """
+        while self.ciclo_actual < limite:
+            siguiente = min(self.planificador.proximo_ciclo_evento(), self.proxima_admision)
+            
+            # Un swapping sin procesos que mover no cambia nada: sólo se reprograma
+            if self.proximo_swapping < siguiente and self.proximo_swapping <= limite and self._swapping_sin_efecto():
+                self.proximo_swapping += self.aleatorio.ciclos_hasta_swapping(self.probabilidad_suspension)
+                continue
+            siguiente = min(siguiente, self.proximo_swapping)
+            
+            # Saltar los ciclos ociosos hasta el próximo evento (o hasta el final)
+            inactivos = int(min(siguiente, limite + 1)) - self.ciclo_actual - 1
+            if inactivos > 0:
+                self.planificador.avanzar_inactivo(inactivos)
+                self.ciclo_actual += inactivos
+            
+            if self.ciclo_actual < limite:
+                self.avanzar_ciclo()
+    
+    def _swapping_sin_efecto(self) -> bool:
+        """Indica si no hay procesos que el swapping pueda suspender o reanudar"""
+        planificador = self.planificador
+        if planificador.memoria is not None:
+            return not (planificador.cola_listo_suspendido or planificador.cola_esperando_suspendido)
+        return not (planificador.cola_listos or planificador.cola_esperando or
+                    planificador.cola_listo_suspendido or planificador.cola_esperando_suspendido)
+    
     def _simular_swapping(self):
         """
         Simula el swapping de procesos entre memoria principal y secundaria.
@@ -86,63 +383,107 @@ class Simulador:
         2. Reanuda procesos de LISTO_SUSPENDIDO a LISTO
         3. Suspende procesos de ESPERANDO a ESPERANDO_SUSPENDIDO
         4. Reanuda procesos de ESPERANDO_SUSPENDIDO a ESPERANDO
+        
+        Con memoria limitada no se suspende al azar: se intenta reanudar el primer proceso
+        de cada cola de suspendidos y la política de reemplazo elige a quién expulsar.
         """
+        if self.planificador.memoria is not None:
+            self._reanudar_suspendidos()
+            return
+        
         # Suspender proceso aleatorio de la cola de listos
-        if not self.planificador.cola_listos.empty() and random.random() < self.probabilidad_suspension:
-            proceso = self.planificador.cola_listos.get()
+        if self.planificador.cola_listos and self.aleatorio.decision_swapping(self.probabilidad_suspension):
+            proceso = self.planificador.cola_listos.primero()
             self.planificador.suspender_proceso(proceso)
-            print(f"Proceso {proceso.id} suspendido desde LISTO")
+            if self.mostrar_swapping:
+                print(f"Proceso {proceso.id} suspendido desde LISTO")
         
         # Reanudar proceso aleatorio suspendido
-        if not self.planificador.cola_listo_suspendido.empty() and random.random() < 0.3:
-            proceso = self.planificador.cola_listo_suspendido.get()
+        if self.planificador.cola_listo_suspendido and self.aleatorio.decision_swapping(0.3):
+            proceso = self.planificador.cola_listo_suspendido.primero()
             self.planificador.reanudar_proceso(proceso)
-            print(f"Proceso {proceso.id} reanudado desde LISTO_SUSPENDIDO")
+            if self.mostrar_swapping:
+                print(f"Proceso {proceso.id} reanudado desde LISTO_SUSPENDIDO")
         
         # Suspender proceso aleatorio de la cola de esperando
-        if not self.planificador.cola_esperando.empty() and random.random() < self.probabilidad_suspension:
-            proceso = self.planificador.cola_esperando.get()
+        if self.planificador.cola_esperando and self.aleatorio.decision_swapping(self.probabilidad_suspension):
+            proceso = self.planificador.cola_esperando.primero()
             self.planificador.suspender_proceso(proceso)
-            print(f"Proceso {proceso.id} suspendido desde ESPERANDO")
+            if self.mostrar_swapping:
+                print(f"Proceso {proceso.id} suspendido desde ESPERANDO")
         
         # Reanudar proceso aleatorio suspendido de esperando
-        if not self.planificador.cola_esperando_suspendido.empty() and random.random() < 0.3:
-            proceso = self.planificador.cola_esperando_suspendido.get()
+        if self.planificador.cola_esperando_suspendido and self.aleatorio.decision_swapping(0.3):
+            proceso = self.planificador.cola_esperando_suspendido.primero()
             self.planificador.reanudar_proceso(proceso)
-            print(f"Proceso {proceso.id} reanudado desde ESPERANDO_SUSPENDIDO")
+            if self.mostrar_swapping:
+                print(f"Proceso {proceso.id} reanudado desde ESPERANDO_SUSPENDIDO")
+    
+    def _reanudar_suspendidos(self):
+        """Reanuda el primer proceso de cada cola de suspendidos, expulsando a otros si hace falta"""
+        for cola, origen in ((self.planificador.cola_listo_suspendido, "LISTO_SUSPENDIDO"),
+                             (self.planificador.cola_esperando_suspendido, "ESPERANDO_SUSPENDIDO")):
+            if cola:
+                proceso = cola.primero()
+                self.planificador.reanudar_proceso(proceso)
+                if self.mostrar_swapping and proceso not in cola:
+                    print(f"Proceso {proceso.id} reanudado desde {origen}")
+    
+    def estadisticas_del_ciclo(self, ciclo: int) -> Dict:
+        """
+        Retorna las estadísticas registradas al terminar un ciclo.
+        
+        Con el motor de eventos los ciclos ociosos no se ejecutan; para ellos se retornan
+        las del último ciclo ejecutado antes (o un diccionario vacío si no hay ninguno).
+        """
+        indice = bisect.bisect_right(self._ciclos_estadisticas, ciclo) - 1
+        return self.historial_estadisticas[indice] if indice >= 0 else {}
     
     def obtener_resultados_finales(self) -> Dict:
         """Retorna los resultados finales de la simulación"""
-        if not self.historial_estadisticas:
+        if self.ciclo_actual == 0:
             return {}
         
-        ultimas_estadisticas = self.historial_estadisticas[-1]
+        # Con el motor de eventos los últimos ciclos pueden no estar en el historial
+        ultimas_estadisticas = self.planificador.obtener_estadisticas()
+        metricas = self.metricas
         return {
             'estadisticas_finales': ultimas_estadisticas,
             'ciclos_ejecutados': self.ciclo_actual,
-            'procesos_terminados': len(self.planificador.cola_terminados),
+            'procesos_terminados': metricas.completados,
             'procesos_pendientes': (
-                self.planificador.cola_listos.qsize() +
-                self.planificador.cola_esperando.qsize() +
-                self.planificador.cola_listo_suspendido.qsize() +
-                self.planificador.cola_esperando_suspendido.qsize()
+                metricas.cantidad(EstadoProceso.LISTO) +
+                metricas.cantidad(EstadoProceso.ESPERANDO) +
+                metricas.cantidad(EstadoProceso.LISTO_SUSPENDIDO) +
+                metricas.cantidad(EstadoProceso.ESPERANDO_SUSPENDIDO)
             ),
             'historial_estados': self.historial_estados,
-            'historial_estadisticas': self.historial_estadisticas
+            'historial_estadisticas': self.historial_estadisticas,
+            'metricas': self.metricas.resumen(),
+            'dispositivos_io': self.planificador.io.obtener_estadisticas(self.planificador.ciclo_actual),
+            **({'memoria': self.planificador.memoria.obtener_estadisticas()}
+               if self.planificador.memoria is not None else {}),
+            **({'nucleos': self.planificador.obtener_estadisticas_nucleos()} if self.nucleos > 1 else {})
         }
     
-    def obtener_estado_actual(self) -> Dict:
+    def obtener_estado_actual(self, instantanea: bool = False) -> Dict:
         """
         Retorna el estado actual del sistema.
         
+        Args:
+            instantanea (bool): Si es True las colas se copian (para guardarlas en el
+                historial); si es False son vistas de sólo lectura que no copian nada
+        
         Returns:
             Dict: Estado actual que incluye:
                 - ciclo_actual: Número del ciclo actual
                 - estado_sistema: Estado de todas las colas de procesos
                 - estadisticas: Estadísticas actuales del sistema
+                - metricas: Métricas incrementales (el objeto, no una copia)
         """
         return {
             'ciclo_actual': self.ciclo_actual,
-            'estado_sistema': self.planificador.obtener_estado_actual(),
-            'estadisticas': self.planificador.obtener_estadisticas()
+            'estado_sistema': self.planificador.obtener_estado_actual(instantanea),
+            'estadisticas': self.planificador.obtener_estadisticas(),
+            'metricas': self.metricas
         } 
\ No newline at end of file
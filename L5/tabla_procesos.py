@@ -0,0 +1,236 @@
+from array import array
+from typing import Dict, List
+from proceso import Proceso, EstadoProceso, CODIGO_ESTADO
+
+# Valor que representa None en las columnas opcionales
+SIN_VALOR = -1
+
+ESTADOS = list(EstadoProceso)
+
+_TIEMPOS_ESTADO_INICIALES = array('q', [0] * len(ESTADOS))
+
+def _columna(nombre: str) -> property:
+    """Crea una propiedad que lee y escribe la columna `nombre` de la fila de la vista"""
+    def obtener(self):
+        return getattr(self._tabla, nombre)[self._fila]
+
+    def asignar(self, valor):
+        getattr(self._tabla, nombre)[self._fila] = valor
+
+    return property(obtener, asignar)
+
+def _columna_opcional(nombre: str) -> property:
+    """Como _columna, pero traduce SIN_VALOR a None y viceversa"""
+    def obtener(self):
+        valor = getattr(self._tabla, nombre)[self._fila]
+        return None if valor == SIN_VALOR else valor
+
+    def asignar(self, valor):
+        getattr(self._tabla, nombre)[self._fila] = SIN_VALOR if valor is None else valor
+
+    return property(obtener, asignar)
+
+class ProcesoTabla:
+    """
+    Vista de un proceso almacenado en una fila de TablaProcesos.
+
+    Tiene los mismos atributos y métodos que Proceso, así que el planificador y el
+    simulador la usan sin distinguirla; cada atributo se lee y escribe directamente en
+    las columnas de la tabla. Sólo guarda la tabla y el número de fila.
+    """
+    __slots__ = ("_tabla", "_fila")
+
+    def __init__(self, tabla: "TablaProcesos", fila: int):
+        self._tabla = tabla
+        self._fila = fila
+
+    id = _columna("ids")
+    tiempo_ejecucion = _columna("tiempos_ejecucion")
+    prioridad = _columna("prioridades")
+    tiempo_restante = _columna("tiempos_restantes")
+    tiempo_creacion = _columna("tiempos_creacion")
+    tiempo_espera = _columna("tiempos_espera")
+    tiempo_respuesta = _columna_opcional("tiempos_respuesta")
+    tiempo_finalizacion = _columna_opcional("tiempos_finalizacion")
+    ciclo_fin_io = _columna_opcional("ciclos_fin_io")
+    ciclo_estado = _columna("ciclos_estado")
+    tiempo_swap = _columna("tiempos_swap")
+
+    @property
+    def tiempos_estado(self) -> List[int]:
+        inicio = self._fila * len(ESTADOS)
+        return self._tabla.tiempos_estado[inicio:inicio + len(ESTADOS)].tolist()
+
+    def _sumar_tiempo_estado(self, codigo: int, ciclos: int):
+        self._tabla.tiempos_estado[self._fila * len(ESTADOS) + codigo] += ciclos
+
+    @property
+    def nombre(self) -> str:
+        return self._tabla.nombre(self._fila)
+
+    @property
+    def estado(self) -> EstadoProceso:
+        return ESTADOS[self._tabla.estados[self._fila]]
+
+    @estado.setter
+    def estado(self, estado: EstadoProceso):
+        self._tabla.estados[self._fila] = CODIGO_ESTADO[estado]
+
+    # El comportamiento es el mismo que el de Proceso
+    ejecutar = Proceso.ejecutar
+    necesita_io = Proceso.necesita_io
+    completado = Proceso.completado
+    actualizar_tiempo_espera = Proceso.actualizar_tiempo_espera
+    cambiar_estado = Proceso.cambiar_estado
+    _ciclos_en_estado_actual = Proceso._ciclos_en_estado_actual
+    tiempo_espera_hasta = Proceso.tiempo_espera_hasta
+    tiempo_en_estado = Proceso.tiempo_en_estado
+    calcular_tiempo_respuesta = Proceso.calcular_tiempo_respuesta
+    calcular_tiempo_finalizacion = Proceso.calcular_tiempo_finalizacion
+    __str__ = Proceso.__str__
+
+    def __reduce__(self):
+        return ProcesoTabla, (self._tabla, self._fila)
+
+    def __eq__(self, otro) -> bool:
+        return isinstance(otro, ProcesoTabla) and otro._tabla is self._tabla and otro._fila == self._fila
+
+    def __hash__(self) -> int:
+        return hash((id(self._tabla), self._fila))
+
+    def __repr__(self) -> str:
+        return f"ProcesoTabla(fila={self._fila}, id={self.id}, estado={self.estado.value})"
+
+class TablaProcesos:
+    """
+    Almacena los procesos por columnas (struct-of-arrays) en arreglos tipados.
+
+    Cada proceso ocupa una fila; en lugar de un objeto con su propio diccionario por
+    proceso, cada atributo es un `array` de enteros de tamaño fijo. Los atributos
+    opcionales usan SIN_VALOR para representar None y el estado se guarda como su código
+    entero (CODIGO_ESTADO). Los nombres sólo se guardan si no siguen el patrón
+    "Proceso_<id>".
+
+    Atributos:
+        ids, tiempos_ejecucion, prioridades, tiempos_restantes, estados, tiempos_creacion,
+        tiempos_espera, tiempos_respuesta, tiempos_finalizacion, ciclos_fin_io,
+        ciclos_estado, tiempos_swap (array): Una columna por atributo de Proceso
+        tiempos_estado (array): Ciclos acumulados en cada estado, una fila de
+            len(EstadoProceso) valores consecutivos por proceso
+        libres (List[int]): Filas liberadas que `agregar` vuelve a usar antes de crecer
+    """
+
+    # Columna -> código de tipo de array
+    COLUMNAS = {
+        'ids': 'q',
+        'tiempos_ejecucion': 'l',
+        'prioridades': 'q',
+        'tiempos_restantes': 'l',
+        'estados': 'b',
+        'tiempos_creacion': 'q',
+        'tiempos_espera': 'q',
+        'tiempos_respuesta': 'q',
+        'tiempos_finalizacion': 'q',
+        # El fin de I/O puede ser infinito si la probabilidad de completarlo es 0
+        'ciclos_fin_io': 'd',
+        'ciclos_estado': 'q',
+        'tiempos_swap': 'q',
+    }
+
+    def __init__(self):
+        for columna, tipo in self.COLUMNAS.items():
+            setattr(self, columna, array(tipo))
+        self.tiempos_estado = array('q')
+        self._nombres: Dict[int, str] = {}
+        self.libres: List[int] = []
+
+    def agregar(self, id: int, nombre: str, tiempo_ejecucion: int, prioridad: int) -> ProcesoTabla:
+        """
+        Agrega un proceso en estado NUEVO y retorna su vista.
+
+        Args:
+            id (int): Identificador del proceso
+            nombre (str): Nombre del proceso
+            tiempo_ejecucion (int): Tiempo total de CPU que necesita
+            prioridad (int): Prioridad del proceso
+        """
+        if self.libres:
+            return self._reutilizar(self.libres.pop(), id, nombre, tiempo_ejecucion, prioridad)
+        fila = len(self.ids)
+        self.ids.append(id)
+        self.tiempos_ejecucion.append(tiempo_ejecucion)
+        self.prioridades.append(prioridad)
+        self.tiempos_restantes.append(tiempo_ejecucion)
+        self.estados.append(CODIGO_ESTADO[EstadoProceso.NUEVO])
+        self.tiempos_creacion.append(0)
+        self.tiempos_espera.append(0)
+        self.tiempos_respuesta.append(SIN_VALOR)
+        self.tiempos_finalizacion.append(SIN_VALOR)
+        self.ciclos_fin_io.append(SIN_VALOR)
+        self.ciclos_estado.append(0)
+        self.tiempos_swap.append(0)
+        self.tiempos_estado.extend(_TIEMPOS_ESTADO_INICIALES)
+        if nombre != f"Proceso_{id}":
+            self._nombres[fila] = nombre
+        return ProcesoTabla(self, fila)
+
+    def _reutilizar(self, fila: int, id: int, nombre: str, tiempo_ejecucion: int, prioridad: int) -> ProcesoTabla:
+        """Escribe un proceso nuevo sobre una fila liberada"""
+        self.ids[fila] = id
+        self.tiempos_ejecucion[fila] = tiempo_ejecucion
+        self.prioridades[fila] = prioridad
+        self.tiempos_restantes[fila] = tiempo_ejecucion
+        self.estados[fila] = CODIGO_ESTADO[EstadoProceso.NUEVO]
+        self.tiempos_creacion[fila] = 0
+        self.tiempos_espera[fila] = 0
+        self.tiempos_respuesta[fila] = SIN_VALOR
+        self.tiempos_finalizacion[fila] = SIN_VALOR
+        self.ciclos_fin_io[fila] = SIN_VALOR
+        self.ciclos_estado[fila] = 0
+        self.tiempos_swap[fila] = 0
+        inicio = fila * len(ESTADOS)
+        self.tiempos_estado[inicio:inicio + len(ESTADOS)] = _TIEMPOS_ESTADO_INICIALES
+        self._nombres.pop(fila, None)
+        if nombre != f"Proceso_{id}":
+            self._nombres[fila] = nombre
+        return ProcesoTabla(self, fila)
+
+    def liberar(self, proceso: ProcesoTabla):
+        """
+        Marca la fila de un proceso que ya no se usa para que la ocupe el próximo `agregar`.
+
+        Los datos siguen en la fila hasta entonces; las vistas que queden del proceso
+        pasan a ver al proceso nuevo.
+        """
+        self.libres.append(proceso._fila)
+
+    def proceso(self, fila: int) -> ProcesoTabla:
+        """Retorna la vista de la fila indicada"""
+        if not 0 <= fila < len(self.ids):
+            raise IndexError(f"Fila fuera de rango: {fila}")
+        return ProcesoTabla(self, fila)
+
+    def nombre(self, fila: int) -> str:
+        """Retorna el nombre del proceso de una fila"""
+        return self._nombres.get(fila) or f"Proceso_{self.ids[fila]}"
+
+    def bytes_por_proceso(self) -> int:
+        """Bytes que ocupa una fila en las columnas (sin contar nombres ni vistas)"""
+        return (sum(getattr(self, columna).itemsize for columna in self.COLUMNAS)
+                + self.tiempos_estado.itemsize * len(ESTADOS))
+
+    def como_numpy(self) -> Dict:
+        """
+        Retorna las columnas como arreglos NumPy que comparten memoria con la tabla.
+
+        `tiempos_estado` tiene forma (procesos, len(EstadoProceso)). Mientras existan estos
+        arreglos la tabla no puede crecer (el buffer está exportado).
+        """
+        import numpy as np
+        columnas = {columna: np.frombuffer(getattr(self, columna), dtype=getattr(self, columna).typecode)
+                    for columna in self.COLUMNAS}
+        columnas['tiempos_estado'] = np.frombuffer(self.tiempos_estado, dtype='q').reshape(-1, len(ESTADOS))
+        return columnas
+
+    def __len__(self) -> int:
+        return len(self.ids)
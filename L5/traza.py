@@ -0,0 +1,112 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import List, Optional
+from distribuciones import FuenteAleatoria, NOMBRES_DECISIONES
+
+MAGICO = b"TRAZAPR1"
+# Cabecera: mágico, orden de bytes de los valores (b'<' o b'>'), cantidad de series
+CABECERA = struct.Struct("<8sc3xI")
+# Por cada serie: índice del primer valor (en valores de 8 bytes desde el inicio) y cantidad
+SERIE = struct.Struct("<QQ")
+
+ORDEN_BYTES = b"<" if sys.byteorder == "little" else b">"
+
+class GrabadorTraza(FuenteAleatoria):
+    """
+    Fuente aleatoria que además graba cada decisión para reproducirla después.
+
+    Las decisiones se guardan en una serie por tipo (llegadas, ráfagas, I/O, swapping...),
+    no en una sola secuencia: un planificador distinto que consuma las decisiones en otro
+    orden recibe igualmente la misma carga de trabajo.
+
+    Atributos:
+        series (List[array]): Valores generados de cada tipo de decisión
+    """
+
+    def __init__(self, semilla: Optional[int] = None):
+        """
+        Args:
+            semilla (Optional[int]): Semilla del generador
+        """
+        super().__init__(semilla)
+        self.series: List[array] = [array('d') for _ in NOMBRES_DECISIONES]
+
+    def _valor(self, tipo: int, parametro: float) -> float:
+        valor = super()._valor(tipo, parametro)
+        self.series[tipo].append(valor)
+        return valor
+
+    def guardar(self, ruta: str):
+        """
+        Escribe la traza en un archivo.
+
+        El formato es una cabecera con la posición y la cantidad de cada serie seguida de
+        los valores como float64, contiguos y alineados a 8 bytes, para que
+        ReproductorTraza los lea directamente del mmap sin interpretarlos.
+        """
+        with open(ruta, "wb") as archivo:
+            archivo.write(CABECERA.pack(MAGICO, ORDEN_BYTES, len(self.series)))
+            posicion = (CABECERA.size + SERIE.size * len(self.series)) // 8
+            for serie in self.series:
+                archivo.write(SERIE.pack(posicion, len(serie)))
+                posicion += len(serie)
+            for serie in self.series:
+                serie.tofile(archivo)
+
+    def __len__(self) -> int:
+        return sum(len(serie) for serie in self.series)
+
+class ReproductorTraza(FuenteAleatoria):
+    """
+    Fuente aleatoria que reproduce las decisiones grabadas por GrabadorTraza.
+
+    El archivo se abre con mmap y se ve como un arreglo de float64, así que cada decisión
+    es sólo una lectura indexada: reproducir una traza de millones de eventos no la
+    interpreta ni la carga en memoria por adelantado. Los parámetros de probabilidad que
+    recibe cada decisión se ignoran; vale lo que se grabó.
+    """
+
+    def __init__(self, ruta: str):
+        """
+        Args:
+            ruta (str): Archivo escrito por GrabadorTraza.guardar
+        """
+        self.generador = None
+        with open(ruta, "rb") as archivo:
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magico, orden, cantidad = CABECERA.unpack_from(self._mapa, 0)
+        if magico != MAGICO:
+            raise ValueError(f"{ruta} no es una traza de simulación")
+        if orden != ORDEN_BYTES:
+            raise ValueError(f"{ruta} se grabó con otro orden de bytes")
+        if cantidad > len(NOMBRES_DECISIONES):
+            raise ValueError(f"{ruta} tiene {cantidad} series; se esperaban {len(NOMBRES_DECISIONES)}")
+
+        self._valores = memoryview(self._mapa).cast('d')
+        self._siguiente: List[int] = []
+        self._fin: List[int] = []
+        for tipo in range(cantidad):
+            inicio, longitud = SERIE.unpack_from(self._mapa, CABECERA.size + tipo * SERIE.size)
+            self._siguiente.append(inicio)
+            self._fin.append(inicio + longitud)
+        # Las trazas anteriores a un tipo de decisión nuevo no tienen su serie: queda vacía
+        for _ in range(cantidad, len(NOMBRES_DECISIONES)):
+            self._siguiente.append(0)
+            self._fin.append(0)
+
+    def _valor(self, tipo: int, parametro: float) -> float:
+        indice = self._siguiente[tipo]
+        if indice >= self._fin[tipo]:
+            raise EOFError(f"La traza no tiene más decisiones de tipo '{NOMBRES_DECISIONES[tipo]}'")
+        self._siguiente[tipo] = indice + 1
+        return self._valores[indice]
+
+    def restantes(self, tipo: int) -> int:
+        """Retorna cuántas decisiones de un tipo quedan por reproducir"""
+        return self._fin[tipo] - self._siguiente[tipo]
+
+    def cerrar(self):
+        self._valores.release()
+        self._mapa.close()